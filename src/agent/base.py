@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Iterable, List, Optional, Sequence
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.memory import BaseMemory, ConversationBufferMemory
 from src.tools import BaseTool
@@ -24,6 +25,7 @@ class BaseAgent:
         tools: Optional[Iterable[BaseTool]] = None,
         client: Optional[OpenAI] = None,
         auto_load_env: bool = True,
+        async_client: Optional[AsyncOpenAI] = None,
     ) -> None:
         if auto_load_env:
             load_dotenv(override=True)
@@ -39,6 +41,8 @@ class BaseAgent:
         self.memory = memory or ConversationBufferMemory()
         self.tools = list(tools or [])
         self.client = client or OpenAI(api_key=api_key)  # type: ignore[arg-type]
+        # Used by acomplete(); without it acomplete runs complete() in a thread
+        self.async_client = async_client
         self.logger = get_logger(self.__class__.__name__)
 
     def _build_messages(self, user_prompt: str) -> List[dict]:
@@ -48,28 +52,57 @@ class BaseAgent:
         messages.append(Message(Role.USER.value, user_prompt))
         return [message.to_dict() for message in messages]
 
-    def complete(
+    def _request(
         self,
         prompt: str,
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        extra_messages: Optional[Sequence[Message]] = None,
-    ) -> str:
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        extra_messages: Optional[Sequence[Message]],
+    ) -> dict:
         messages_dicts = self._build_messages(prompt)
         if extra_messages:
             messages_dicts.extend([message.to_dict() for message in extra_messages])
-        response = self.client.chat.completions.create(
+        return dict(
             model=self.model,
             messages=messages_dicts,
             temperature=temperature if temperature is not None else self.temperature,
             max_tokens=max_tokens if max_tokens is not None else self.max_output_tokens,
         )
+
+    def _record(self, prompt: str, response) -> str:
         content = response.choices[0].message.content or ""
         if self.memory:
             self.memory.add(Message(Role.USER.value, prompt))
             self.memory.add(Message(Role.ASSISTANT.value, content))
         return content.strip()
 
+    def complete(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        extra_messages: Optional[Sequence[Message]] = None,
+    ) -> str:
+        request = self._request(prompt, temperature, max_tokens, extra_messages)
+        response = self.client.chat.completions.create(**request)
+        return self._record(prompt, response)
+
+    async def acomplete(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        extra_messages: Optional[Sequence[Message]] = None,
+    ) -> str:
+        """Async complete(): native async I/O when an async_client is set."""
+        if self.async_client is None:
+            return await asyncio.to_thread(
+                self.complete, prompt, temperature, max_tokens, extra_messages
+            )
+        request = self._request(prompt, temperature, max_tokens, extra_messages)
+        response = await self.async_client.chat.completions.create(**request)
+        return self._record(prompt, response)
+
     def run_step(self, user_message: str) -> str:
         """Convenience helper for interactive sessions."""
         self.logger.info("User: %s", user_message)
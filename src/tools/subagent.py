@@ -90,7 +90,7 @@ class SubagentTool(BaseTool):
     def reset(self) -> None:
         """Reset the subagent's memory for a fresh start."""
         if hasattr(self.agent, 'memory') and self.agent.memory:
-            self.agent.memory.clear()
+            self.agent.memory.reset()
 
 
 class SubagentManager:
@@ -118,6 +118,7 @@ class SubagentManager:
         client: Optional["OpenAI"] = None,  # type: ignore[name-defined]
         default_model: str = "gpt-4o-mini",
         default_temperature: float = 0.3,
+        async_client: Optional["AsyncOpenAI"] = None,  # type: ignore[name-defined]
     ) -> None:
         """
         Initialize the SubagentManager.
@@ -126,8 +127,11 @@ class SubagentManager:
             client: OpenAI client to share across subagents (saves resources).
             default_model: Default model for spawned subagents.
             default_temperature: Default temperature for spawned subagents.
+            async_client: AsyncOpenAI client shared by spawned subagents for
+                         BaseAgent.acomplete (optional).
         """
         self.client = client
+        self.async_client = async_client
         self.default_model = default_model
         self.default_temperature = default_temperature
         self._active_subagents: dict[str, "BaseAgent"] = {}
@@ -177,6 +181,7 @@ Guidelines:
             temperature=temperature or self.default_temperature,
             client=self.client,
             auto_load_env=self.client is None,  # Only load env if no client
+            async_client=self.async_client,
         )
         
         self._active_subagents[role] = subagent
@@ -200,7 +205,7 @@ Guidelines:
             subagent = self._active_subagents.pop(role)
             # Clear memory to free resources
             if hasattr(subagent, 'memory') and subagent.memory:
-                subagent.memory.clear()
+                subagent.memory.reset()
             return True
         return False
     
@@ -4,5 +4,6 @@ Shared utilities for agents, memory, and tools.
 
 from .messages import Message, Role
 from .logging import get_logger
+from .lazy import lazy_import
 
-__all__ = ["Message", "Role", "get_logger"]
+__all__ = ["Message", "Role", "get_logger", "lazy_import"]
@@ -0,0 +1,28 @@
+"""
+Deferred module imports for entry-point scripts.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return module `name`, executing it only on first attribute access.
+
+    Lets a script keep module-level names for heavy dependencies (the
+    OpenAI SDK, ...) without paying for them on paths that never use them,
+    such as `--help`. Already-imported modules are returned as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -522,6 +522,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     
     elif name == "calculate_position_size" and ADVANCED_FEATURES:
         from risk_management import PositionSizer
+        from serialization import round_floats
         
         portfolio_value = arguments.get("portfolio_value", 0)
         risk_pct = arguments.get("risk_per_trade_pct", 1.0)
@@ -532,7 +533,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             return [TextContent(type="text", text=json.dumps({"error": "Missing required parameters"}))]
         
         result = PositionSizer.fixed_fractional(portfolio_value, risk_pct, entry_price, stop_loss)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=json.dumps(round_floats(result, 2), indent=2))]
 
     else:
         return [
@@ -233,8 +233,8 @@ class BacktestResult:
             },
             "risk": {
                 "max_drawdown_pct": round(self.max_drawdown, 2),
-                "sharpe_ratio": self.sharpe_ratio,
-                "sortino_ratio": self.sortino_ratio,
+                "sharpe_ratio": round(self.sharpe_ratio, 2),
+                "sortino_ratio": round(self.sortino_ratio, 2),
                 "calmar_ratio": round(self.calmar_ratio, 2)
             },
             "costs": {
@@ -736,14 +736,14 @@ class WalkForwardAnalyzer:
                 "fold": i + 1,
                 "in_sample": {
                     "return": in_sample_result.total_return,
-                    "sharpe": in_sample_result.sharpe_ratio,
+                    "sharpe": round(in_sample_result.sharpe_ratio, 2),
                     "max_drawdown": in_sample_result.max_drawdown,
                     "win_rate": in_sample_result.win_rate,
                     "num_trades": in_sample_result.num_trades
                 },
                 "out_sample": {
                     "return": out_sample_result.total_return,
-                    "sharpe": out_sample_result.sharpe_ratio,
+                    "sharpe": round(out_sample_result.sharpe_ratio, 2),
                     "max_drawdown": out_sample_result.max_drawdown,
                     "win_rate": out_sample_result.win_rate,
                     "num_trades": out_sample_result.num_trades
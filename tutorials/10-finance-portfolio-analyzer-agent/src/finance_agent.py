@@ -18,7 +18,7 @@ from anthropic import Anthropic
 
 from agent_memory import MemoryMixin
 from portfolio import Portfolio, Position, AssetClass
-from technical_indicators import TechnicalIndicators, generate_technical_report, Signal
+from technical_indicators import TechnicalIndicators, OHLCVBatch, generate_technical_report, Signal
 from risk_management import (
     RiskProfile, RiskLevel, PositionSizer, VaRCalculator,
     RiskAdjustedMetrics, DrawdownAnalyzer, generate_risk_report
@@ -30,6 +30,7 @@ from trading_strategy import (
 )
 from backtesting import Backtester, BacktestConfig, generate_sample_price_data
 from alerts import AlertManager, AlertCondition, AlertPriority, WatchlistManager
+from serialization import dumps_rounded
 
 
 class FinanceAgent(MemoryMixin):
@@ -183,12 +184,8 @@ You have access to real-time market data, technical analysis tools, and backtest
         if len(bars) < 50:
             return {"error": "Insufficient data for analysis"}
         
-        closes = [b.close for b in bars]
-        highs = [b.high for b in bars]
-        lows = [b.low for b in bars]
-        volumes = [b.volume for b in bars]
-        
-        return generate_technical_report(closes, highs, lows, volumes)
+        batch = OHLCVBatch.from_records(bars)
+        return generate_technical_report(batch.close, batch.high, batch.low, batch.volume)
 
     def get_trading_signals(self, symbol: str) -> Dict:
         """Get trading signals from all strategies"""
@@ -470,7 +467,7 @@ You have access to real-time market data, technical analysis tools, and backtest
                     tool_results.append({
                         "type": "tool_result",
                         "tool_use_id": block.id,
-                        "content": json.dumps(result)
+                        "content": dumps_rounded(result)
                     })
             
             # Add assistant message and tool results
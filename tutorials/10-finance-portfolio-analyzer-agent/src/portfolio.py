@@ -9,13 +9,21 @@ Provides comprehensive portfolio analysis including:
 - Rebalancing recommendations
 """
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Literal, NamedTuple, Optional, Tuple
 from enum import Enum
 import math
 
+import numpy as np
+
+from precision import precision_dtype
+from serialization import dumps_rounded
+
+# Annualization constants for daily return series
+_TRADING_DAYS = 252
+_SQRT_252 = math.sqrt(_TRADING_DAYS)
+
 
 class AssetClass(Enum):
     """Asset class categories"""
@@ -44,7 +52,19 @@ class Sector(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Fields that feed the cached market value / cost basis of a Position
+_MARKET_VALUE_INPUTS = frozenset({"shares", "current_price"})
+_COST_BASIS_INPUTS = frozenset({"shares", "purchase_price"})
+
+# Integer codes for enum categories, so aggregation can use np.bincount
+_ASSET_CLASS_CODES = {ac: i for i, ac in enumerate(AssetClass)}
+_ASSET_CLASS_VALUES = tuple(ac.value for ac in AssetClass)
+_SECTOR_CODES = {sector: i for i, sector in enumerate(Sector)}
+_SECTOR_CODES[None] = _SECTOR_CODES[Sector.OTHER]
+_SECTOR_VALUES = tuple(sector.value for sector in Sector)
+
+
+@dataclass(slots=True)
 class Position:
     """Represents a single portfolio position"""
     symbol: str
@@ -55,16 +75,47 @@ class Position:
     asset_class: AssetClass = AssetClass.EQUITY
     sector: Optional[Sector] = None
     name: Optional[str] = None
+    _mv: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _cb: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _ac_code: int = field(init=False, repr=False, compare=False)
+    _sec_code: int = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Invalidate cached derived values when their inputs change
+        if name in _MARKET_VALUE_INPUTS:
+            object.__setattr__(self, "_mv", None)
+        if name in _COST_BASIS_INPUTS:
+            object.__setattr__(self, "_cb", None)
+        # Keep the category codes in sync with the enums
+        if name == "asset_class":
+            object.__setattr__(
+                self, "_ac_code",
+                _ASSET_CLASS_CODES.get(value, _ASSET_CLASS_CODES[AssetClass.OTHER])
+            )
+        elif name == "sector":
+            object.__setattr__(
+                self, "_sec_code",
+                _SECTOR_CODES.get(value, _SECTOR_CODES[Sector.OTHER])
+            )
     
     @property
     def market_value(self) -> float:
         """Calculate current market value"""
-        return self.shares * self.current_price
+        mv = self._mv
+        if mv is None:
+            mv = self.shares * self.current_price
+            object.__setattr__(self, "_mv", mv)
+        return mv
     
     @property
     def cost_basis(self) -> float:
         """Calculate total cost basis"""
-        return self.shares * self.purchase_price
+        cb = self._cb
+        if cb is None:
+            cb = self.shares * self.purchase_price
+            object.__setattr__(self, "_cb", cb)
+        return cb
     
     @property
     def unrealized_gain(self) -> float:
@@ -87,6 +138,9 @@ class Position:
     
     def to_dict(self) -> Dict:
         """Convert position to dictionary"""
+        market_value = self.market_value
+        cost_basis = self.cost_basis
+        unrealized_gain = market_value - cost_basis
         return {
             "symbol": self.symbol,
             "name": self.name,
@@ -96,13 +150,44 @@ class Position:
             "purchase_date": self.purchase_date.isoformat() if self.purchase_date else None,
             "asset_class": self.asset_class.value,
             "sector": self.sector.value if self.sector else None,
-            "market_value": self.market_value,
-            "cost_basis": self.cost_basis,
-            "unrealized_gain": self.unrealized_gain,
-            "unrealized_gain_percent": self.unrealized_gain_percent
+            "market_value": market_value,
+            "cost_basis": cost_basis,
+            "unrealized_gain": unrealized_gain,
+            "unrealized_gain_percent": (
+                (unrealized_gain / cost_basis) * 100 if cost_basis != 0 else 0.0
+            )
         }
 
 
+def _allocation_from_codes(
+    codes: np.ndarray,
+    values: np.ndarray,
+    labels: Tuple[str, ...],
+    total: float
+) -> Dict[str, float]:
+    """Sum values per category code and return percentages keyed by label"""
+    if codes.size == 0:
+        return {}
+    sums = np.bincount(codes, weights=values, minlength=len(labels))
+    # Report categories in order of first appearance, like a dict accumulator
+    present, first_seen = np.unique(codes, return_index=True)
+    return {
+        labels[code]: float(sums[code] / total) * 100
+        for code in present[np.argsort(first_seen)]
+    }
+
+
+class PortfolioAggregate(NamedTuple):
+    """Single-pass portfolio aggregates (weights are percentages)"""
+    total_mv: float
+    total_cost: float
+    by_class: Dict[str, float]
+    by_sector: Dict[str, float]
+    hhi: float
+    top5: float
+    max_w: float
+
+
 @dataclass
 class Portfolio:
     """Portfolio management and analysis"""
@@ -111,41 +196,92 @@ class Portfolio:
     cash_balance: float = 0.0
     benchmark_symbol: str = "SPY"
     created_at: datetime = field(default_factory=datetime.now)
+    _symbol_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._rebuild_index()
+    
+    def _rebuild_index(self, start: int = 0) -> None:
+        """Rebuild the symbol -> list index mapping from position `start` onwards"""
+        if start == 0:
+            self._symbol_index = {}
+        for i in range(start, len(self.positions)):
+            self._symbol_index[self.positions[i].symbol.upper()] = i
     
     def add_position(self, position: Position) -> None:
         """Add a new position to the portfolio"""
         # Check if position already exists
         existing = self.get_position(position.symbol)
         if existing:
-            # Average into existing position
-            total_shares = existing.shares + position.shares
-            avg_price = (existing.cost_basis + position.cost_basis) / total_shares
-            existing.shares = total_shares
-            existing.purchase_price = avg_price
-            existing.current_price = position.current_price
+            self._merge_position(existing, position)
         else:
             self.positions.append(position)
+            self._symbol_index[position.symbol.upper()] = len(self.positions) - 1
+    
+    def bulk_add(
+        self,
+        positions: Iterable[Position],
+        merge_duplicates: bool = True
+    ) -> None:
+        """
+        Add many positions at once
+        
+        Args:
+            positions: Positions to add
+            merge_duplicates: Average lots into existing positions with the
+                same symbol. Pass False when the symbols are known to be
+                unique to extend the list and index in a single step.
+        
+        Raises:
+            ValueError: If merge_duplicates is False and a symbol repeats or
+                is already held; nothing is added in that case
+        """
+        if merge_duplicates:
+            for position in positions:
+                self.add_position(position)
+            return
+        
+        positions = list(positions)
+        symbols = {position.symbol.upper() for position in positions}
+        if len(symbols) != len(positions) or not symbols.isdisjoint(self._symbol_index):
+            raise ValueError(
+                "bulk_add(merge_duplicates=False) needs symbols that are unique "
+                "and not already in the portfolio"
+            )
+        start = len(self.positions)
+        self.positions.extend(positions)
+        self._rebuild_index(start)
+    
+    @staticmethod
+    def _merge_position(existing: Position, position: Position) -> None:
+        """Average a new lot into an existing position in place"""
+        total_shares = existing.shares + position.shares
+        avg_price = (existing.cost_basis + position.cost_basis) / total_shares
+        existing.shares = total_shares
+        existing.purchase_price = avg_price
+        existing.current_price = position.current_price
     
     def remove_position(self, symbol: str) -> Optional[Position]:
         """Remove a position from the portfolio"""
-        position = self.get_position(symbol)
-        if position:
-            self.positions.remove(position)
-            return position
-        return None
+        idx = self._symbol_index.pop(symbol.upper(), None)
+        if idx is None:
+            return None
+        position = self.positions.pop(idx)
+        # Only the entries after the removed one shift down
+        self._rebuild_index(idx)
+        return position
     
     def get_position(self, symbol: str) -> Optional[Position]:
         """Get a position by symbol"""
-        for position in self.positions:
-            if position.symbol.upper() == symbol.upper():
-                return position
-        return None
+        idx = self._symbol_index.get(symbol.upper())
+        return self.positions[idx] if idx is not None else None
     
     def update_prices(self, prices: Dict[str, float]) -> None:
         """Update current prices for all positions"""
-        for position in self.positions:
-            if position.symbol in prices:
-                position.current_price = prices[position.symbol]
+        for symbol, price in prices.items():
+            idx = self._symbol_index.get(symbol.upper())
+            if idx is not None:
+                self.positions[idx].current_price = price
     
     @property
     def total_market_value(self) -> float:
@@ -169,80 +305,102 @@ class Portfolio:
             return 0.0
         return (self.total_unrealized_gain / self.total_cost_basis) * 100
     
-    def get_allocation_by_asset_class(self) -> Dict[str, float]:
+    def _aggregate(self) -> "PortfolioAggregate":
+        """
+        Walk the positions once and collect every aggregate needed by the
+        allocation and concentration reports.
+        """
+        n = len(self.positions)
+        mv = np.empty(n)
+        cb = np.empty(n)
+        class_codes = np.empty(n, dtype=np.intp)
+        sector_codes = np.empty(n, dtype=np.intp)
+        for i, position in enumerate(self.positions):
+            mv[i] = position.market_value
+            cb[i] = position.cost_basis
+            class_codes[i] = position._ac_code
+            sector_codes[i] = position._sec_code
+        
+        cash = self.cash_balance
+        total_mv = float(mv.sum()) + cash
+        total_cost = float(cb.sum())
+        if total_mv == 0:
+            return PortfolioAggregate(0.0, total_cost, {}, {}, 0.0, 0.0, 0.0)
+        
+        by_class = _allocation_from_codes(class_codes, mv, _ASSET_CLASS_VALUES, total_mv)
+        by_sector = _allocation_from_codes(sector_codes, mv, _SECTOR_VALUES, total_mv)
+        
+        # Cash counts as a holding for allocation and concentration purposes
+        if cash > 0:
+            by_class["cash"] = (cash / total_mv) * 100
+            mv = np.append(mv, cash)
+        
+        # HHI on fraction-of-1 weights, scaled once to the 0-10000 range
+        frac = mv / total_mv
+        top = np.partition(frac, frac.size - 5)[-5:] if frac.size > 5 else frac
+        
+        return PortfolioAggregate(
+            total_mv=total_mv,
+            total_cost=total_cost,
+            by_class=by_class,
+            by_sector=by_sector,
+            hhi=float(frac @ frac) * 10000,
+            top5=float(top.sum()) * 100,
+            max_w=float(top.max()) * 100 if top.size else 0.0
+        )
+    
+    def get_allocation_by_asset_class(
+        self,
+        agg: Optional["PortfolioAggregate"] = None
+    ) -> Dict[str, float]:
         """Calculate allocation by asset class"""
-        allocation = {}
-        total = self.total_market_value
-        
-        if total == 0:
-            return allocation
-        
-        for position in self.positions:
-            asset_class = position.asset_class.value
-            if asset_class not in allocation:
-                allocation[asset_class] = 0.0
-            allocation[asset_class] += position.market_value
-        
-        # Add cash
-        if self.cash_balance > 0:
-            allocation["cash"] = self.cash_balance
-        
-        # Convert to percentages
-        return {k: (v / total) * 100 for k, v in allocation.items()}
+        return (agg or self._aggregate()).by_class
     
-    def get_allocation_by_sector(self) -> Dict[str, float]:
+    def get_allocation_by_sector(
+        self,
+        agg: Optional["PortfolioAggregate"] = None
+    ) -> Dict[str, float]:
         """Calculate allocation by sector"""
-        allocation = {}
-        total = self.total_market_value
+        return (agg or self._aggregate()).by_sector
+    
+    def _weights_frac(self) -> np.ndarray:
+        """Weight of each position (then cash, if any) as a fraction of 1"""
+        values = [p.market_value for p in self.positions]
+        if self.cash_balance > 0:
+            values.append(self.cash_balance)
         
+        total = self.total_market_value
         if total == 0:
-            return allocation
-        
-        for position in self.positions:
-            sector = position.sector.value if position.sector else "other"
-            if sector not in allocation:
-                allocation[sector] = 0.0
-            allocation[sector] += position.market_value
-        
-        return {k: (v / total) * 100 for k, v in allocation.items()}
+            return np.zeros(0)
+        return np.asarray(values) / total
     
     def get_position_weights(self) -> Dict[str, float]:
         """Calculate weight of each position"""
-        total = self.total_market_value
-        if total == 0:
+        frac = self._weights_frac()
+        if frac.size == 0:
             return {}
         
-        weights = {}
-        for position in self.positions:
-            weights[position.symbol] = (position.market_value / total) * 100
-        
+        symbols = [p.symbol for p in self.positions]
         if self.cash_balance > 0:
-            weights["CASH"] = (self.cash_balance / total) * 100
+            symbols.append("CASH")
         
-        return weights
+        return dict(zip(symbols, (frac * 100).tolist()))
     
-    def calculate_concentration_risk(self) -> Dict[str, any]:
+    def calculate_concentration_risk(
+        self,
+        agg: Optional["PortfolioAggregate"] = None
+    ) -> Dict[str, any]:
         """Calculate portfolio concentration risk metrics"""
-        weights = self.get_position_weights()
+        agg = agg or self._aggregate()
         
-        if not weights:
+        if agg.total_mv == 0:
             return {"hhi": 0, "max_position": 0, "top_5_concentration": 0}
         
-        # Herfindahl-Hirschman Index (HHI)
-        hhi = sum((w ** 2) for w in weights.values())
-        
-        # Maximum single position weight
-        max_weight = max(weights.values()) if weights else 0
-        
-        # Top 5 concentration
-        sorted_weights = sorted(weights.values(), reverse=True)
-        top_5 = sum(sorted_weights[:5])
-        
         return {
-            "hhi": round(hhi, 2),
-            "hhi_interpretation": self._interpret_hhi(hhi),
-            "max_position_weight": round(max_weight, 2),
-            "top_5_concentration": round(top_5, 2),
+            "hhi": agg.hhi,
+            "hhi_interpretation": self._interpret_hhi(agg.hhi),
+            "max_position_weight": agg.max_w,
+            "top_5_concentration": agg.top5,
             "number_of_positions": len(self.positions)
         }
     
@@ -285,11 +443,11 @@ class Portfolio:
                 
                 recommendations.append({
                     "asset_class": asset_class,
-                    "current_allocation": round(current_pct, 2),
+                    "current_allocation": current_pct,
                     "target_allocation": target_pct,
-                    "difference": round(diff, 2),
+                    "difference": diff,
                     "action": "buy" if diff > 0 else "sell",
-                    "amount": round(abs(change_amount), 2)
+                    "amount": abs(change_amount)
                 })
         
         return recommendations
@@ -297,7 +455,9 @@ class Portfolio:
     def calculate_portfolio_metrics(
         self,
         returns: Optional[List[float]] = None,
-        risk_free_rate: float = 0.05
+        risk_free_rate: float = 0.05,
+        precision: Literal["fp32", "fp64"] = "fp32",
+        agg: Optional["PortfolioAggregate"] = None
     ) -> Dict[str, float]:
         """
         Calculate key portfolio metrics
@@ -305,44 +465,55 @@ class Portfolio:
         Args:
             returns: Historical daily returns (if available)
             risk_free_rate: Annual risk-free rate (default 5%)
+            precision: Float width for the return-series math ("fp32" is
+                faster on long series, "fp64" is exact to double precision)
+            agg: Precomputed aggregate from _aggregate() (computed if omitted)
         
         Returns:
             Dictionary of portfolio metrics
         """
+        agg = agg or self._aggregate()
+        total_gain = agg.total_mv - self.cash_balance - agg.total_cost
+        
         metrics = {
-            "total_value": round(self.total_market_value, 2),
-            "total_cost": round(self.total_cost_basis, 2),
-            "total_gain": round(self.total_unrealized_gain, 2),
-            "total_return_pct": round(self.total_unrealized_gain_percent, 2),
+            "total_value": agg.total_mv,
+            "total_cost": agg.total_cost,
+            "total_gain": total_gain,
+            "total_return_pct": (
+                (total_gain / agg.total_cost) * 100 if agg.total_cost != 0 else 0.0
+            ),
             "num_positions": len(self.positions),
-            "cash_balance": round(self.cash_balance, 2)
+            "cash_balance": self.cash_balance
         }
         
-        if returns and len(returns) > 1:
+        if returns is not None and len(returns) > 1:
+            series = np.asarray(returns, dtype=precision_dtype(precision))
+            
             # Calculate volatility (annualized)
-            mean_return = sum(returns) / len(returns)
-            variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-            daily_volatility = math.sqrt(variance)
-            annual_volatility = daily_volatility * math.sqrt(252)
+            mean_return = float(series.mean())
+            daily_volatility = float(series.std())
+            annual_volatility = daily_volatility * _SQRT_252
             
             # Calculate Sharpe Ratio
-            annual_return = mean_return * 252
+            annual_return = mean_return * _TRADING_DAYS
             sharpe_ratio = (annual_return - risk_free_rate) / annual_volatility if annual_volatility > 0 else 0
             
             # Calculate Maximum Drawdown
-            peak = returns[0]
-            max_drawdown = 0
-            for r in returns:
-                if r > peak:
-                    peak = r
-                drawdown = (peak - r) / peak if peak > 0 else 0
-                max_drawdown = max(max_drawdown, drawdown)
+            # NOTE: the series is treated as value levels here, not daily returns
+            running_peak = np.maximum.accumulate(series)
+            positive = running_peak > 0
+            drawdowns = np.where(
+                positive,
+                (running_peak - series) / np.where(positive, running_peak, 1),
+                0
+            )
+            max_drawdown = float(drawdowns.max())
             
             metrics.update({
-                "annual_volatility": round(annual_volatility * 100, 2),
-                "sharpe_ratio": round(sharpe_ratio, 2),
-                "max_drawdown": round(max_drawdown * 100, 2),
-                "daily_var_95": round(mean_return - 1.645 * daily_volatility, 4)
+                "annual_volatility": annual_volatility * 100,
+                "sharpe_ratio": sharpe_ratio,
+                "max_drawdown": max_drawdown * 100,
+                "daily_var_95": mean_return - 1.645 * daily_volatility
             })
         
         return metrics
@@ -364,6 +535,26 @@ class Portfolio:
         )
         return [p.to_dict() for p in sorted_positions[:n]]
     
+    def holding_periods(self, as_of: Optional[datetime] = None) -> np.ndarray:
+        """
+        Holding period in days for every position
+        
+        Args:
+            as_of: Reference date (defaults to now, read once for all positions)
+        
+        Returns:
+            int32 array aligned with positions; -1 where no purchase date is known
+        """
+        now = as_of or datetime.now()
+        return np.fromiter(
+            (
+                (now - p.purchase_date).days if p.purchase_date else -1
+                for p in self.positions
+            ),
+            dtype=np.int32,
+            count=len(self.positions)
+        )
+    
     def get_dividend_summary(self, dividend_yields: Dict[str, float]) -> Dict:
         """
         Calculate dividend income summary
@@ -403,20 +594,21 @@ class Portfolio:
     
     def to_dict(self) -> Dict:
         """Convert portfolio to dictionary"""
+        agg = self._aggregate()
         return {
             "name": self.name,
             "created_at": self.created_at.isoformat(),
             "cash_balance": self.cash_balance,
-            "total_value": self.total_market_value,
+            "total_value": agg.total_mv,
             "positions": [p.to_dict() for p in self.positions],
-            "metrics": self.calculate_portfolio_metrics(),
-            "allocation": self.get_allocation_by_asset_class(),
-            "concentration": self.calculate_concentration_risk()
+            "metrics": self.calculate_portfolio_metrics(agg=agg),
+            "allocation": self.get_allocation_by_asset_class(agg),
+            "concentration": self.calculate_concentration_risk(agg)
         }
     
     def to_json(self, indent: int = 2) -> str:
         """Export portfolio as JSON string"""
-        return json.dumps(self.to_dict(), indent=indent)
+        return dumps_rounded(self.to_dict(), indent=indent)
     
     @classmethod
     def from_csv(cls, filepath: str, name: str = "My Portfolio") -> "Portfolio":
@@ -437,6 +629,9 @@ class Portfolio:
         # Parse header
         header = [h.strip().lower() for h in lines[0].split(',')]
         
+        # Merge duplicate symbols locally, then load the positions in one go
+        merged: Dict[str, Position] = {}
+        
         for line in lines[1:]:
             if not line.strip():
                 continue
@@ -470,7 +665,13 @@ class Portfolio:
                 except ValueError:
                     pass
             
-            portfolio.add_position(position)
+            existing = merged.get(position.symbol)
+            if existing:
+                cls._merge_position(existing, position)
+            else:
+                merged[position.symbol] = position
+        
+        portfolio.bulk_add(merged.values(), merge_duplicates=False)
         
         return portfolio
 
@@ -478,7 +679,8 @@ class Portfolio:
 def analyze_portfolio_comparison(
     portfolio: Portfolio,
     benchmark_returns: List[float],
-    portfolio_returns: List[float]
+    portfolio_returns: List[float],
+    precision: Literal["fp32", "fp64"] = "fp32"
 ) -> Dict:
     """
     Compare portfolio performance against benchmark
@@ -487,42 +689,39 @@ def analyze_portfolio_comparison(
         portfolio: Portfolio to analyze
         benchmark_returns: Daily benchmark returns
         portfolio_returns: Daily portfolio returns
+        precision: Float width of the input series ("fp32" or "fp64")
     
     Returns:
         Comparison metrics
     """
     if len(benchmark_returns) != len(portfolio_returns):
         raise ValueError("Returns series must be same length")
+    if len(benchmark_returns) == 0:
+        raise ValueError("Returns series must not be empty")
     
-    n = len(benchmark_returns)
-    
-    # Calculate beta
-    benchmark_mean = sum(benchmark_returns) / n
-    portfolio_mean = sum(portfolio_returns) / n
+    dtype = precision_dtype(precision)
+    b = np.asarray(benchmark_returns, dtype=dtype)
+    p = np.asarray(portfolio_returns, dtype=dtype)
     
-    covariance = sum(
-        (br - benchmark_mean) * (pr - portfolio_mean)
-        for br, pr in zip(benchmark_returns, portfolio_returns)
-    ) / n
+    # Calculate beta (population covariance matrix gives both variances too)
+    benchmark_mean = float(b.mean())
+    portfolio_mean = float(p.mean())
     
-    benchmark_variance = sum(
-        (br - benchmark_mean) ** 2 for br in benchmark_returns
-    ) / n
+    cov_mat = np.cov(b, p, bias=True)
+    covariance = float(cov_mat[0, 1])
+    benchmark_variance = float(cov_mat[0, 0])
+    portfolio_variance = float(cov_mat[1, 1])
     
     beta = covariance / benchmark_variance if benchmark_variance > 0 else 0
     
     # Calculate alpha (annualized)
-    risk_free_rate = 0.05 / 252  # Daily risk-free rate
+    risk_free_rate = 0.05 / _TRADING_DAYS  # Daily risk-free rate
     alpha = (portfolio_mean - risk_free_rate) - beta * (benchmark_mean - risk_free_rate)
-    annual_alpha = alpha * 252
+    annual_alpha = alpha * _TRADING_DAYS
     
     # Calculate tracking error
-    tracking_diff = [
-        pr - br for pr, br in zip(portfolio_returns, benchmark_returns)
-    ]
-    tracking_error = math.sqrt(
-        sum((td - (sum(tracking_diff) / n)) ** 2 for td in tracking_diff) / n
-    ) * math.sqrt(252)
+    tracking_diff = p - b
+    tracking_error = float(tracking_diff.std()) * _SQRT_252
     
     # Information ratio
     info_ratio = (
@@ -530,15 +729,12 @@ def analyze_portfolio_comparison(
     )
     
     return {
-        "beta": round(beta, 3),
-        "alpha_annual": round(annual_alpha * 100, 2),
-        "tracking_error": round(tracking_error * 100, 2),
-        "information_ratio": round(info_ratio, 2),
-        "correlation": round(
-            covariance / (
-                math.sqrt(benchmark_variance) *
-                math.sqrt(sum((pr - portfolio_mean) ** 2 for pr in portfolio_returns) / n)
-            ) if benchmark_variance > 0 else 0,
-            3
+        "beta": beta,
+        "alpha_annual": annual_alpha * 100,
+        "tracking_error": tracking_error * 100,
+        "information_ratio": info_ratio,
+        "correlation": (
+            covariance / math.sqrt(benchmark_variance * portfolio_variance)
+            if benchmark_variance > 0 and portfolio_variance > 0 else 0
         )
     }
@@ -0,0 +1,22 @@
+"""
+Float Precision Helpers
+
+Return-series math accepts a `precision` argument ("fp32" or "fp64")
+selecting the float width of its working arrays. This module maps those
+names to numpy dtypes so every module validates them the same way.
+"""
+
+import numpy as np
+
+# Precision names accepted by analysis functions
+PRECISION_DTYPES = {"fp32": np.float32, "fp64": np.float64}
+
+
+def precision_dtype(precision: str) -> type:
+    """Map a precision name to the numpy dtype used for return series"""
+    try:
+        return PRECISION_DTYPES[precision]
+    except KeyError:
+        raise ValueError(
+            f"precision must be one of {sorted(PRECISION_DTYPES)}, got {precision!r}"
+        ) from None
@@ -12,10 +12,67 @@ Provides comprehensive risk analysis and management:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
 from enum import Enum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import math
 
+import numpy as np
+
+from jit_compat import NUMBA_AVAILABLE, njit, prange
+from precision import precision_dtype
+from serialization import round_floats
+
+# Annualization constants for daily return series
+_TRADING_DAYS = 252
+_SQRT_252 = math.sqrt(_TRADING_DAYS)
+
+# Decimal places the risk report keeps for the Treynor ratio
+_TREYNOR_DIGITS = 4
+
+# sqrt(days) for holding periods up to a trading year
+_SQRT_DAYS = tuple(math.sqrt(d) for d in range(_TRADING_DAYS + 1))
+
+
+# Coefficients for Acklam's rational approximation of the inverse normal CDF
+_ACKLAM_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+             1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_ACKLAM_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+             6.680131188771972e+01, -1.328068155288572e+01)
+_ACKLAM_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+             -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_ACKLAM_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+             3.754408661907416e+00)
+_ACKLAM_P_LOW = 0.02425
+
+
+@lru_cache(maxsize=32)
+def _z_score(confidence_level: float) -> float:
+    """
+    One-sided z-score for a confidence level (inverse standard normal CDF)
+    
+    Uses Acklam's approximation (relative error < 1.2e-9), so any level in
+    (0, 1) is supported without a SciPy dependency.
+    """
+    p = confidence_level
+    if not 0 < p < 1:
+        raise ValueError(f"confidence_level must be between 0 and 1, got {p}")
+    
+    a, b, c, d = _ACKLAM_A, _ACKLAM_B, _ACKLAM_C, _ACKLAM_D
+    if p < _ACKLAM_P_LOW or p > 1 - _ACKLAM_P_LOW:
+        # Tails
+        q = math.sqrt(-2 * math.log(min(p, 1 - p)))
+        z = ((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]
+        z /= (((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1
+        return z if p < _ACKLAM_P_LOW else -z
+    
+    # Central region
+    q = p - 0.5
+    r = q * q
+    z = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q
+    return z / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+
 
 class RiskLevel(Enum):
     """Risk tolerance levels"""
@@ -26,9 +83,9 @@ class RiskLevel(Enum):
     VERY_HIGH = "very_high"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RiskProfile:
-    """User's risk profile configuration"""
+    """User's risk profile configuration (immutable, so it can be shared)"""
     risk_level: RiskLevel = RiskLevel.MODERATE
     max_position_size_pct: float = 10.0  # Max % of portfolio in single position
     max_portfolio_risk_pct: float = 2.0  # Max % portfolio to risk per trade
@@ -38,15 +95,20 @@ class RiskProfile:
     max_correlation: float = 0.7  # Max correlation between positions
     min_liquidity_ratio: float = 0.1  # Min liquidity (avg volume vs position)
     
-    def to_dict(self) -> Dict:
-        return {
+    @cached_property
+    def as_dict(self) -> Mapping:
+        """Read-only summary, built once per profile"""
+        return MappingProxyType({
             "risk_level": self.risk_level.value,
             "max_position_size_pct": self.max_position_size_pct,
             "max_portfolio_risk_pct": self.max_portfolio_risk_pct,
             "max_drawdown_pct": self.max_drawdown_pct,
             "stop_loss_pct": self.stop_loss_pct,
             "take_profit_pct": self.take_profit_pct
-        }
+        })
+    
+    def to_dict(self) -> Dict:
+        return dict(self.as_dict)
 
 
 @dataclass
@@ -90,17 +152,110 @@ class TakeProfit:
     """Take profit order representation"""
     symbol: str
     entry_price: float
-    target_prices: List[float] = field(default_factory=list)  # Multiple targets
+    target_prices: np.ndarray = field(default_factory=lambda: np.empty(0))  # Multiple targets
     target_percentages: List[float] = field(default_factory=list)  # % to sell at each
     current_price: Optional[float] = None
     
+    def __post_init__(self):
+        # Accept any sequence of targets; keep them as a float64 array
+        self.target_prices = np.asarray(self.target_prices, dtype=np.float64)
+    
     @property
-    def reward_risk_ratios(self) -> List[float]:
+    def reward_risk_ratios(self) -> np.ndarray:
         """Calculate R:R for each target"""
-        return [
-            (target - self.entry_price) / self.entry_price * 100
-            for target in self.target_prices
-        ]
+        return (self.target_prices - self.entry_price) / self.entry_price * 100
+
+
+# Integer codes for StopLoss.stop_type, used by StopLossBook
+_STOP_TYPE_CODES = {"fixed": 0, "trailing": 1, "atr-based": 2}
+_STOP_TRAILING = _STOP_TYPE_CODES["trailing"]
+
+
+@dataclass
+class StopLossBook:
+    """
+    Many stop losses stored column-wise (one NumPy array per field) so a
+    whole portfolio can be updated and checked per tick without a Python
+    loop. Use StopLoss for single-order work and from_list() to batch.
+    """
+    symbols: List[str]
+    entry: np.ndarray
+    stop: np.ndarray
+    trail: np.ndarray  # trailing %, NaN when not set
+    kind: np.ndarray  # stop type codes (int8)
+    current: np.ndarray  # last seen prices, NaN when unknown
+    
+    @classmethod
+    def from_list(cls, stops: List[StopLoss]) -> "StopLossBook":
+        """Build a book from individual StopLoss orders"""
+        return cls(
+            symbols=[s.symbol for s in stops],
+            entry=np.array([s.entry_price for s in stops], dtype=np.float64),
+            stop=np.array([s.stop_price for s in stops], dtype=np.float64),
+            trail=np.array(
+                [np.nan if s.trailing_pct is None else s.trailing_pct for s in stops],
+                dtype=np.float64
+            ),
+            kind=np.array([_STOP_TYPE_CODES.get(s.stop_type, 0) for s in stops], dtype=np.int8),
+            current=np.array(
+                [np.nan if s.current_price is None else s.current_price for s in stops],
+                dtype=np.float64
+            )
+        )
+    
+    @property
+    def risk_pcts(self) -> np.ndarray:
+        """Risk percentage from entry for every stop"""
+        return (self.entry - self.stop) / self.entry * 100
+    
+    def update_all(self, prices: np.ndarray) -> None:
+        """Record new prices for every stop and ratchet trailing stops up (never down)"""
+        prices = np.asarray(prices, dtype=np.float64)
+        # Every stop sees the new price, so triggered_mask() with no argument
+        # checks fixed stops too; only the ratchet is limited to trailing ones
+        np.copyto(self.current, prices)
+        trailing = (self.kind == _STOP_TRAILING) & ~np.isnan(self.trail)
+        new_stop = prices * (1 - self.trail / 100)
+        np.copyto(self.stop, new_stop, where=trailing & (new_stop > self.stop))
+    
+    def triggered_mask(self, prices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Boolean mask of stops hit at `prices` (default: last seen prices)"""
+        prices = self.current if prices is None else np.asarray(prices, dtype=np.float64)
+        return prices <= self.stop
+
+
+@dataclass
+class TakeProfitBook:
+    """
+    Many take-profit orders stored column-wise. Targets are a 2-D array
+    padded with NaN, since orders can have different numbers of targets.
+    """
+    symbols: List[str]
+    entry: np.ndarray
+    targets: np.ndarray
+    
+    @classmethod
+    def from_list(cls, orders: List[TakeProfit]) -> "TakeProfitBook":
+        """Build a book from individual TakeProfit orders"""
+        width = max((len(o.target_prices) for o in orders), default=0)
+        targets = np.full((len(orders), width), np.nan)
+        for i, order in enumerate(orders):
+            targets[i, :len(order.target_prices)] = order.target_prices
+        return cls(
+            symbols=[o.symbol for o in orders],
+            entry=np.array([o.entry_price for o in orders], dtype=np.float64),
+            targets=targets
+        )
+    
+    @property
+    def reward_risk_ratios(self) -> np.ndarray:
+        """R:R (% move to target) for every order and target, NaN where unused"""
+        entry = self.entry[:, None]
+        return (self.targets - entry) / entry * 100
+    
+    def hit_mask(self, prices: np.ndarray) -> np.ndarray:
+        """Boolean (orders x targets) mask of targets reached at `prices`"""
+        return np.asarray(prices, dtype=np.float64)[:, None] >= self.targets
 
 
 class PositionSizer:
@@ -136,11 +291,11 @@ class PositionSizer:
         position_pct = (position_value / portfolio_value) * 100
         
         return {
-            "shares": round(shares, 2),
-            "position_value": round(position_value, 2),
-            "position_pct": round(position_pct, 2),
-            "risk_amount": round(risk_amount, 2),
-            "risk_per_share": round(risk_per_share, 2)
+            "shares": shares,
+            "position_value": position_value,
+            "position_pct": position_pct,
+            "risk_amount": risk_amount,
+            "risk_per_share": risk_per_share
         }
     
     @staticmethod
@@ -176,11 +331,11 @@ class PositionSizer:
         quarter_kelly = kelly_pct / 4
         
         return {
-            "full_kelly_pct": round(kelly_pct * 100, 2),
-            "half_kelly_pct": round(half_kelly * 100, 2),
-            "quarter_kelly_pct": round(quarter_kelly * 100, 2),
-            "win_rate": round(win_rate * 100, 2),
-            "win_loss_ratio": round(win_loss_ratio, 2),
+            "full_kelly_pct": kelly_pct * 100,
+            "half_kelly_pct": half_kelly * 100,
+            "quarter_kelly_pct": quarter_kelly * 100,
+            "win_rate": win_rate * 100,
+            "win_loss_ratio": win_loss_ratio,
             "recommendation": "Use half-Kelly or less for safety"
         }
     
@@ -208,16 +363,17 @@ class PositionSizer:
         stop_distance = atr * atr_multiplier
         stop_price = entry_price - stop_distance
         
-        return {
-            **PositionSizer.fixed_fractional(
-                portfolio_value, risk_per_trade_pct,
-                entry_price, stop_price
-            ),
-            "atr": round(atr, 2),
+        result = PositionSizer.fixed_fractional(
+            portfolio_value, risk_per_trade_pct,
+            entry_price, stop_price
+        )
+        result.update({
+            "atr": atr,
             "atr_multiplier": atr_multiplier,
-            "stop_distance": round(stop_distance, 2),
-            "stop_price": round(stop_price, 2)
-        }
+            "stop_distance": stop_distance,
+            "stop_price": stop_price
+        })
+        return result
     
     @staticmethod
     def volatility_adjusted(
@@ -247,15 +403,36 @@ class PositionSizer:
         position_pct = (position_value / portfolio_value) * 100
         
         return {
-            "shares": round(shares, 2),
-            "position_value": round(position_value, 2),
-            "position_pct": round(position_pct, 2),
+            "shares": shares,
+            "position_value": position_value,
+            "position_pct": position_pct,
             "target_volatility": target_volatility_pct,
             "asset_volatility": asset_volatility_pct,
-            "volatility_ratio": round(target_volatility_pct / asset_volatility_pct, 2)
+            "volatility_ratio": target_volatility_pct / asset_volatility_pct
         }
 
 
+def _tail_var_cvar(
+    returns: np.ndarray,
+    confidence_level: float,
+    overwrite: bool = False
+) -> Tuple[float, float]:
+    """
+    VaR and CVaR (as positive fractions) from a non-empty return sample
+    
+    Only the tail matters, so the sample is partitioned around the quantile
+    instead of sorted; the tail mean does not depend on order within it.
+    With overwrite=True the caller's array is partitioned in place.
+    """
+    index = min(max(int((1 - confidence_level) * returns.size), 0), returns.size - 1)
+    if overwrite:
+        returns.partition(index)
+        partitioned = returns
+    else:
+        partitioned = np.partition(returns, index)
+    return abs(float(partitioned[index])), abs(float(partitioned[:index + 1].mean()))
+
+
 class VaRCalculator:
     """Value at Risk calculations"""
     
@@ -276,24 +453,20 @@ class VaRCalculator:
         Returns:
             VaR metrics
         """
-        if not returns:
+        if len(returns) == 0:
             return {"error": "No returns data provided"}
         
-        sorted_returns = sorted(returns)
-        index = int((1 - confidence_level) * len(sorted_returns))
-        var_pct = abs(sorted_returns[index])
+        var_pct, cvar_pct = _tail_var_cvar(
+            np.asarray(returns, dtype=np.float64), confidence_level
+        )
         var_amount = portfolio_value * var_pct
-        
-        # Expected Shortfall (CVaR)
-        cvar_returns = sorted_returns[:index + 1]
-        cvar_pct = abs(sum(cvar_returns) / len(cvar_returns)) if cvar_returns else 0
         cvar_amount = portfolio_value * cvar_pct
         
         return {
-            "var_pct": round(var_pct * 100, 2),
-            "var_amount": round(var_amount, 2),
-            "cvar_pct": round(cvar_pct * 100, 2),
-            "cvar_amount": round(cvar_amount, 2),
+            "var_pct": var_pct * 100,
+            "var_amount": var_amount,
+            "cvar_pct": cvar_pct * 100,
+            "cvar_amount": cvar_amount,
             "confidence_level": confidence_level * 100,
             "observation_count": len(returns)
         }
@@ -319,20 +492,22 @@ class VaRCalculator:
         Returns:
             VaR metrics
         """
-        # Z-scores for common confidence levels
-        z_scores = {0.90: 1.282, 0.95: 1.645, 0.99: 2.326}
-        z_score = z_scores.get(confidence_level, 1.645)
+        z_score = _z_score(confidence_level)
         
         # Adjust for holding period
-        adjusted_std = std_return * math.sqrt(holding_period_days)
+        if isinstance(holding_period_days, int) and 0 <= holding_period_days <= _TRADING_DAYS:
+            sqrt_days = _SQRT_DAYS[holding_period_days]
+        else:
+            sqrt_days = math.sqrt(holding_period_days)
+        adjusted_std = std_return * sqrt_days
         adjusted_mean = mean_return * holding_period_days
         
         var_pct = z_score * adjusted_std - adjusted_mean
         var_amount = portfolio_value * var_pct
         
         return {
-            "var_pct": round(var_pct * 100, 2),
-            "var_amount": round(var_amount, 2),
+            "var_pct": var_pct * 100,
+            "var_amount": var_amount,
             "confidence_level": confidence_level * 100,
             "holding_period_days": holding_period_days,
             "z_score": z_score
@@ -345,7 +520,8 @@ class VaRCalculator:
         simulations: int = 10000,
         confidence_level: float = 0.95,
         portfolio_value: float = 100000,
-        holding_period_days: int = 1
+        holding_period_days: int = 1,
+        seed: Optional[int] = None
     ) -> Dict[str, float]:
         """
         Monte Carlo VaR simulation
@@ -357,45 +533,88 @@ class VaRCalculator:
             confidence_level: Confidence level
             portfolio_value: Portfolio value
             holding_period_days: Holding period
+            seed: Seed for the simulation; the same seed gives the same
+                result. Defaults to a draw from NumPy's global generator, so
+                np.random.seed() also makes runs repeatable.
         
         Returns:
             VaR metrics from simulation
         """
-        import random
+        if seed is None:
+            seed = int(np.random.randint(0, 2**31 - 1))
         
         # Simulate returns
-        simulated_returns = []
-        for _ in range(simulations):
-            period_return = 0
-            for _ in range(holding_period_days):
-                # Simple normal distribution simulation
-                u1, u2 = random.random(), random.random()
-                z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-                daily_return = mean_return + std_return * z
-                period_return = (1 + period_return) * (1 + daily_return) - 1
-            simulated_returns.append(period_return)
-        
-        # Calculate VaR from simulated distribution
-        sorted_returns = sorted(simulated_returns)
-        index = int((1 - confidence_level) * len(sorted_returns))
-        var_pct = abs(sorted_returns[index])
-        var_amount = portfolio_value * var_pct
+        simulated = _simulate_period_returns(
+            float(mean_return), float(std_return), simulations, holding_period_days, seed
+        )
         
-        # CVaR
-        cvar_returns = sorted_returns[:index + 1]
-        cvar_pct = abs(sum(cvar_returns) / len(cvar_returns))
+        # VaR and CVaR from the simulated distribution (ours, so partition in place)
+        var_pct, cvar_pct = _tail_var_cvar(simulated, confidence_level, overwrite=True)
+        var_amount = portfolio_value * var_pct
         
         return {
-            "var_pct": round(var_pct * 100, 2),
-            "var_amount": round(var_amount, 2),
-            "cvar_pct": round(cvar_pct * 100, 2),
-            "cvar_amount": round(portfolio_value * cvar_pct, 2),
+            "var_pct": var_pct * 100,
+            "var_amount": var_amount,
+            "cvar_pct": cvar_pct * 100,
+            "cvar_amount": portfolio_value * cvar_pct,
             "confidence_level": confidence_level * 100,
             "simulations": simulations,
             "holding_period_days": holding_period_days
         }
 
 
+# Paths simulated per seeded block in _mc_var_kernel
+_MC_BLOCK = 1024
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mc_var_kernel(mean: float, std: float, sims: int, days: int, seed: int) -> np.ndarray:
+    """Simulate compounded holding-period returns from normal daily returns"""
+    out = np.empty(sims)
+    # Each prange thread has its own generator, so a single seed() would not
+    # reach the workers. Reseeding per fixed block makes every path depend
+    # only on the seed, whatever the thread count or scheduling.
+    blocks = (sims + _MC_BLOCK - 1) // _MC_BLOCK
+    for b in prange(blocks):
+        np.random.seed(seed + b)
+        for i in range(b * _MC_BLOCK, min(sims, (b + 1) * _MC_BLOCK)):
+            period = 0.0
+            for _ in range(days):
+                period = (1.0 + period) * (1.0 + mean + std * np.random.randn()) - 1.0
+            out[i] = period
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) now so the first real call isn't slow
+    _mc_var_kernel(0.0, 0.0, 1, 1, 0)
+
+
+def _simulate_period_returns(mean: float, std: float, sims: int, days: int, seed: int) -> np.ndarray:
+    """Simulated holding-period returns, JIT loop if available else NumPy"""
+    if NUMBA_AVAILABLE:
+        return _mc_var_kernel(mean, std, sims, days, seed)
+    
+    # Without Numba draw every normal at once and compound along each path
+    z = np.random.default_rng(seed).standard_normal((sims, days))
+    return np.prod(1.0 + mean + std * z, axis=1) - 1.0
+
+
+def _drawdown_series(portfolio_values: List[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Values, running peaks and fractional drawdowns as float64 arrays"""
+    vals = np.asarray(portfolio_values, dtype=np.float64)
+    peaks = np.maximum.accumulate(vals)
+    return vals, peaks, (peaks - vals) / peaks
+
+
+# One record per completed drawdown (see DrawdownAnalyzer.drawdown_segments)
+_DRAWDOWN_SEGMENT_DTYPE = np.dtype([
+    ("start_idx", np.int64),
+    ("end_idx", np.int64),
+    ("drawdown_pct", np.float64)
+])
+
+
 class DrawdownAnalyzer:
     """Drawdown analysis and tracking"""
     
@@ -410,53 +629,78 @@ class DrawdownAnalyzer:
         Returns:
             Drawdown metrics
         """
-        if not portfolio_values:
+        if len(portfolio_values) == 0:
             return {"error": "No data provided"}
         
-        peak = portfolio_values[0]
-        max_drawdown = 0
-        max_drawdown_start = 0
-        max_drawdown_end = 0
-        current_drawdown_start = 0
-        drawdowns = []
-        
-        for i, value in enumerate(portfolio_values):
-            if value > peak:
-                # New peak, record any drawdown that was in progress
-                if peak > portfolio_values[current_drawdown_start]:
-                    drawdowns.append({
-                        "start_idx": current_drawdown_start,
-                        "end_idx": i - 1,
-                        "drawdown_pct": (peak - min(portfolio_values[current_drawdown_start:i])) / peak * 100
-                    })
-                peak = value
-                current_drawdown_start = i
-            else:
-                drawdown = (peak - value) / peak
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    max_drawdown_start = current_drawdown_start
-                    max_drawdown_end = i
-        
-        # Calculate average drawdown
-        avg_drawdown = sum(d["drawdown_pct"] for d in drawdowns) / len(drawdowns) if drawdowns else 0
+        return DrawdownAnalyzer._drawdown_stats(*_drawdown_series(portfolio_values))
+    
+    @staticmethod
+    def drawdown_segments(portfolio_values: List[float]) -> np.ndarray:
+        """
+        Completed drawdowns as a structured array
+        
+        Args:
+            portfolio_values: Historical portfolio values
+        
+        Returns:
+            Array with fields start_idx (peak), end_idx (bar before the next
+            new peak) and drawdown_pct (peak-to-trough depth)
+        """
+        if len(portfolio_values) == 0:
+            return np.empty(0, dtype=_DRAWDOWN_SEGMENT_DTYPE)
+        vals, peaks, _ = _drawdown_series(portfolio_values)
+        return DrawdownAnalyzer._segments(vals, peaks)
+    
+    @staticmethod
+    def _segments(vals: np.ndarray, peaks: np.ndarray) -> np.ndarray:
+        """Segments between consecutive new peaks that dipped below the peak"""
+        new_peaks = np.flatnonzero(np.diff(peaks) > 0) + 1
+        starts = np.concatenate(([0], new_peaks[:-1]))
+        if new_peaks.size:
+            troughs = np.minimum.reduceat(vals, np.concatenate(([0], new_peaks)))[:-1]
+        else:
+            troughs = np.empty(0)
+        segment_peaks = vals[starts]
+        dipped = troughs < segment_peaks
+        
+        segments = np.empty(int(dipped.sum()), dtype=_DRAWDOWN_SEGMENT_DTYPE)
+        segments["start_idx"] = starts[dipped]
+        segments["end_idx"] = new_peaks[dipped] - 1
+        segments["drawdown_pct"] = (
+            (segment_peaks[dipped] - troughs[dipped]) / segment_peaks[dipped] * 100
+        )
+        return segments
+    
+    @staticmethod
+    def _drawdown_stats(vals: np.ndarray, peaks: np.ndarray, drawdowns: np.ndarray) -> Dict:
+        """Drawdown metrics from a precomputed (non-empty) drawdown series"""
+        # Deepest drawdown: first trough reaching it, and the peak before it
+        max_drawdown_end = int(drawdowns.argmax())
+        max_drawdown = float(drawdowns[max_drawdown_end])
+        if max_drawdown > 0:
+            max_drawdown_start = int(vals[:max_drawdown_end + 1].argmax())
+        else:
+            max_drawdown_start = max_drawdown_end = 0
+        
+        segment_dd = DrawdownAnalyzer._segments(vals, peaks)["drawdown_pct"]
+        avg_drawdown = float(segment_dd.mean()) if segment_dd.size else 0
         
         # Calculate recovery time for max drawdown
-        recovery_idx = None
-        for i in range(max_drawdown_end, len(portfolio_values)):
-            if portfolio_values[i] >= portfolio_values[max_drawdown_start]:
-                recovery_idx = i
-                break
+        recovered = np.flatnonzero(vals[max_drawdown_end:] >= vals[max_drawdown_start])
+        recovery_idx = max_drawdown_end + int(recovered[0]) if recovered.size else None
+        
+        peak = float(peaks[-1])
+        last = float(vals[-1])
         
         return {
-            "max_drawdown_pct": round(max_drawdown * 100, 2),
+            "max_drawdown_pct": max_drawdown * 100,
             "max_drawdown_start_idx": max_drawdown_start,
             "max_drawdown_end_idx": max_drawdown_end,
             "max_drawdown_recovery_idx": recovery_idx,
             "recovery_periods": recovery_idx - max_drawdown_end if recovery_idx else None,
-            "avg_drawdown_pct": round(avg_drawdown, 2),
-            "total_drawdowns": len(drawdowns),
-            "current_drawdown_pct": round((peak - portfolio_values[-1]) / peak * 100, 2) if peak > portfolio_values[-1] else 0
+            "avg_drawdown_pct": avg_drawdown,
+            "total_drawdowns": int(segment_dd.size),
+            "current_drawdown_pct": (peak - last) / peak * 100 if peak > last else 0
         }
     
     @staticmethod
@@ -476,7 +720,7 @@ class DrawdownAnalyzer:
         """
         if max_drawdown == 0:
             return 0
-        return round(annual_return / max_drawdown, 2)
+        return annual_return / max_drawdown
     
     @staticmethod
     def ulcer_index(portfolio_values: List[float]) -> float:
@@ -489,20 +733,146 @@ class DrawdownAnalyzer:
         Returns:
             Ulcer Index
         """
-        if not portfolio_values:
+        if len(portfolio_values) == 0:
             return 0
         
-        peak = portfolio_values[0]
-        squared_drawdowns = []
-        
-        for value in portfolio_values:
-            if value > peak:
-                peak = value
-            drawdown = ((peak - value) / peak) * 100
-            squared_drawdowns.append(drawdown ** 2)
-        
-        avg_squared = sum(squared_drawdowns) / len(squared_drawdowns)
-        return round(math.sqrt(avg_squared), 2)
+        _, _, drawdowns = _drawdown_series(portfolio_values)
+        return DrawdownAnalyzer._ulcer_from_drawdowns(drawdowns)
+    
+    @staticmethod
+    def _ulcer_from_drawdowns(drawdowns: np.ndarray) -> float:
+        """Ulcer Index from a precomputed fractional drawdown series"""
+        drawdown_pct = drawdowns * 100
+        return math.sqrt(float(np.mean(drawdown_pct * drawdown_pct)))
+
+
+@njit(cache=True, fastmath=True)
+def _moments_kernel(r: np.ndarray, b: np.ndarray, target: float) -> Tuple[float, ...]:
+    """
+    Single fused pass over returns (and benchmark, if same length)
+    
+    Uses Welford's updates so the float64 accumulators stay accurate even
+    when the inputs are stored as float32. Returns (mean, var, downside_var,
+    benchmark_mean, benchmark_var, covariance, active_var), all population
+    moments.
+    """
+    n = r.size
+    has_benchmark = b.size == n
+    mean = m2 = sum_down2 = 0.0
+    mean_b = m2_b = co_m2 = 0.0
+    mean_a = m2_a = 0.0
+    for i in range(n):
+        k = i + 1.0
+        x = float(r[i])
+        dx = x - mean
+        mean += dx / k
+        m2 += dx * (x - mean)
+        d = x - target
+        if d < 0:
+            sum_down2 += d * d
+        if has_benchmark:
+            y = float(b[i])
+            dy = y - mean_b
+            mean_b += dy / k
+            m2_b += dy * (y - mean_b)
+            co_m2 += dx * (y - mean_b)
+            a = x - y
+            da = a - mean_a
+            mean_a += da / k
+            m2_a += da * (a - mean_a)
+    
+    return mean, m2 / n, sum_down2 / n, mean_b, m2_b / n, co_m2 / n, m2_a / n
+
+
+if NUMBA_AVAILABLE:
+    _moments_kernel(np.zeros(1), np.zeros(1), 0.0)
+
+
+def _moments_numpy(
+    r: np.ndarray,
+    b: Optional[np.ndarray],
+    target: float
+) -> Tuple[float, ...]:
+    """NumPy equivalent of _moments_kernel, used when Numba is missing"""
+    # Accumulate in float64 whatever the storage width
+    r = r.astype(np.float64, copy=False)
+    if b is not None:
+        b = b.astype(np.float64, copy=False)
+    n = r.size
+    mean = float(r.mean())
+    d_r = r - mean
+    downside = np.minimum(0.0, r - target)
+    # Sums of squares go through np.dot (BLAS ddot) rather than temporaries
+    var = float(np.dot(d_r, d_r)) / n
+    down_var = float(np.dot(downside, downside)) / n
+    if b is None:
+        return mean, var, down_var, 0.0, 0.0, 0.0, 0.0
+    
+    mean_b = float(b.mean())
+    d_b = b - mean_b
+    d_active = d_r - d_b
+    return (
+        mean, var, down_var, mean_b,
+        float(np.dot(d_b, d_b)) / n,
+        float(np.dot(d_r, d_b)) / n,
+        float(np.dot(d_active, d_active)) / n
+    )
+
+
+_NO_BENCHMARK = np.empty(0)
+
+
+def _as_series(values: List[float]) -> np.ndarray:
+    """Float array for the moment kernels; float32 storage is kept as-is"""
+    arr = np.asarray(values)
+    return arr if arr.dtype == np.float32 else arr.astype(np.float64, copy=False)
+
+
+def _analyze_returns(
+    returns: List[float],
+    benchmark_returns: Optional[List[float]] = None,
+    target_return: float = 0
+) -> Dict[str, float]:
+    """
+    Compute every return-series statistic the risk metrics need in one place
+    
+    Returns mean, std and downside_std, plus beta, active_mean and
+    tracking_error when a benchmark series is given.
+    """
+    r = _as_series(returns)
+    b = None if benchmark_returns is None else _as_series(benchmark_returns)
+    if NUMBA_AVAILABLE:
+        moments = _moments_kernel(r, _NO_BENCHMARK if b is None else b, float(target_return))
+    else:
+        moments = _moments_numpy(r, b, target_return)
+    mean, var, down_var, mean_b, var_b, cov, active_var = moments
+    
+    stats = {
+        "mean": mean,
+        "std": math.sqrt(var),
+        "downside_std": math.sqrt(down_var)
+    }
+    
+    if b is not None:
+        stats.update({
+            "beta": cov / var_b if var_b > 0 else 0,
+            "active_mean": mean - mean_b,
+            "tracking_error": math.sqrt(active_var)
+        })
+    
+    return stats
+
+
+def _analyze_portfolio_values(portfolio_values: List[float]) -> Tuple[Dict, float]:
+    """Drawdown metrics and Ulcer Index from a single drawdown series"""
+    if len(portfolio_values) == 0:
+        return {"error": "No data provided"}, 0
+    
+    vals, peaks, drawdowns = _drawdown_series(portfolio_values)
+    return (
+        DrawdownAnalyzer._drawdown_stats(vals, peaks, drawdowns),
+        DrawdownAnalyzer._ulcer_from_drawdowns(drawdowns)
+    )
 
 
 class RiskAdjustedMetrics:
@@ -526,20 +896,22 @@ class RiskAdjustedMetrics:
         if len(returns) < 2:
             return 0
         
-        daily_rf = risk_free_rate / 252
-        excess_returns = [r - daily_rf for r in returns]
-        
-        mean_excess = sum(excess_returns) / len(excess_returns)
-        variance = sum((r - mean_excess) ** 2 for r in excess_returns) / len(excess_returns)
-        std_excess = math.sqrt(variance)
+        return RiskAdjustedMetrics._sharpe(_analyze_returns(returns), risk_free_rate)
+    
+    @staticmethod
+    def _sharpe(stats: Dict[str, float], risk_free_rate: float) -> float:
+        """Sharpe ratio from precomputed return statistics"""
+        daily_rf = risk_free_rate / _TRADING_DAYS
+        mean_excess = stats["mean"] - daily_rf
+        std_excess = stats["std"]
         
         if std_excess == 0:
             return 0
         
         daily_sharpe = mean_excess / std_excess
-        annual_sharpe = daily_sharpe * math.sqrt(252)
+        annual_sharpe = daily_sharpe * _SQRT_252
         
-        return round(annual_sharpe, 2)
+        return annual_sharpe
     
     @staticmethod
     def sortino_ratio(
@@ -561,22 +933,24 @@ class RiskAdjustedMetrics:
         if len(returns) < 2:
             return 0
         
-        daily_rf = risk_free_rate / 252
-        excess_returns = [r - daily_rf for r in returns]
-        mean_excess = sum(excess_returns) / len(excess_returns)
-        
-        # Calculate downside deviation
-        downside_returns = [min(0, r - target_return) for r in returns]
-        downside_variance = sum(r ** 2 for r in downside_returns) / len(downside_returns)
-        downside_std = math.sqrt(downside_variance)
+        return RiskAdjustedMetrics._sortino(
+            _analyze_returns(returns, target_return=target_return), risk_free_rate
+        )
+    
+    @staticmethod
+    def _sortino(stats: Dict[str, float], risk_free_rate: float) -> float:
+        """Sortino ratio from precomputed return statistics"""
+        daily_rf = risk_free_rate / _TRADING_DAYS
+        mean_excess = stats["mean"] - daily_rf
+        downside_std = stats["downside_std"]
         
         if downside_std == 0:
             return 0
         
         daily_sortino = mean_excess / downside_std
-        annual_sortino = daily_sortino * math.sqrt(252)
+        annual_sortino = daily_sortino * _SQRT_252
         
-        return round(annual_sortino, 2)
+        return annual_sortino
     
     @staticmethod
     def treynor_ratio(
@@ -598,25 +972,24 @@ class RiskAdjustedMetrics:
         if len(returns) != len(benchmark_returns) or len(returns) < 2:
             return 0
         
-        # Calculate beta
-        n = len(returns)
-        mean_r = sum(returns) / n
-        mean_b = sum(benchmark_returns) / n
-        
-        covariance = sum((r - mean_r) * (b - mean_b) for r, b in zip(returns, benchmark_returns)) / n
-        benchmark_variance = sum((b - mean_b) ** 2 for b in benchmark_returns) / n
-        
-        beta = covariance / benchmark_variance if benchmark_variance > 0 else 0
+        return RiskAdjustedMetrics._treynor(
+            _analyze_returns(returns, benchmark_returns), risk_free_rate
+        )
+    
+    @staticmethod
+    def _treynor(stats: Dict[str, float], risk_free_rate: float) -> float:
+        """Treynor ratio from precomputed return statistics (with benchmark)"""
+        beta = stats["beta"]
         
         if beta == 0:
             return 0
         
         # Annualize returns
-        annual_return = (1 + mean_r) ** 252 - 1
+        annual_return = (1 + stats["mean"]) ** _TRADING_DAYS - 1
         
         treynor = (annual_return - risk_free_rate) / beta
         
-        return round(treynor, 4)
+        return treynor
     
     @staticmethod
     def information_ratio(
@@ -636,19 +1009,21 @@ class RiskAdjustedMetrics:
         if len(returns) != len(benchmark_returns) or len(returns) < 2:
             return 0
         
-        excess_returns = [r - b for r, b in zip(returns, benchmark_returns)]
-        mean_excess = sum(excess_returns) / len(excess_returns)
-        
-        variance = sum((r - mean_excess) ** 2 for r in excess_returns) / len(excess_returns)
-        tracking_error = math.sqrt(variance)
+        return RiskAdjustedMetrics._information(_analyze_returns(returns, benchmark_returns))
+    
+    @staticmethod
+    def _information(stats: Dict[str, float]) -> float:
+        """Information ratio from precomputed return statistics (with benchmark)"""
+        mean_excess = stats["active_mean"]
+        tracking_error = stats["tracking_error"]
         
         if tracking_error == 0:
             return 0
         
         daily_ir = mean_excess / tracking_error
-        annual_ir = daily_ir * math.sqrt(252)
+        annual_ir = daily_ir * _SQRT_252
         
-        return round(annual_ir, 2)
+        return annual_ir
 
 
 def generate_risk_report(
@@ -656,7 +1031,9 @@ def generate_risk_report(
     returns: List[float],
     portfolio_values: List[float],
     risk_profile: RiskProfile,
-    benchmark_returns: Optional[List[float]] = None
+    benchmark_returns: Optional[List[float]] = None,
+    precision: Literal["fp32", "fp64"] = "fp64",
+    ndigits: Optional[int] = 2
 ) -> Dict:
     """
     Generate comprehensive risk report
@@ -666,39 +1043,60 @@ def generate_risk_report(
         returns: Historical daily returns
         portfolio_values: Historical portfolio values
         risk_profile: User's risk profile
-        benchmark_returns: Optional benchmark returns
+        benchmark_returns: Optional benchmark returns; without them the
+            Treynor and Information ratios are reported as None
+        precision: Storage width for the return series; "fp32" halves
+            memory on large scans while statistics still accumulate in fp64
+        ndigits: Decimal places for floats in the report (the Treynor ratio
+            keeps at least 4), or None to keep full precision (e.g. when the report feeds further math); the
+            risk_profile entry is then the profile's shared, read-only as_dict
     
     Returns:
         Comprehensive risk report
     """
-    if benchmark_returns is None:
-        benchmark_returns = [0] * len(returns)
+    # Convert once; every metric below works on these arrays
+    dtype = precision_dtype(precision)
+    returns = np.asarray(returns, dtype=dtype)
+    portfolio_values = np.asarray(portfolio_values, dtype=np.float64)
+    if benchmark_returns is not None:
+        benchmark_returns = np.asarray(benchmark_returns, dtype=dtype)
+    has_benchmark = benchmark_returns is not None and benchmark_returns.size == returns.size
     
-    # Calculate mean and std
-    if returns:
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        std_return = math.sqrt(variance)
+    # Calculate mean, std and benchmark-relative statistics together
+    if returns.size:
+        stats = _analyze_returns(returns, benchmark_returns if has_benchmark else None)
+        mean_return = stats["mean"]
+        std_return = stats["std"]
     else:
+        stats = {}
         mean_return = std_return = 0
     
     # VaR calculations
     var_hist = VaRCalculator.historical_var(returns, portfolio_value=portfolio_value)
     var_param = VaRCalculator.parametric_var(mean_return, std_return, portfolio_value=portfolio_value)
     
-    # Drawdown analysis
-    drawdown = DrawdownAnalyzer.calculate_drawdowns(portfolio_values)
-    ulcer = DrawdownAnalyzer.ulcer_index(portfolio_values)
+    # Drawdown analysis (peaks and drawdown series shared by both metrics)
+    drawdown, ulcer = _analyze_portfolio_values(portfolio_values)
     
     # Risk-adjusted metrics
-    sharpe = RiskAdjustedMetrics.sharpe_ratio(returns)
-    sortino = RiskAdjustedMetrics.sortino_ratio(returns)
-    treynor = RiskAdjustedMetrics.treynor_ratio(returns, benchmark_returns)
-    info_ratio = RiskAdjustedMetrics.information_ratio(returns, benchmark_returns)
+    risk_free_rate = 0.05
+    if returns.size >= 2:
+        sharpe = RiskAdjustedMetrics._sharpe(stats, risk_free_rate)
+        sortino = RiskAdjustedMetrics._sortino(stats, risk_free_rate)
+    else:
+        sharpe = sortino = 0
+    if benchmark_returns is None:
+        # Benchmark-relative ratios are undefined without a benchmark
+        treynor = info_ratio = None
+    elif returns.size >= 2 and has_benchmark:
+        treynor = RiskAdjustedMetrics._treynor(stats, risk_free_rate)
+        info_ratio = RiskAdjustedMetrics._information(stats)
+    else:
+        treynor = info_ratio = 0
     
     # Calmar ratio
-    if portfolio_values:
-        annual_return = mean_return * 252
+    if len(portfolio_values) > 0:
+        annual_return = mean_return * _TRADING_DAYS
         calmar = DrawdownAnalyzer.calmar_ratio(
             annual_return,
             drawdown.get("max_drawdown_pct", 0) / 100
@@ -711,24 +1109,24 @@ def generate_risk_report(
     risk_warnings = []
     
     if drawdown.get("max_drawdown_pct", 0) > risk_profile.max_drawdown_pct:
-        risk_warnings.append(f"Max drawdown ({drawdown['max_drawdown_pct']}%) exceeds limit ({risk_profile.max_drawdown_pct}%)")
+        risk_warnings.append(f"Max drawdown ({drawdown['max_drawdown_pct']:.2f}%) exceeds limit ({risk_profile.max_drawdown_pct}%)")
         risk_score += 20
     
     if var_hist.get("var_pct", 0) > 5:
-        risk_warnings.append(f"Daily VaR ({var_hist['var_pct']}%) is high")
+        risk_warnings.append(f"Daily VaR ({var_hist['var_pct']:.2f}%) is high")
         risk_score += 15
     
-    if std_return * math.sqrt(252) * 100 > 30:
+    if std_return * _SQRT_252 * 100 > 30:
         risk_warnings.append("Portfolio volatility exceeds 30% annualized")
         risk_score += 15
     
     if sharpe < 1:
-        risk_warnings.append(f"Sharpe ratio ({sharpe}) is below 1")
+        risk_warnings.append(f"Sharpe ratio ({sharpe:.2f}) is below 1")
         risk_score += 10
     
-    return {
-        "portfolio_value": round(portfolio_value, 2),
-        "risk_profile": risk_profile.to_dict(),
+    report = {
+        "portfolio_value": portfolio_value,
+        "risk_profile": risk_profile.as_dict,
         "value_at_risk": {
             "historical": var_hist,
             "parametric": var_param
@@ -743,8 +1141,8 @@ def generate_risk_report(
             "calmar_ratio": calmar
         },
         "volatility": {
-            "daily": round(std_return * 100, 2),
-            "annual": round(std_return * math.sqrt(252) * 100, 2)
+            "daily": std_return * 100,
+            "annual": std_return * _SQRT_252 * 100
         },
         "risk_assessment": {
             "risk_score": min(risk_score, 100),
@@ -752,3 +1150,15 @@ def generate_risk_report(
             "warnings": risk_warnings
         }
     }
+    
+    # Metrics above stay full precision; round once for presentation
+    if ndigits is None:
+        return report
+    rounded = round_floats(report, ndigits)
+    if treynor is not None:
+        # Treynor is return per unit of beta and usually tiny, so it keeps
+        # 4 places where the rest of the report shows 2
+        rounded["risk_adjusted_metrics"]["treynor_ratio"] = round(
+            treynor, max(ndigits, _TREYNOR_DIGITS)
+        )
+    return rounded
@@ -0,0 +1,30 @@
+"""
+Serialization Helpers
+
+Analysis functions return full-precision floats so results can be fed
+into further calculations. Rounding for display happens once, at the
+point where a report is turned into JSON.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+# Decimal places kept when a report is serialized
+DEFAULT_FLOAT_DIGITS = 4
+
+
+def round_floats(obj: Any, ndigits: int = DEFAULT_FLOAT_DIGITS) -> Any:
+    """Recursively round every float in a dict/list structure (mappings become dicts)"""
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, Mapping):
+        return {k: round_floats(v, ndigits) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [round_floats(v, ndigits) for v in obj]
+    return obj
+
+
+def dumps_rounded(obj: Any, ndigits: int = DEFAULT_FLOAT_DIGITS, **kwargs) -> str:
+    """json.dumps with all floats rounded to `ndigits` decimal places"""
+    return json.dumps(round_floats(obj, ndigits), **kwargs)
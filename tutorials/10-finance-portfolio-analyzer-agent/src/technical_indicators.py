@@ -13,7 +13,25 @@ Provides comprehensive technical indicators for trading analysis:
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
-import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from jit_compat import NUMBA_AVAILABLE, njit
+
+try:
+    from scipy.signal import fftconvolve, lfilter
+except ImportError:  # scipy is optional; see the uses below for the fallbacks
+    fftconvolve = lfilter = None
+
+# Storage width for price series. float32 halves the bytes each vectorized
+# pass moves; sums and recurrences accumulate in float64 and every indicator
+# returns float64 arrays.
+_DTYPE = np.float32
+
+# Window length above which WMA convolves via FFT (O(N log N)) instead of
+# direct convolution (O(N * period))
+_FFT_MIN_PERIOD = 64
 
 
 class Signal(Enum):
@@ -25,6 +43,34 @@ class Signal(Enum):
     STRONG_SELL = "strong_sell"
 
 
+# Integer signal codes used by SignalGenerator so signals can be aggregated
+# as plain numbers; translate back to Signal only at the report boundary.
+STRONG_BUY, BUY, NEUTRAL, SELL, STRONG_SELL = 2, 1, 0, -1, -2
+
+_SIGNALS_BY_CODE = (
+    Signal.STRONG_SELL, Signal.SELL, Signal.NEUTRAL, Signal.BUY, Signal.STRONG_BUY
+)
+
+# Each Signal carries its code as `score`, so voting code can read an
+# attribute instead of hashing the member into a lookup table
+for _code, _signal in enumerate(_SIGNALS_BY_CODE, start=STRONG_SELL):
+    _signal.score = _code
+del _code, _signal
+
+# RSI bins for SignalGenerator.rsi_signal_batch: the lower edges are
+# inclusive (<= 20, <= 30), the upper ones are nudged down one ulp so that
+# 70 and 80 themselves fall into the sell bins (>= 70, >= 80)
+_RSI_SIGNAL_EDGES = np.array([20.0, 30.0, np.nextafter(70.0, 0), np.nextafter(80.0, 0)])
+_RSI_SIGNAL_CODES = np.array(
+    [STRONG_BUY, BUY, NEUTRAL, SELL, STRONG_SELL], dtype=np.int8
+)
+
+
+def signal_from_code(code: int) -> Signal:
+    """Translate an integer signal code (-2..2) into its Signal."""
+    return _SIGNALS_BY_CODE[int(code) + 2]
+
+
 @dataclass
 class OHLCV:
     """Price data point"""
@@ -36,11 +82,180 @@ class OHLCV:
     volume: float
 
 
+@dataclass
+class OHLCVBatch:
+    """Price history stored column-wise, one float64 array per field"""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_records(cls, records: List[OHLCV]) -> "OHLCVBatch":
+        """Build from a list of bars (anything with OHLCV attributes)"""
+        n = len(records)
+        
+        def column(name: str) -> np.ndarray:
+            return np.fromiter((getattr(r, name) for r in records), dtype=np.float64, count=n)
+        
+        return cls(
+            timestamp=np.array([r.timestamp for r in records]),
+            open=column("open"),
+            high=column("high"),
+            low=column("low"),
+            close=column("close"),
+            volume=column("volume")
+        )
+    
+    def __len__(self) -> int:
+        return self.close.size
+
+
+# Column order of pivot_points_batch / fib_retracement_batch
+PIVOT_LEVELS = ("pivot", "r1", "r2", "r3", "s1", "s2", "s3")
+FIB_LEVELS = ("0.0%", "23.6%", "38.2%", "50.0%", "61.8%", "78.6%", "100.0%")
+_FIB_RATIOS = (0.236, 0.382, 0.5, 0.618, 0.786)
+
+
+def is_missing(value: Optional[float]) -> bool:
+    """True for a warm-up slot in an indicator series (None or NaN)"""
+    return value is None or value != value
+
+
+def _nan_arr(n: int) -> np.ndarray:
+    """Preallocated float64 indicator series with every slot still missing"""
+    out = np.empty(n, dtype=np.float64)
+    out.fill(np.nan)
+    return out
+
+
+def _round_or_none(value: Optional[float], ndigits: int) -> Optional[float]:
+    """Round an indicator value for a report, None if it is missing"""
+    return None if is_missing(value) else round(value, ndigits)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _rsi_loop(gains: np.ndarray, losses: np.ndarray, period: int) -> Tuple[np.ndarray, float, float]:
+    """
+    Wilder-smoothed RSI from per-bar gains and losses (one per price change)
+    
+    Also returns the final average gain and loss so the series can be
+    extended later with TechnicalIndicators.rsi_incremental.
+    """
+    result = np.full(gains.size + 1, np.nan)
+    
+    # First average
+    avg_gain = gains[:period].astype(np.float64).sum() / period
+    avg_loss = losses[:period].astype(np.float64).sum() / period
+    result[period] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    # Subsequent values using smoothed averages
+    for i in range(period, gains.size):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        result[i + 1] = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    return result, avg_gain, avg_loss
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _ema_loop(prices: np.ndarray, period: int) -> np.ndarray:
+    """EMA recurrence seeded with the SMA of the first `period` prices"""
+    result = np.full(prices.size, np.nan)
+    if prices.size < period:
+        return result
+    
+    multiplier = 2 / (period + 1)
+    ema = prices[:period].astype(np.float64).sum() / period
+    result[period - 1] = ema
+    for i in range(period, prices.size):
+        ema = (prices[i] - ema) * multiplier + ema
+        result[i] = ema
+    return result
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's moving average: seeded with the first `period` mean, NaN before"""
+    result = np.full(values.size, np.nan)
+    smoothed = values[:period].astype(np.float64).sum() / period
+    result[period - 1] = smoothed
+    for i in range(period, values.size):
+        smoothed = (smoothed * (period - 1) + values[i]) / period
+        result[i] = smoothed
+    return result
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _atr_loop(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> np.ndarray:
+    """True range and its Wilder average in one pass, without temporaries"""
+    result = np.full(closes.size, np.nan)
+    smoothed = 0.0
+    for i in range(closes.size):
+        true_range = highs[i] - lows[i]
+        if i > 0:
+            prev_close = closes[i - 1]
+            true_range = max(true_range, abs(highs[i] - prev_close), abs(lows[i] - prev_close))
+        
+        if i < period:
+            smoothed += true_range
+            if i == period - 1:
+                smoothed /= period
+                result[i] = smoothed
+        else:
+            smoothed = (smoothed * (period - 1) + true_range) / period
+            result[i] = smoothed
+    return result
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) now so the first indicator call isn't slow
+    _warmup = np.ones(3, dtype=_DTYPE)
+    _rsi_loop(_warmup[:2], _warmup[:2], 1)
+    _ema_loop(_warmup, 1)
+    _wilder_smooth(_warmup, 1)
+    _wilder_smooth(_warmup.astype(np.float64), 1)
+    _atr_loop(_warmup, _warmup, _warmup, 1)
+    del _warmup
+elif lfilter is not None:
+    # Without Numba the kernels above would run as Python loops. EMA, Wilder
+    # smoothing and RSI are all the same seeded first-order recurrence
+    # y[i] = alpha * x[i] + (1 - alpha) * y[i - 1], which scipy's lfilter
+    # runs in C with no JIT warm-up, so use it in their place.
+    def _seeded_smooth(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+        """Recurrence seeded with the first `period` mean, NaN before"""
+        result = _nan_arr(values.size)
+        if values.size < period:
+            return result
+        seed = values[:period].astype(np.float64).sum() / period
+        result[period - 1] = seed
+        result[period:] = lfilter(
+            [alpha], [1.0, alpha - 1.0], values[period:].astype(np.float64), zi=[(1 - alpha) * seed]
+        )[0]
+        return result
+    
+    def _ema_loop(prices: np.ndarray, period: int) -> np.ndarray:
+        return _seeded_smooth(prices, period, 2 / (period + 1))
+    
+    def _wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
+        return _seeded_smooth(values, period, 1 / period)
+    
+    def _rsi_loop(gains: np.ndarray, losses: np.ndarray, period: int) -> Tuple[np.ndarray, float, float]:
+        avg_gain = _wilder_smooth(gains, period)
+        avg_loss = _wilder_smooth(losses, period)
+        result = _nan_arr(gains.size + 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[1:] = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        return result, float(avg_gain[-1]), float(avg_loss[-1])
+
+
 class TechnicalIndicators:
     """Technical analysis indicator calculations"""
     
     @staticmethod
-    def sma(prices: List[float], period: int) -> List[Optional[float]]:
+    def sma(prices: List[float], period: int) -> np.ndarray:
         """
         Simple Moving Average
         
@@ -49,21 +264,22 @@ class TechnicalIndicators:
             period: Number of periods
         
         Returns:
-            List of SMA values (None for insufficient data)
+            Array of SMA values (NaN for insufficient data)
         """
-        if len(prices) < period:
-            return [None] * len(prices)
+        arr = np.asarray(prices, dtype=_DTYPE)
+        result = _nan_arr(arr.size)
+        if arr.size < period:
+            return result
         
-        result = [None] * (period - 1)
-        
-        for i in range(period - 1, len(prices)):
-            window = prices[i - period + 1:i + 1]
-            result.append(sum(window) / period)
+        # Window sums as differences of one running sum
+        cs = np.cumsum(arr, dtype=np.float64)
+        result[period - 1] = cs[period - 1] / period
+        result[period:] = (cs[period:] - cs[:-period]) / period
         
         return result
     
     @staticmethod
-    def ema(prices: List[float], period: int) -> List[Optional[float]]:
+    def ema(prices: List[float], period: int) -> np.ndarray:
         """
         Exponential Moving Average
         
@@ -72,26 +288,12 @@ class TechnicalIndicators:
             period: Number of periods
         
         Returns:
-            List of EMA values
+            Array of EMA values (NaN for insufficient data)
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-        
-        multiplier = 2 / (period + 1)
-        result = [None] * (period - 1)
-        
-        # First EMA is SMA
-        first_ema = sum(prices[:period]) / period
-        result.append(first_ema)
-        
-        for i in range(period, len(prices)):
-            ema_value = (prices[i] - result[-1]) * multiplier + result[-1]
-            result.append(ema_value)
-        
-        return result
+        return _ema_loop(np.asarray(prices, dtype=_DTYPE), period)
     
     @staticmethod
-    def wma(prices: List[float], period: int) -> List[Optional[float]]:
+    def wma(prices: List[float], period: int) -> np.ndarray:
         """
         Weighted Moving Average
         
@@ -100,24 +302,26 @@ class TechnicalIndicators:
             period: Number of periods
         
         Returns:
-            List of WMA values
+            Array of WMA values (NaN for insufficient data)
         """
-        if len(prices) < period:
-            return [None] * len(prices)
-        
-        result = [None] * (period - 1)
-        weights = list(range(1, period + 1))
-        weight_sum = sum(weights)
-        
-        for i in range(period - 1, len(prices)):
-            window = prices[i - period + 1:i + 1]
-            weighted_sum = sum(p * w for p, w in zip(window, weights))
-            result.append(weighted_sum / weight_sum)
+        arr = np.asarray(prices, dtype=_DTYPE)
+        result = _nan_arr(arr.size)
+        if arr.size < period:
+            return result
+        
+        # Weighted window sums as one convolution; the kernel is reversed so
+        # the newest price in each window gets the largest weight
+        weights = np.arange(1, period + 1, dtype=np.float64)
+        kernel = weights[::-1] / weights.sum()
+        if period > _FFT_MIN_PERIOD and fftconvolve is not None:
+            result[period - 1:] = fftconvolve(arr.astype(np.float64), kernel, mode="valid")
+        else:
+            result[period - 1:] = np.convolve(arr, kernel, mode="valid")
         
         return result
     
     @staticmethod
-    def rsi(prices: List[float], period: int = 14) -> List[Optional[float]]:
+    def rsi(prices: List[float], period: int = 14) -> np.ndarray:
         """
         Relative Strength Index
         
@@ -126,41 +330,18 @@ class TechnicalIndicators:
             period: RSI period (default 14)
         
         Returns:
-            List of RSI values (0-100)
+            Array of RSI values (0-100, NaN for insufficient data)
         """
-        if len(prices) < period + 1:
-            return [None] * len(prices)
+        arr = np.asarray(prices, dtype=_DTYPE)
+        if arr.size < period + 1:
+            return _nan_arr(arr.size)
         
         # Calculate price changes
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        gains = [max(0, c) for c in changes]
-        losses = [max(0, -c) for c in changes]
+        changes = np.diff(arr)
+        gains = np.maximum(changes, 0.0)
+        losses = np.maximum(-changes, 0.0)
         
-        result = [None] * period
-        
-        # First average
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-        
-        if avg_loss == 0:
-            result.append(100.0)
-        else:
-            rs = avg_gain / avg_loss
-            result.append(100 - (100 / (1 + rs)))
-        
-        # Subsequent values using smoothed averages
-        for i in range(period, len(changes)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-            
-            if avg_loss == 0:
-                result.append(100.0)
-            else:
-                rs = avg_gain / avg_loss
-                result.append(100 - (100 / (1 + rs)))
-        
-        return result
+        return _rsi_loop(gains, losses, period)[0]
     
     @staticmethod
     def macd(
@@ -168,7 +349,7 @@ class TechnicalIndicators:
         fast_period: int = 12,
         slow_period: int = 26,
         signal_period: int = 9
-    ) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Moving Average Convergence Divergence
         
@@ -181,36 +362,49 @@ class TechnicalIndicators:
         Returns:
             Tuple of (MACD line, Signal line, Histogram)
         """
-        fast_ema = TechnicalIndicators.ema(prices, fast_period)
-        slow_ema = TechnicalIndicators.ema(prices, slow_period)
-        
-        # Calculate MACD line
-        macd_line = []
-        for f, s in zip(fast_ema, slow_ema):
-            if f is not None and s is not None:
-                macd_line.append(f - s)
-            else:
-                macd_line.append(None)
-        
-        # Calculate signal line (EMA of MACD)
-        valid_macd = [m for m in macd_line if m is not None]
-        if len(valid_macd) < signal_period:
-            signal_line = [None] * len(prices)
-            histogram = [None] * len(prices)
+        return TechnicalIndicators.macd_from_emas(
+            TechnicalIndicators.ema(prices, fast_period),
+            TechnicalIndicators.ema(prices, slow_period),
+            signal_period,
+            slow_period
+        )
+    
+    @staticmethod
+    def macd_from_emas(
+        fast_ema: np.ndarray,
+        slow_ema: np.ndarray,
+        signal_period: int = 9,
+        slow_period: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        MACD from already computed fast and slow EMAs
+        
+        Args:
+            fast_ema: Fast EMA series
+            slow_ema: Slow EMA series (same length)
+            signal_period: Signal line period
+            slow_period: Slow EMA period, which fixes the MACD warm-up length;
+                found from the leading NaNs of slow_ema when not given
+        
+        Returns:
+            Tuple of (MACD line, Signal line, Histogram)
+        """
+        # Calculate MACD line (missing wherever either EMA is)
+        macd_line = np.asarray(fast_ema, dtype=np.float64) - np.asarray(slow_ema, dtype=np.float64)
+        n = macd_line.size
+        signal_line = _nan_arr(n)
+        
+        # Calculate signal line (EMA of MACD) over the valid tail, which starts
+        # where the slow EMA's warm-up ends
+        if slow_period is not None:
+            start = slow_period - 1
         else:
-            signal_ema = TechnicalIndicators.ema(valid_macd, signal_period)
-            
-            # Align signal line with original data
-            signal_line = [None] * (len(prices) - len(valid_macd))
-            signal_line.extend(signal_ema)
-            
-            # Calculate histogram
-            histogram = []
-            for m, s in zip(macd_line, signal_line):
-                if m is not None and s is not None:
-                    histogram.append(m - s)
-                else:
-                    histogram.append(None)
+            valid = ~np.isnan(macd_line)
+            start = int(valid.argmax()) if valid.any() else n
+        signal_line[start:] = _ema_loop(macd_line[start:], signal_period)
+        
+        # Calculate histogram
+        histogram = macd_line - signal_line
         
         return macd_line, signal_line, histogram
     
@@ -221,7 +415,7 @@ class TechnicalIndicators:
         closes: List[float],
         k_period: int = 14,
         d_period: int = 3
-    ) -> Tuple[List[Optional[float]], List[Optional[float]]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Stochastic Oscillator
         
@@ -235,27 +429,28 @@ class TechnicalIndicators:
         Returns:
             Tuple of (%K, %D)
         """
-        if len(closes) < k_period:
-            return [None] * len(closes), [None] * len(closes)
-        
-        k_values = [None] * (k_period - 1)
-        
-        for i in range(k_period - 1, len(closes)):
-            highest_high = max(highs[i - k_period + 1:i + 1])
-            lowest_low = min(lows[i - k_period + 1:i + 1])
-            
-            if highest_high == lowest_low:
-                k_values.append(50.0)
-            else:
-                k = ((closes[i] - lowest_low) / (highest_high - lowest_low)) * 100
-                k_values.append(k)
+        h = np.asarray(highs, dtype=_DTYPE)
+        l = np.asarray(lows, dtype=_DTYPE)
+        c = np.asarray(closes, dtype=_DTYPE)
+        k_values = _nan_arr(c.size)
+        d_values = _nan_arr(c.size)
+        if c.size < k_period:
+            return k_values, d_values
+        
+        highest_high = sliding_window_view(h, k_period).max(axis=1)
+        lowest_low = sliding_window_view(l, k_period).min(axis=1)
+        price_range = highest_high - lowest_low
+        flat = price_range == 0
+        
+        # 50 when the window has no range
+        k_values[k_period - 1:] = np.where(
+            flat,
+            50.0,
+            ((c[k_period - 1:] - lowest_low) / np.where(flat, 1.0, price_range)) * 100
+        )
         
         # %D is SMA of %K
-        valid_k = [k for k in k_values if k is not None]
-        d_sma = TechnicalIndicators.sma(valid_k, d_period)
-        
-        d_values = [None] * (len(k_values) - len(d_sma))
-        d_values.extend(d_sma)
+        d_values[k_period - 1:] = TechnicalIndicators.sma(k_values[k_period - 1:], d_period)
         
         return k_values, d_values
     
@@ -264,7 +459,7 @@ class TechnicalIndicators:
         prices: List[float],
         period: int = 20,
         std_dev: float = 2.0
-    ) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Bollinger Bands
         
@@ -276,22 +471,23 @@ class TechnicalIndicators:
         Returns:
             Tuple of (Upper band, Middle band, Lower band)
         """
-        middle = TechnicalIndicators.sma(prices, period)
-        
-        upper = []
-        lower = []
-        
-        for i, m in enumerate(middle):
-            if m is None:
-                upper.append(None)
-                lower.append(None)
-            else:
-                window = prices[max(0, i - period + 1):i + 1]
-                variance = sum((p - m) ** 2 for p in window) / len(window)
-                std = math.sqrt(variance)
-                
-                upper.append(m + std_dev * std)
-                lower.append(m - std_dev * std)
+        arr = np.asarray(prices, dtype=_DTYPE)
+        middle = TechnicalIndicators.sma(arr, period)
+        if arr.size < period:
+            return middle.copy(), middle, middle.copy()
+        
+        # Rolling variance as E[x^2] - E[x]^2 from running sums; centering
+        # the series first keeps the running sums small and the difference exact
+        x = arr - arr.mean(dtype=np.float64)
+        cs = np.cumsum(np.concatenate(([0.0], x)))
+        cs2 = np.cumsum(np.concatenate(([0.0], x * x)))
+        mean = (cs[period:] - cs[:-period]) / period
+        mean_sq = (cs2[period:] - cs2[:-period]) / period
+        std = _nan_arr(arr.size)
+        std[period - 1:] = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+        
+        upper = middle + std_dev * std
+        lower = middle - std_dev * std
         
         return upper, middle, lower
     
@@ -301,7 +497,7 @@ class TechnicalIndicators:
         lows: List[float],
         closes: List[float],
         period: int = 14
-    ) -> List[Optional[float]]:
+    ) -> np.ndarray:
         """
         Average True Range
         
@@ -312,41 +508,56 @@ class TechnicalIndicators:
             period: ATR period
         
         Returns:
-            List of ATR values
+            Array of ATR values (NaN for insufficient data)
         """
-        if len(closes) < 2:
-            return [None] * len(closes)
-        
-        # Calculate True Range
-        true_ranges = [highs[0] - lows[0]]
-        
-        for i in range(1, len(closes)):
-            tr = max(
-                highs[i] - lows[i],
-                abs(highs[i] - closes[i - 1]),
-                abs(lows[i] - closes[i - 1])
+        h = np.asarray(highs, dtype=_DTYPE)
+        l = np.asarray(lows, dtype=_DTYPE)
+        c = np.asarray(closes, dtype=_DTYPE)
+        if c.size < 2 or c.size < period:
+            return _nan_arr(c.size)
+        
+        if NUMBA_AVAILABLE:
+            return _atr_loop(
+                np.ascontiguousarray(h), np.ascontiguousarray(l), np.ascontiguousarray(c), period
             )
-            true_ranges.append(tr)
         
-        # Calculate ATR (smoothed average of TR)
-        if len(true_ranges) < period:
-            return [None] * len(closes)
+        # True Range: largest of the bar range and the gaps from the prior close
+        prev_close = c[:-1]
+        true_ranges = np.empty(c.size)
+        true_ranges[0] = h[0] - l[0]
+        true_ranges[1:] = np.maximum.reduce([
+            h[1:] - l[1:],
+            np.abs(h[1:] - prev_close),
+            np.abs(l[1:] - prev_close)
+        ])
+        
+        # First ATR is a simple average, the rest use Wilder smoothing
+        return _wilder_smooth(true_ranges, period)
+    
+    @staticmethod
+    def atr_from_close(closes: List[float], period: int = 14) -> np.ndarray:
+        """
+        Average True Range when only closing prices are available
         
-        atr_values = [None] * (period - 1)
+        Equivalent to atr(closes, closes, closes, period): with high = low =
+        close the true range reduces to the absolute close-to-close change.
         
-        # First ATR is simple average
-        first_atr = sum(true_ranges[:period]) / period
-        atr_values.append(first_atr)
+        Args:
+            closes: List of closing prices
+            period: ATR period
         
-        # Subsequent ATRs use smoothing
-        for i in range(period, len(true_ranges)):
-            atr = (atr_values[-1] * (period - 1) + true_ranges[i]) / period
-            atr_values.append(atr)
+        Returns:
+            Array of ATR values (NaN for insufficient data)
+        """
+        c = np.asarray(closes, dtype=_DTYPE)
+        if c.size < 2 or c.size < period:
+            return _nan_arr(c.size)
         
-        return atr_values
+        true_ranges = np.abs(np.diff(c, prepend=c[0]))
+        return _wilder_smooth(true_ranges, period)
     
     @staticmethod
-    def obv(closes: List[float], volumes: List[float]) -> List[float]:
+    def obv(closes: List[float], volumes: List[float]) -> np.ndarray:
         """
         On-Balance Volume
         
@@ -355,20 +566,16 @@ class TechnicalIndicators:
             volumes: List of volumes
         
         Returns:
-            List of OBV values
+            Array of OBV values
         """
-        if len(closes) < 2:
-            return [0] * len(closes)
+        c = np.asarray(closes, dtype=_DTYPE)
+        v = np.asarray(volumes, dtype=np.float64)
+        obv_values = np.zeros(c.size)
+        if c.size < 2:
+            return obv_values
         
-        obv_values = [0]
-        
-        for i in range(1, len(closes)):
-            if closes[i] > closes[i - 1]:
-                obv_values.append(obv_values[-1] + volumes[i])
-            elif closes[i] < closes[i - 1]:
-                obv_values.append(obv_values[-1] - volumes[i])
-            else:
-                obv_values.append(obv_values[-1])
+        # Volume is added on up bars, subtracted on down bars, ignored when flat
+        np.cumsum(np.sign(np.diff(c)) * v[1:c.size], out=obv_values[1:])
         
         return obv_values
     
@@ -378,7 +585,7 @@ class TechnicalIndicators:
         lows: List[float],
         closes: List[float],
         volumes: List[float]
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Volume Weighted Average Price
         
@@ -389,19 +596,20 @@ class TechnicalIndicators:
             volumes: List of volumes
         
         Returns:
-            List of VWAP values
+            Array of VWAP values
         """
-        vwap_values = []
-        cumulative_tp_vol = 0
-        cumulative_vol = 0
+        h = np.asarray(highs, dtype=_DTYPE)
+        l = np.asarray(lows, dtype=_DTYPE)
+        c = np.asarray(closes, dtype=_DTYPE)
+        v = np.asarray(volumes, dtype=np.float64)
         
-        for h, l, c, v in zip(highs, lows, closes, volumes):
-            typical_price = (h + l + c) / 3
-            cumulative_tp_vol += typical_price * v
-            cumulative_vol += v
-            
-            vwap = cumulative_tp_vol / cumulative_vol if cumulative_vol > 0 else 0
-            vwap_values.append(vwap)
+        typical_price = (h + l + c) / 3
+        cumulative_tp_vol = np.cumsum(typical_price * v)
+        cumulative_vol = np.cumsum(v)
+        
+        # 0 until any volume has traded
+        vwap_values = np.zeros(c.size)
+        np.divide(cumulative_tp_vol, cumulative_vol, out=vwap_values, where=cumulative_vol > 0)
         
         return vwap_values
     
@@ -410,8 +618,9 @@ class TechnicalIndicators:
         highs: List[float],
         lows: List[float],
         closes: List[float],
-        period: int = 14
-    ) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
+        period: int = 14,
+        atr_values: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Average Directional Index
         
@@ -420,82 +629,52 @@ class TechnicalIndicators:
             lows: List of low prices
             closes: List of closing prices
             period: ADX period
+            atr_values: ATR for the same bars and period, if already computed
         
         Returns:
-            Tuple of (ADX, +DI, -DI)
+            Tuple of (ADX, +DI, -DI), each the same length as closes
         """
-        if len(closes) < period + 1:
-            n = len(closes)
-            return [None] * n, [None] * n, [None] * n
-        
-        # Calculate +DM and -DM
-        plus_dm = []
-        minus_dm = []
-        
-        for i in range(1, len(closes)):
-            up_move = highs[i] - highs[i - 1]
-            down_move = lows[i - 1] - lows[i]
-            
-            if up_move > down_move and up_move > 0:
-                plus_dm.append(up_move)
-            else:
-                plus_dm.append(0)
-            
-            if down_move > up_move and down_move > 0:
-                minus_dm.append(down_move)
-            else:
-                minus_dm.append(0)
+        h = np.asarray(highs, dtype=_DTYPE)
+        l = np.asarray(lows, dtype=_DTYPE)
+        n = len(closes)
+        if h.size != n or l.size != n:
+            raise ValueError(f"highs, lows and closes must have the same length, got {h.size}, {l.size}, {n}")
+        
+        # Outputs are preallocated at full length; each stage writes its
+        # valid tail by slice, so no series needs padding afterwards
+        adx_values = _nan_arr(n)
+        plus_di_full = _nan_arr(n)
+        minus_di_full = _nan_arr(n)
+        if n < period + 1:
+            return adx_values, plus_di_full, minus_di_full
+        
+        # Calculate +DM and -DM (one per bar after the first)
+        up_move = np.diff(h)
+        down_move = -np.diff(l)
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
         
         # Calculate ATR
-        atr_values = TechnicalIndicators.atr(highs, lows, closes, period)
-        
-        # Smooth DM values
-        plus_di = []
-        minus_di = []
-        
-        for i in range(period - 1, len(plus_dm)):
-            if i == period - 1:
-                smoothed_plus = sum(plus_dm[:period])
-                smoothed_minus = sum(minus_dm[:period])
-            else:
-                smoothed_plus = smoothed_plus - (smoothed_plus / period) + plus_dm[i]
-                smoothed_minus = smoothed_minus - (smoothed_minus / period) + minus_dm[i]
-            
-            atr = atr_values[i + 1] if atr_values[i + 1] else 1
-            
-            plus_di.append((smoothed_plus / atr) * 100 if atr > 0 else 0)
-            minus_di.append((smoothed_minus / atr) * 100 if atr > 0 else 0)
-        
-        # Calculate DX
-        dx_values = []
-        for pdi, mdi in zip(plus_di, minus_di):
-            di_sum = pdi + mdi
-            if di_sum == 0:
-                dx_values.append(0)
-            else:
-                dx_values.append(abs(pdi - mdi) / di_sum * 100)
-        
-        # Calculate ADX (smoothed DX)
-        adx_values = [None] * (2 * period - 1)
-        if len(dx_values) >= period:
-            first_adx = sum(dx_values[:period]) / period
-            adx_values.append(first_adx)
-            
-            for i in range(period, len(dx_values)):
-                adx = (adx_values[-1] * (period - 1) + dx_values[i]) / period
-                adx_values.append(adx)
-        
-        # Pad results
-        plus_di_full = [None] * period + plus_di
-        minus_di_full = [None] * period + minus_di
-        
-        # Ensure all lists are same length
-        while len(adx_values) < len(closes):
-            adx_values.append(adx_values[-1] if adx_values else None)
-        while len(plus_di_full) < len(closes):
-            plus_di_full.append(plus_di_full[-1] if plus_di_full else None)
-        while len(minus_di_full) < len(closes):
-            minus_di_full.append(minus_di_full[-1] if minus_di_full else None)
+        if atr_values is None:
+            atr_values = TechnicalIndicators.atr(highs, lows, closes, period)
+        atr = np.asarray(atr_values, dtype=np.float64)[period:]
+        
+        # +DI/-DI: Wilder-averaged DM as a percentage of ATR (0 where ATR is 0)
+        smoothed_plus = _wilder_smooth(plus_dm, period)[period - 1:]
+        smoothed_minus = _wilder_smooth(minus_dm, period)[period - 1:]
+        plus_di = np.zeros(atr.size)
+        minus_di = np.zeros(atr.size)
+        np.divide(smoothed_plus * 100, atr, out=plus_di, where=atr > 0)
+        np.divide(smoothed_minus * 100, atr, out=minus_di, where=atr > 0)
+        plus_di_full[period:] = plus_di
+        minus_di_full[period:] = minus_di
+        
+        # Calculate DX, then ADX as its Wilder average
+        di_sum = plus_di + minus_di
+        dx_values = np.zeros(di_sum.size)
+        np.divide(np.abs(plus_di - minus_di) * 100, di_sum, out=dx_values, where=di_sum != 0)
+        if dx_values.size >= period:
+            adx_values[period:] = _wilder_smooth(dx_values, period)
         
         return adx_values, plus_di_full, minus_di_full
     
@@ -512,17 +691,32 @@ class TechnicalIndicators:
         Returns:
             Dictionary with pivot point levels
         """
-        pivot = (high + low + close) / 3
+        levels = TechnicalIndicators.pivot_points_batch(high, low, close)[0]
+        return dict(zip(PIVOT_LEVELS, levels.tolist()))
+    
+    @staticmethod
+    def pivot_points_batch(highs, lows, closes) -> np.ndarray:
+        """
+        Calculate pivot points for many periods at once
         
-        return {
-            "pivot": round(pivot, 4),
-            "r1": round(2 * pivot - low, 4),
-            "r2": round(pivot + (high - low), 4),
-            "r3": round(high + 2 * (pivot - low), 4),
-            "s1": round(2 * pivot - high, 4),
-            "s2": round(pivot - (high - low), 4),
-            "s3": round(low - 2 * (high - pivot), 4)
-        }
+        Args:
+            highs: Period highs (scalar or array)
+            lows: Period lows (scalar or array)
+            closes: Period closes (scalar or array)
+        
+        Returns:
+            Array of shape (n, 7) with columns ordered as PIVOT_LEVELS
+        """
+        h = np.asarray(highs, dtype=np.float64)
+        l = np.asarray(lows, dtype=np.float64)
+        c = np.asarray(closes, dtype=np.float64)
+        p = (h + l + c) / 3
+        
+        levels = np.column_stack(np.broadcast_arrays(
+            p, 2 * p - l, p + (h - l), h + 2 * (p - l),
+            2 * p - h, p - (h - l), l - 2 * (h - p)
+        ))
+        return np.round(levels, 4)
     
     @staticmethod
     def fibonacci_retracement(high: float, low: float) -> Dict[str, float]:
@@ -536,38 +730,327 @@ class TechnicalIndicators:
         Returns:
             Dictionary with Fibonacci levels
         """
-        diff = high - low
+        levels = TechnicalIndicators.fib_retracement_batch(high, low)[0]
+        return dict(zip(FIB_LEVELS, levels.tolist()))
+    
+    @staticmethod
+    def fib_retracement_batch(highs, lows) -> np.ndarray:
+        """
+        Calculate Fibonacci retracement levels for many swings at once
         
-        return {
-            "0.0%": round(low, 4),
-            "23.6%": round(low + 0.236 * diff, 4),
-            "38.2%": round(low + 0.382 * diff, 4),
-            "50.0%": round(low + 0.5 * diff, 4),
-            "61.8%": round(low + 0.618 * diff, 4),
-            "78.6%": round(low + 0.786 * diff, 4),
-            "100.0%": round(high, 4)
-        }
+        Args:
+            highs: Swing highs (scalar or array)
+            lows: Swing lows (scalar or array)
+        
+        Returns:
+            Array of shape (n, 7) with columns ordered as FIB_LEVELS
+        """
+        h = np.asarray(highs, dtype=np.float64)
+        l = np.asarray(lows, dtype=np.float64)
+        diff = h - l
+        
+        levels = np.column_stack(np.broadcast_arrays(
+            l, *(l + ratio * diff for ratio in _FIB_RATIOS), h
+        ))
+        return np.round(levels, 4)
+    
+    @staticmethod
+    def sma_incremental(prev_sma: float, new_price: float, dropped_price: float, period: int) -> float:
+        """
+        Advance an SMA by one bar in O(1)
+        
+        Args:
+            prev_sma: SMA at the previous bar
+            new_price: Price entering the window
+            dropped_price: Price leaving the window (period bars back)
+            period: Number of periods
+        
+        Returns:
+            SMA at the new bar
+        """
+        return prev_sma + (new_price - dropped_price) / period
+    
+    @staticmethod
+    def ema_incremental(prev_ema: float, new_price: float, period: int) -> float:
+        """
+        Advance an EMA by one bar in O(1)
+        
+        Args:
+            prev_ema: EMA at the previous bar
+            new_price: Price of the new bar
+            period: Number of periods
+        
+        Returns:
+            EMA at the new bar
+        """
+        return (new_price - prev_ema) * (2 / (period + 1)) + prev_ema
+    
+    @staticmethod
+    def rsi_incremental(
+        avg_gain: float,
+        avg_loss: float,
+        new_price: float,
+        prev_price: float,
+        period: int = 14
+    ) -> Tuple[float, float, float]:
+        """
+        Advance an RSI by one bar in O(1)
+        
+        Args:
+            avg_gain: Wilder-smoothed average gain at the previous bar
+            avg_loss: Wilder-smoothed average loss at the previous bar
+            new_price: Price of the new bar
+            prev_price: Price of the previous bar
+            period: RSI period
+        
+        Returns:
+            Tuple of (RSI, average gain, average loss) at the new bar
+        """
+        change = new_price - prev_price
+        avg_gain = (avg_gain * (period - 1) + max(change, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-change, 0.0)) / period
+        rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+        return rsi, avg_gain, avg_loss
+    
+    @staticmethod
+    def atr_incremental(prev_atr: float, high: float, low: float, prev_close: float, period: int = 14) -> float:
+        """
+        Advance an ATR by one bar in O(1)
+        
+        Args:
+            prev_atr: ATR at the previous bar
+            high: High of the new bar
+            low: Low of the new bar
+            prev_close: Close of the previous bar
+            period: ATR period
+        
+        Returns:
+            ATR at the new bar
+        """
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        return (prev_atr * (period - 1) + true_range) / period
+
+
+class _GrowableArray:
+    """Array with spare capacity, so appending k values is amortized O(k)"""
+    
+    __slots__ = ("_data", "size")
+    
+    def __init__(self, values: np.ndarray):
+        self.size = values.size
+        self._data = np.empty(max(2 * self.size, 256), dtype=values.dtype)
+        self._data[:self.size] = values
+    
+    def extend(self, values) -> np.ndarray:
+        """Append `values` and return the grown view"""
+        values = np.asarray(values, dtype=self._data.dtype)
+        end = self.size + values.size
+        if end > self._data.size:
+            grown = np.empty(2 * end, dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+        self._data[self.size:end] = values
+        self.size = end
+        return self.view()
+    
+    def view(self) -> np.ndarray:
+        return self._data[:self.size]
+
+
+class _CacheEntry:
+    """IndicatorCache entry: inputs seen so far, results and recurrence state"""
+    
+    __slots__ = ("inputs", "result", "state")
+    
+    def __init__(self, inputs: Tuple[np.ndarray, ...], result: np.ndarray, state: tuple):
+        self.inputs = tuple(_GrowableArray(x) for x in inputs)
+        self.result = _GrowableArray(result)
+        self.state = state
+
+
+class IndicatorCache:
+    """
+    Per-series cache of indicator results for backtests and live feeds
+    
+    Each entry keeps the prices it was computed from in an append-only
+    buffer, along with its results and the recurrence state at the last bar.
+    When a later call passes the series with new bars appended (as a
+    backtest does while it walks forward in time, or a live feed on every
+    bar), only the new bars are converted and computed, using the O(1)
+    *_incremental updates, so a call costs O(new bars) rather than O(N).
+    The prefix is not re-validated: only the last cached bar is compared,
+    so use one cache per symbol and clear() it before switching series.
+    A series that is shorter, or differs at that bar, is recomputed in
+    full. Returned arrays are shared with the cache and are read-only.
+    
+    Indicators without an incremental path (macd, bollinger_bands, ...) are
+    looked up on TechnicalIndicators, so a cache can stand in for it.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, int], _CacheEntry] = {}
+    
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(TechnicalIndicators, name)
+    
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._entries.clear()
+    
+    def _cached(self, key: Tuple[str, int], series: tuple) -> Optional[_CacheEntry]:
+        """Entry for `key` if `series` extends its inputs, else None (O(1))"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        m = entry.result.size
+        if m == 0 or len(series[0]) < m or is_missing(entry.result.view()[-1]):
+            return None
+        for cached, new in zip(entry.inputs, series):
+            if cached.view()[-1] != _DTYPE(new[m - 1]):
+                return None
+        return entry
+    
+    def _store(self, key, inputs, result: np.ndarray, state: tuple = ()) -> np.ndarray:
+        entry = self._entries[key] = _CacheEntry(inputs, result, state)
+        return self._result(entry)
+    
+    @staticmethod
+    def _extend(entry: _CacheEntry, series: tuple) -> Tuple[np.ndarray, ...]:
+        """Append the bars of `series` past the cached ones to entry.inputs"""
+        m = entry.result.size
+        return tuple(cached.extend(new[m:]) for cached, new in zip(entry.inputs, series))
+    
+    @staticmethod
+    def _result(entry: _CacheEntry, new_values: Optional[np.ndarray] = None) -> np.ndarray:
+        if new_values is not None and new_values.size:
+            entry.result.extend(new_values)
+        result = entry.result.view()
+        result.flags.writeable = False
+        return result
+    
+    def sma(self, prices: List[float], period: int) -> np.ndarray:
+        """Cached TechnicalIndicators.sma"""
+        key = ("sma", period)
+        entry = self._cached(key, (prices,))
+        if entry is None:
+            arr = np.array(prices, dtype=_DTYPE)
+            return self._store(key, (arr,), TechnicalIndicators.sma(arr, period))
+        
+        start = entry.result.size
+        arr, = self._extend(entry, (prices,))
+        new = np.empty(arr.size - start)
+        value = entry.result.view()[-1]
+        for j, i in enumerate(range(start, arr.size)):
+            value = new[j] = TechnicalIndicators.sma_incremental(
+                value, arr[i], arr[i - period], period
+            )
+        return self._result(entry, new)
+    
+    def ema(self, prices: List[float], period: int) -> np.ndarray:
+        """Cached TechnicalIndicators.ema"""
+        key = ("ema", period)
+        entry = self._cached(key, (prices,))
+        if entry is None:
+            arr = np.array(prices, dtype=_DTYPE)
+            return self._store(key, (arr,), TechnicalIndicators.ema(arr, period))
+        
+        start = entry.result.size
+        arr, = self._extend(entry, (prices,))
+        new = np.empty(arr.size - start)
+        value = entry.result.view()[-1]
+        for j, i in enumerate(range(start, arr.size)):
+            value = new[j] = TechnicalIndicators.ema_incremental(value, arr[i], period)
+        return self._result(entry, new)
+    
+    def rsi(self, prices: List[float], period: int = 14) -> np.ndarray:
+        """Cached TechnicalIndicators.rsi"""
+        key = ("rsi", period)
+        entry = self._cached(key, (prices,))
+        if entry is None:
+            arr = np.array(prices, dtype=_DTYPE)
+            if arr.size < period + 1:
+                return self._store(key, (arr,), _nan_arr(arr.size))
+            changes = np.diff(arr)
+            result, avg_gain, avg_loss = _rsi_loop(
+                np.maximum(changes, 0.0), np.maximum(-changes, 0.0), period
+            )
+            return self._store(key, (arr,), result, (avg_gain, avg_loss))
+        
+        start = entry.result.size
+        arr, = self._extend(entry, (prices,))
+        new = np.empty(arr.size - start)
+        avg_gain, avg_loss = entry.state
+        for j, i in enumerate(range(start, arr.size)):
+            new[j], avg_gain, avg_loss = TechnicalIndicators.rsi_incremental(
+                avg_gain, avg_loss, arr[i], arr[i - 1], period
+            )
+        entry.state = (avg_gain, avg_loss)
+        return self._result(entry, new)
+    
+    def atr(
+        self,
+        highs: List[float],
+        lows: List[float],
+        closes: List[float],
+        period: int = 14
+    ) -> np.ndarray:
+        """Cached TechnicalIndicators.atr"""
+        key = ("atr", period)
+        entry = self._cached(key, (highs, lows, closes))
+        if entry is None:
+            inputs = tuple(np.array(x, dtype=_DTYPE) for x in (highs, lows, closes))
+            return self._store(key, inputs, TechnicalIndicators.atr(*inputs, period))
+        
+        start = entry.result.size
+        h, l, c = self._extend(entry, (highs, lows, closes))
+        new = np.empty(c.size - start)
+        value = entry.result.view()[-1]
+        for j, i in enumerate(range(start, c.size)):
+            value = new[j] = TechnicalIndicators.atr_incremental(value, h[i], l[i], c[i - 1], period)
+        return self._result(entry, new)
+    
+    def atr_from_close(self, closes: List[float], period: int = 14) -> np.ndarray:
+        """Cached TechnicalIndicators.atr_from_close"""
+        return self.atr(closes, closes, closes, period)
 
 
 class SignalGenerator:
     """Generate trading signals from technical indicators"""
     
     @staticmethod
-    def rsi_signal(rsi: float) -> Signal:
+    def rsi_signal(rsi: float) -> int:
         """Generate signal from RSI value"""
-        if rsi is None:
-            return Signal.NEUTRAL
+        if is_missing(rsi):
+            return NEUTRAL
         
         if rsi <= 20:
-            return Signal.STRONG_BUY
+            return STRONG_BUY
         elif rsi <= 30:
-            return Signal.BUY
+            return BUY
         elif rsi >= 80:
-            return Signal.STRONG_SELL
+            return STRONG_SELL
         elif rsi >= 70:
-            return Signal.SELL
+            return SELL
         else:
-            return Signal.NEUTRAL
+            return NEUTRAL
+    
+    @staticmethod
+    def rsi_signal_batch(rsi: np.ndarray) -> np.ndarray:
+        """
+        Generate RSI signal codes for a whole series
+        
+        Args:
+            rsi: Array of RSI values (NaN for missing)
+        
+        Returns:
+            int8 array of signal codes, matching rsi_signal element-wise
+        """
+        values = np.asarray(rsi, dtype=np.float64)
+        codes = _RSI_SIGNAL_CODES[np.searchsorted(_RSI_SIGNAL_EDGES, values)]
+        codes[np.isnan(values)] = NEUTRAL
+        return codes
     
     @staticmethod
     def macd_signal(
@@ -575,24 +1058,24 @@ class SignalGenerator:
         signal: float,
         prev_macd: Optional[float] = None,
         prev_signal: Optional[float] = None
-    ) -> Signal:
+    ) -> int:
         """Generate signal from MACD crossover"""
-        if macd is None or signal is None:
-            return Signal.NEUTRAL
+        if is_missing(macd) or is_missing(signal):
+            return NEUTRAL
         
         # Current position
         is_above = macd > signal
         
         # Check for crossover
-        if prev_macd is not None and prev_signal is not None:
+        if not is_missing(prev_macd) and not is_missing(prev_signal):
             was_above = prev_macd > prev_signal
             
             if is_above and not was_above:
-                return Signal.BUY  # Bullish crossover
+                return BUY  # Bullish crossover
             elif not is_above and was_above:
-                return Signal.SELL  # Bearish crossover
+                return SELL  # Bearish crossover
         
-        return Signal.NEUTRAL
+        return NEUTRAL
     
     @staticmethod
     def bollinger_signal(
@@ -600,70 +1083,70 @@ class SignalGenerator:
         upper: float,
         lower: float,
         middle: float
-    ) -> Signal:
+    ) -> int:
         """Generate signal from Bollinger Bands position"""
-        if None in (price, upper, lower, middle):
-            return Signal.NEUTRAL
+        if any(is_missing(v) for v in (price, upper, lower, middle)):
+            return NEUTRAL
         
         # Calculate position as percentage
         band_width = upper - lower
         if band_width == 0:
-            return Signal.NEUTRAL
+            return NEUTRAL
         
         position = (price - lower) / band_width
         
         if position >= 1.0:  # Above upper band
-            return Signal.SELL
+            return SELL
         elif position <= 0.0:  # Below lower band
-            return Signal.BUY
+            return BUY
         elif position >= 0.8:  # Near upper band
-            return Signal.SELL
+            return SELL
         elif position <= 0.2:  # Near lower band
-            return Signal.BUY
+            return BUY
         else:
-            return Signal.NEUTRAL
+            return NEUTRAL
     
     @staticmethod
-    def stochastic_signal(k: float, d: float) -> Signal:
+    def stochastic_signal(k: float, d: float) -> int:
         """Generate signal from Stochastic Oscillator"""
-        if k is None or d is None:
-            return Signal.NEUTRAL
+        if is_missing(k) or is_missing(d):
+            return NEUTRAL
         
         if k <= 20 and d <= 20:
-            return Signal.BUY if k > d else Signal.STRONG_BUY
+            return BUY if k > d else STRONG_BUY
         elif k >= 80 and d >= 80:
-            return Signal.SELL if k < d else Signal.STRONG_SELL
+            return SELL if k < d else STRONG_SELL
         elif k > d and k <= 30:
-            return Signal.BUY
+            return BUY
         elif k < d and k >= 70:
-            return Signal.SELL
+            return SELL
         else:
-            return Signal.NEUTRAL
+            return NEUTRAL
     
     @staticmethod
     def moving_average_signal(
         price: float,
         short_ma: float,
         long_ma: float
-    ) -> Signal:
+    ) -> int:
         """Generate signal from moving average crossover"""
-        if None in (price, short_ma, long_ma):
-            return Signal.NEUTRAL
+        if any(is_missing(v) for v in (price, short_ma, long_ma)):
+            return NEUTRAL
         
         # Price above both MAs and short above long = bullish
         if price > short_ma > long_ma:
-            return Signal.BUY
+            return BUY
         # Price below both MAs and short below long = bearish
         elif price < short_ma < long_ma:
-            return Signal.SELL
+            return SELL
         # Mixed signals
         else:
-            return Signal.NEUTRAL
+            return NEUTRAL
     
     @staticmethod
     def adx_trend_strength(adx: float) -> str:
         """Interpret ADX trend strength"""
-        if adx is None:
+        if is_missing(adx):
             return "unknown"
         
         if adx < 20:
@@ -676,50 +1159,31 @@ class SignalGenerator:
             return "very strong trend"
     
     @staticmethod
-    def combine_signals(signals: List[Signal], weights: Optional[List[float]] = None) -> Signal:
+    def combine_signals(signals: List[int], weights: Optional[List[float]] = None) -> Signal:
         """
         Combine multiple signals into a single signal
         
         Args:
-            signals: List of individual signals
+            signals: List of individual signal codes (-2..2)
             weights: Optional weights for each signal
         
         Returns:
             Combined signal
         """
-        if not signals:
+        codes = np.asarray(signals, dtype=np.int8)
+        if codes.size == 0:
             return Signal.NEUTRAL
         
         if weights is None:
-            weights = [1.0] * len(signals)
-        
-        # Convert signals to numeric values
-        signal_values = {
-            Signal.STRONG_BUY: 2,
-            Signal.BUY: 1,
-            Signal.NEUTRAL: 0,
-            Signal.SELL: -1,
-            Signal.STRONG_SELL: -2
-        }
-        
-        weighted_sum = sum(
-            signal_values[s] * w
-            for s, w in zip(signals, weights)
-        )
-        
-        total_weight = sum(weights)
-        avg_score = weighted_sum / total_weight if total_weight > 0 else 0
-        
-        if avg_score >= 1.5:
-            return Signal.STRONG_BUY
-        elif avg_score >= 0.5:
-            return Signal.BUY
-        elif avg_score <= -1.5:
-            return Signal.STRONG_SELL
-        elif avg_score <= -0.5:
-            return Signal.SELL
+            weighted_sum, total_weight = float(codes.sum()), float(codes.size)
         else:
-            return Signal.NEUTRAL
+            w = np.asarray(weights, dtype=np.float32)
+            weighted_sum, total_weight = float(codes @ w), float(w.sum())
+        avg_score = weighted_sum / total_weight if total_weight > 0 else 0.0
+        
+        # |score| >= 1.5 -> strong, >= 0.5 -> plain, otherwise neutral
+        code = min(int(abs(avg_score) + 0.5), STRONG_BUY)
+        return signal_from_code(-code if avg_score < 0 else code)
 
 
 def generate_technical_report(
@@ -750,17 +1214,18 @@ def generate_technical_report(
     ti = TechnicalIndicators
     sg = SignalGenerator
     
-    # Calculate indicators
+    # Calculate indicators; EMAs and ATR are computed once and shared with
+    # MACD and ADX, which would otherwise recompute them
+    ema_12 = ti.ema(closes, 12)
+    ema_26 = ti.ema(closes, 26)
+    atr = ti.atr(highs, lows, closes)
     rsi = ti.rsi(closes)
-    macd_line, signal_line, histogram = ti.macd(closes)
+    macd_line, signal_line, histogram = ti.macd_from_emas(ema_12, ema_26, slow_period=26)
     k, d = ti.stochastic(highs, lows, closes)
     upper_bb, middle_bb, lower_bb = ti.bollinger_bands(closes)
-    atr = ti.atr(highs, lows, closes)
-    adx, plus_di, minus_di = ti.adx(highs, lows, closes)
+    adx, plus_di, minus_di = ti.adx(highs, lows, closes, atr_values=atr)
     sma_20 = ti.sma(closes, 20)
     sma_50 = ti.sma(closes, 50)
-    ema_12 = ti.ema(closes, 12)
-    ema_26 = ti.ema(closes, 26)
     
     # Get latest values
     current_price = closes[-1]
@@ -769,8 +1234,9 @@ def generate_technical_report(
     signals = []
     
     rsi_val = rsi[-1]
-    if rsi_val is not None:
-        signals.append(sg.rsi_signal(rsi_val))
+    rsi_sig = sg.rsi_signal(rsi_val)
+    if not is_missing(rsi_val):
+        signals.append(rsi_sig)
     
     macd_sig = sg.macd_signal(
         macd_line[-1], signal_line[-1],
@@ -789,49 +1255,49 @@ def generate_technical_report(
     signals.append(ma_sig)
     
     # Calculate support/resistance
-    pivots = ti.pivot_points(max(highs[-20:]), min(lows[-20:]), closes[-1])
-    fibs = ti.fibonacci_retracement(max(highs[-50:]), min(lows[-50:]))
+    pivots = ti.pivot_points(np.max(highs[-20:]), np.min(lows[-20:]), closes[-1])
+    fibs = ti.fibonacci_retracement(np.max(highs[-50:]), np.min(lows[-50:]))
     
     overall_signal = sg.combine_signals(signals)
     
     return {
         "current_price": round(current_price, 2),
         "indicators": {
-            "rsi": round(rsi[-1], 2) if rsi[-1] else None,
+            "rsi": _round_or_none(rsi[-1], 2),
             "macd": {
-                "macd_line": round(macd_line[-1], 4) if macd_line[-1] else None,
-                "signal_line": round(signal_line[-1], 4) if signal_line[-1] else None,
-                "histogram": round(histogram[-1], 4) if histogram[-1] else None
+                "macd_line": _round_or_none(macd_line[-1], 4),
+                "signal_line": _round_or_none(signal_line[-1], 4),
+                "histogram": _round_or_none(histogram[-1], 4)
             },
             "stochastic": {
-                "k": round(k[-1], 2) if k[-1] else None,
-                "d": round(d[-1], 2) if d[-1] else None
+                "k": _round_or_none(k[-1], 2),
+                "d": _round_or_none(d[-1], 2)
             },
             "bollinger_bands": {
-                "upper": round(upper_bb[-1], 2) if upper_bb[-1] else None,
-                "middle": round(middle_bb[-1], 2) if middle_bb[-1] else None,
-                "lower": round(lower_bb[-1], 2) if lower_bb[-1] else None
+                "upper": _round_or_none(upper_bb[-1], 2),
+                "middle": _round_or_none(middle_bb[-1], 2),
+                "lower": _round_or_none(lower_bb[-1], 2)
             },
-            "atr": round(atr[-1], 2) if atr[-1] else None,
+            "atr": _round_or_none(atr[-1], 2),
             "adx": {
-                "adx": round(adx[-1], 2) if adx[-1] else None,
-                "plus_di": round(plus_di[-1], 2) if plus_di[-1] else None,
-                "minus_di": round(minus_di[-1], 2) if minus_di[-1] else None,
+                "adx": _round_or_none(adx[-1], 2),
+                "plus_di": _round_or_none(plus_di[-1], 2),
+                "minus_di": _round_or_none(minus_di[-1], 2),
                 "trend_strength": sg.adx_trend_strength(adx[-1])
             },
             "moving_averages": {
-                "sma_20": round(sma_20[-1], 2) if sma_20[-1] else None,
-                "sma_50": round(sma_50[-1], 2) if sma_50[-1] else None,
-                "ema_12": round(ema_12[-1], 2) if ema_12[-1] else None,
-                "ema_26": round(ema_26[-1], 2) if ema_26[-1] else None
+                "sma_20": _round_or_none(sma_20[-1], 2),
+                "sma_50": _round_or_none(sma_50[-1], 2),
+                "ema_12": _round_or_none(ema_12[-1], 2),
+                "ema_26": _round_or_none(ema_26[-1], 2)
             }
         },
         "signals": {
-            "rsi": sg.rsi_signal(rsi[-1]).value,
-            "macd": macd_sig.value,
-            "bollinger": bb_sig.value,
-            "stochastic": stoch_sig.value,
-            "moving_average": ma_sig.value
+            "rsi": signal_from_code(rsi_sig).value,
+            "macd": signal_from_code(macd_sig).value,
+            "bollinger": signal_from_code(bb_sig).value,
+            "stochastic": signal_from_code(stoch_sig).value,
+            "moving_average": signal_from_code(ma_sig).value
         },
         "overall_signal": overall_signal.value,
         "support_resistance": {
@@ -839,3 +1305,59 @@ def generate_technical_report(
             "fibonacci_levels": fibs
         }
     }
+
+
+def generate_technical_report_batch(
+    symbols: List[str],
+    closes: List[float],
+    highs: Optional[List[float]] = None,
+    lows: Optional[List[float]] = None,
+    volumes: Optional[List[float]] = None,
+    timestamps: Optional[List] = None
+) -> Dict[str, Dict]:
+    """
+    Generate technical analysis reports for many tickers at once
+    
+    Takes long-format columns (one row per symbol and bar). Rows are grouped
+    by symbol in a single sort, and each ticker's report runs on contiguous
+    views of the reordered columns. Grouping is vectorized; the reports
+    themselves are still built one symbol at a time.
+    
+    With timestamps, rows are ordered by time within each symbol, so the
+    input can be in any order. Without them the sort is stable and keeps
+    the given row order, so each symbol's rows must already be
+    chronological (oldest first).
+    
+    Args:
+        symbols: Ticker symbol of each row
+        closes: Closing price of each row
+        highs: Optional high price of each row
+        lows: Optional low price of each row
+        volumes: Optional volume of each row
+        timestamps: Optional bar time of each row (datetimes, ISO strings
+            or numbers, anything that sorts chronologically)
+    
+    Returns:
+        Dictionary mapping each symbol to its technical analysis report
+    """
+    sym = np.asarray(symbols)
+    if timestamps is None:
+        order = np.argsort(sym, kind="stable")
+    else:
+        # lexsort orders by the last key first: symbol, then time
+        order = np.lexsort((np.asarray(timestamps), sym))
+    sym = sym[order]
+    columns = [
+        None if col is None else np.asarray(col, dtype=np.float64)[order]
+        for col in (closes, highs, lows, volumes)
+    ]
+    
+    names, starts = np.unique(sym, return_index=True)
+    bounds = np.append(starts, sym.size)
+    
+    reports = {}
+    for name, start, end in zip(names.tolist(), bounds[:-1], bounds[1:]):
+        c, h, l, v = (None if col is None else col[start:end] for col in columns)
+        reports[name] = generate_technical_report(c, h, l, v)
+    
+    return reports
@@ -9,15 +9,23 @@ Provides strategy development and signal generation:
 - Trade execution simulation
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Callable, Tuple
 from enum import Enum
 from abc import ABC, abstractmethod
+from itertools import count, repeat
+from multiprocessing import get_context
 
-from technical_indicators import TechnicalIndicators, SignalGenerator, Signal
+import numpy as np
+
+from technical_indicators import TechnicalIndicators, IndicatorCache, SignalGenerator, Signal, is_missing
 from risk_management import PositionSizer, StopLoss, TakeProfit
 
+_BUY_SET = frozenset({Signal.BUY, Signal.STRONG_BUY})
+_SELL_SET = frozenset({Signal.SELL, Signal.STRONG_SELL})
+
 
 class OrderType(Enum):
     """Order types"""
@@ -44,7 +52,7 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Trade order representation"""
     id: str
@@ -84,7 +92,7 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Completed trade"""
     id: str
@@ -128,15 +136,15 @@ class Trade:
             "quantity": self.quantity,
             "entry_time": self.entry_time.isoformat(),
             "exit_time": self.exit_time.isoformat() if self.exit_time else None,
-            "pnl": round(self.pnl, 2),
-            "pnl_percent": round(self.pnl_percent, 2),
+            "pnl": self.pnl,
+            "pnl_percent": self.pnl_percent,
             "holding_period_days": self.holding_period_days,
             "strategy": self.strategy,
             "is_closed": self.is_closed
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategySignal:
     """Trading signal from a strategy"""
     symbol: str
@@ -154,7 +162,7 @@ class StrategySignal:
             "symbol": self.symbol,
             "signal": self.signal.value,
             "strategy_name": self.strategy_name,
-            "confidence": round(self.confidence, 2),
+            "confidence": self.confidence,
             "entry_price": self.entry_price,
             "stop_loss": self.stop_loss,
             "take_profit": self.take_profit,
@@ -163,12 +171,95 @@ class StrategySignal:
         }
 
 
+def _ensure_np(values: Optional[List[float]]) -> Optional[np.ndarray]:
+    """Price series as a float64 array (None stays None)"""
+    return None if values is None else np.asarray(values, dtype=np.float64)
+
+
+def _memo_key(arg) -> tuple:
+    """Memo key for one indicator argument: series by identity, scalars by value"""
+    if isinstance(arg, (int, float, str)) or arg is None:
+        return ("v", arg)
+    return ("id", id(arg), len(arg))
+
+
+class _SeriesBuffer:
+    """Growable float64 array for streaming bars (amortized O(1) append)"""
+    
+    __slots__ = ("_data", "size")
+    
+    def __init__(self, values: List[float] = ()):
+        values = np.asarray(values, dtype=np.float64)
+        self.size = values.size
+        self._data = np.empty(max(2 * self.size, 256))
+        self._data[:self.size] = values
+    
+    def append(self, value: float):
+        if self.size == self._data.size:
+            grown = np.empty(2 * self.size)
+            grown[:self.size] = self._data
+            self._data = grown
+        self._data[self.size] = value
+        self.size += 1
+    
+    def view(self) -> np.ndarray:
+        return self._data[:self.size]
+
+
+class IndicatorMemo:
+    """
+    TechnicalIndicators stand-in that memoizes results within one
+    StrategyEngine.generate_signals call
+    
+    Strategies in an engine run back to back over the same price series and
+    ask for the same indicators (ATR in particular). Series arguments are
+    keyed by identity and length, since they are not mutated during a call,
+    and scalar parameters by value. The engine installs the memo only while
+    the call runs and clears it on the way out; each entry keeps its
+    arguments alive until then so their ids cannot be reused.
+    """
+    
+    def __init__(self):
+        self._results: Dict[tuple, tuple] = {}
+    
+    def clear(self):
+        """Forget all memoized results"""
+        self._results.clear()
+    
+    def __getstate__(self) -> Dict:
+        # Cached wrappers are closures and results only live for one call
+        return {"_results": {}}
+    
+    def __getattr__(self, name: str) -> Callable:
+        # Only reached on the first lookup of each indicator; the wrapper is
+        # then stored on the instance so later lookups are plain attribute reads
+        indicator = getattr(TechnicalIndicators, name)
+        results = self._results
+        
+        def memoized(*args, **kwargs):
+            key = (name,) + tuple(_memo_key(a) for a in args) + tuple(
+                (k, _memo_key(v)) for k, v in sorted(kwargs.items())
+            )
+            entry = results.get(key)
+            if entry is None:
+                entry = results[key] = (indicator(*args, **kwargs), args, kwargs)
+            return entry[0]
+        
+        setattr(self, name, memoized)
+        return memoized
+
+
 class TradingStrategy(ABC):
     """Base class for trading strategies"""
     
     def __init__(self, name: str):
         self.name = name
         self.parameters: Dict = {}
+        # Indicator provider; StrategyEngine.generate_signals swaps in its
+        # shared IndicatorMemo for the duration of the call
+        self.indicators = TechnicalIndicators
+        # Streaming state per symbol: bar history and an IndicatorCache
+        self.state: Dict[str, Dict] = {}
     
     @abstractmethod
     def generate_signal(
@@ -182,6 +273,105 @@ class TradingStrategy(ABC):
         """Generate trading signal"""
         pass
     
+    def backfill(
+        self,
+        symbol: str,
+        closes: List[float],
+        highs: Optional[List[float]] = None,
+        lows: Optional[List[float]] = None,
+        volumes: Optional[List[float]] = None
+    ) -> StrategySignal:
+        """
+        Start (or restart) streaming `symbol` from its full history
+        
+        Computes every indicator once; later bars are added with update().
+        """
+        self.state[symbol] = {
+            "closes": _SeriesBuffer(closes),
+            "highs": None if highs is None else _SeriesBuffer(highs),
+            "lows": None if lows is None else _SeriesBuffer(lows),
+            "volumes": None if volumes is None else _SeriesBuffer(volumes),
+            "cache": IndicatorCache()
+        }
+        return self._stream_signal(symbol)
+    
+    def update(
+        self,
+        symbol: str,
+        close: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        volume: Optional[float] = None
+    ) -> StrategySignal:
+        """
+        Append one bar to the streaming history of `symbol` and signal on it
+        
+        EMA, SMA, RSI and ATR are extended from their last values in O(1)
+        rather than recomputed over the whole history. The first call for a
+        symbol without a backfill() starts its history at this bar. Pass
+        high/low/volume on every bar if they were backfilled.
+        """
+        entry = self.state.get(symbol)
+        if entry is None:
+            return self.backfill(
+                symbol,
+                [close],
+                None if high is None else [high],
+                None if low is None else [low],
+                None if volume is None else [volume]
+            )
+        
+        bar = (("closes", close), ("highs", high), ("lows", low), ("volumes", volume))
+        for key, value in bar:
+            if entry[key] is not None and value is None:
+                raise ValueError(f"{key} were backfilled for {symbol}; the new bar needs one too")
+        for key, value in bar:
+            if entry[key] is not None:
+                entry[key].append(value)
+        return self._stream_signal(symbol)
+    
+    def reset(self, symbol: Optional[str] = None):
+        """Drop the streaming state of `symbol`, or of every symbol"""
+        if symbol is None:
+            self.state.clear()
+        else:
+            self.state.pop(symbol, None)
+    
+    def _stream_signal(self, symbol: str) -> StrategySignal:
+        """Run generate_signal on the streamed history via its IndicatorCache"""
+        entry = self.state[symbol]
+        series = [
+            None if entry[key] is None else entry[key].view()
+            for key in ("closes", "highs", "lows", "volumes")
+        ]
+        # Not thread-safe per strategy: the provider is swapped for this call
+        indicators = self.indicators
+        self.indicators = entry["cache"]
+        try:
+            return self.generate_signal(symbol, *series)
+        finally:
+            self.indicators = indicators
+    
+    def _latest_atr(
+        self,
+        closes: List[float],
+        highs: Optional[List[float]] = None,
+        lows: Optional[List[float]] = None,
+        period: int = 14
+    ) -> Optional[float]:
+        """Latest ATR value, from closes alone when no high/low data is given"""
+        ti = self.indicators
+        if (highs is None or highs is closes) and (lows is None or lows is closes):
+            atr = ti.atr_from_close(closes, period)
+        else:
+            atr = ti.atr(
+                closes if highs is None else highs,
+                closes if lows is None else lows,
+                closes,
+                period
+            )
+        return None if is_missing(atr[-1]) else atr[-1]
+    
     def calculate_stops(
         self,
         entry_price: float,
@@ -195,7 +385,7 @@ class TradingStrategy(ABC):
         else:
             stop_distance = entry_price * 0.02  # 2% default
         
-        if signal in [Signal.BUY, Signal.STRONG_BUY]:
+        if signal in _BUY_SET:
             stop_loss = entry_price - stop_distance
             take_profit = entry_price + (stop_distance * risk_reward_ratio)
         else:
@@ -229,16 +419,14 @@ class MovingAverageCrossover(TradingStrategy):
         lows: Optional[List[float]] = None,
         volumes: Optional[List[float]] = None
     ) -> StrategySignal:
-        ti = TechnicalIndicators
+        ti = self.indicators
+        params = self.parameters
         
-        if self.parameters["ma_type"] == "ema":
-            fast_ma = ti.ema(closes, self.parameters["fast_period"])
-            slow_ma = ti.ema(closes, self.parameters["slow_period"])
-        else:
-            fast_ma = ti.sma(closes, self.parameters["fast_period"])
-            slow_ma = ti.sma(closes, self.parameters["slow_period"])
+        moving_average = ti.ema if params["ma_type"] == "ema" else ti.sma
+        fast_ma = moving_average(closes, params["fast_period"])
+        slow_ma = moving_average(closes, params["slow_period"])
         
-        if fast_ma[-1] is None or slow_ma[-1] is None:
+        if is_missing(fast_ma[-1]) or is_missing(slow_ma[-1]):
             return StrategySignal(
                 symbol=symbol,
                 signal=Signal.NEUTRAL,
@@ -248,7 +436,10 @@ class MovingAverageCrossover(TradingStrategy):
         
         # Check for crossover
         current_above = fast_ma[-1] > slow_ma[-1]
-        prev_above = fast_ma[-2] > slow_ma[-2] if len(fast_ma) > 1 and fast_ma[-2] else current_above
+        if len(fast_ma) > 1 and not is_missing(fast_ma[-2]) and not is_missing(slow_ma[-2]):
+            prev_above = fast_ma[-2] > slow_ma[-2]
+        else:
+            prev_above = current_above
         
         if current_above and not prev_above:
             signal = Signal.BUY
@@ -260,10 +451,12 @@ class MovingAverageCrossover(TradingStrategy):
             signal = Signal.NEUTRAL
             confidence = 0.3
         
-        entry_price = closes[-1]
-        atr = ti.atr(highs or closes, lows or closes, closes)
-        atr_val = atr[-1] if atr[-1] else None
-        stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
+        entry_price = float(closes[-1])
+        stop_loss = take_profit = None
+        if signal is not Signal.NEUTRAL:
+            # Stops only matter for an actionable signal
+            atr_val = self._latest_atr(closes, highs, lows)
+            stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
         
         return StrategySignal(
             symbol=symbol,
@@ -274,8 +467,8 @@ class MovingAverageCrossover(TradingStrategy):
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "fast_ma": round(fast_ma[-1], 2),
-                "slow_ma": round(slow_ma[-1], 2)
+                "fast_ma": float(fast_ma[-1]),
+                "slow_ma": float(slow_ma[-1])
             }
         )
 
@@ -304,11 +497,13 @@ class RSIMeanReversion(TradingStrategy):
         lows: Optional[List[float]] = None,
         volumes: Optional[List[float]] = None
     ) -> StrategySignal:
-        ti = TechnicalIndicators
+        ti = self.indicators
+        oversold = self.parameters["oversold"]
+        overbought = self.parameters["overbought"]
         
         rsi = ti.rsi(closes, self.parameters["rsi_period"])
         
-        if rsi[-1] is None:
+        if is_missing(rsi[-1]):
             return StrategySignal(
                 symbol=symbol,
                 signal=Signal.NEUTRAL,
@@ -318,20 +513,22 @@ class RSIMeanReversion(TradingStrategy):
         
         rsi_val = rsi[-1]
         
-        if rsi_val <= self.parameters["oversold"]:
+        if rsi_val <= oversold:
             signal = Signal.STRONG_BUY if rsi_val <= 20 else Signal.BUY
-            confidence = (self.parameters["oversold"] - rsi_val) / self.parameters["oversold"]
-        elif rsi_val >= self.parameters["overbought"]:
+            confidence = (oversold - rsi_val) / oversold
+        elif rsi_val >= overbought:
             signal = Signal.STRONG_SELL if rsi_val >= 80 else Signal.SELL
-            confidence = (rsi_val - self.parameters["overbought"]) / (100 - self.parameters["overbought"])
+            confidence = (rsi_val - overbought) / (100 - overbought)
         else:
             signal = Signal.NEUTRAL
             confidence = 0.3
         
-        entry_price = closes[-1]
-        atr = ti.atr(highs or closes, lows or closes, closes)
-        atr_val = atr[-1] if atr[-1] else None
-        stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
+        entry_price = float(closes[-1])
+        stop_loss = take_profit = None
+        if signal is not Signal.NEUTRAL:
+            # Stops only matter for an actionable signal
+            atr_val = self._latest_atr(closes, highs, lows)
+            stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
         
         return StrategySignal(
             symbol=symbol,
@@ -341,7 +538,7 @@ class RSIMeanReversion(TradingStrategy):
             entry_price=entry_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
-            metadata={"rsi": round(rsi_val, 2)}
+            metadata={"rsi": rsi_val}
         )
 
 
@@ -367,7 +564,7 @@ class BollingerBandBreakout(TradingStrategy):
         lows: Optional[List[float]] = None,
         volumes: Optional[List[float]] = None
     ) -> StrategySignal:
-        ti = TechnicalIndicators
+        ti = self.indicators
         
         upper, middle, lower = ti.bollinger_bands(
             closes,
@@ -375,7 +572,7 @@ class BollingerBandBreakout(TradingStrategy):
             self.parameters["std_dev"]
         )
         
-        if upper[-1] is None or lower[-1] is None:
+        if is_missing(upper[-1]) or is_missing(lower[-1]):
             return StrategySignal(
                 symbol=symbol,
                 signal=Signal.NEUTRAL,
@@ -400,8 +597,10 @@ class BollingerBandBreakout(TradingStrategy):
             signal = Signal.NEUTRAL
             confidence = 0.3
         
-        entry_price = closes[-1]
-        stop_loss, take_profit = self.calculate_stops(entry_price, signal)
+        entry_price = float(closes[-1])
+        stop_loss = take_profit = None
+        if signal is not Signal.NEUTRAL:
+            stop_loss, take_profit = self.calculate_stops(entry_price, signal)
         
         return StrategySignal(
             symbol=symbol,
@@ -412,9 +611,9 @@ class BollingerBandBreakout(TradingStrategy):
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "upper_band": round(upper[-1], 2),
-                "middle_band": round(middle[-1], 2),
-                "lower_band": round(lower[-1], 2)
+                "upper_band": float(upper[-1]),
+                "middle_band": float(middle[-1]),
+                "lower_band": float(lower[-1])
             }
         )
 
@@ -443,7 +642,7 @@ class MACDStrategy(TradingStrategy):
         lows: Optional[List[float]] = None,
         volumes: Optional[List[float]] = None
     ) -> StrategySignal:
-        ti = TechnicalIndicators
+        ti = self.indicators
         
         macd_line, signal_line, histogram = ti.macd(
             closes,
@@ -452,7 +651,7 @@ class MACDStrategy(TradingStrategy):
             self.parameters["signal_period"]
         )
         
-        if macd_line[-1] is None or signal_line[-1] is None:
+        if is_missing(macd_line[-1]) or is_missing(signal_line[-1]):
             return StrategySignal(
                 symbol=symbol,
                 signal=Signal.NEUTRAL,
@@ -462,7 +661,10 @@ class MACDStrategy(TradingStrategy):
         
         # Check for crossover
         current_above = macd_line[-1] > signal_line[-1]
-        prev_above = macd_line[-2] > signal_line[-2] if macd_line[-2] and signal_line[-2] else current_above
+        if not is_missing(macd_line[-2]) and not is_missing(signal_line[-2]):
+            prev_above = macd_line[-2] > signal_line[-2]
+        else:
+            prev_above = current_above
         
         if current_above and not prev_above:
             signal = Signal.BUY
@@ -470,7 +672,7 @@ class MACDStrategy(TradingStrategy):
         elif not current_above and prev_above:
             signal = Signal.SELL
             confidence = 0.7
-        elif histogram[-1] and histogram[-1] > 0:
+        elif not is_missing(histogram[-1]) and histogram[-1] > 0:
             signal = Signal.NEUTRAL
             confidence = 0.4
         else:
@@ -478,7 +680,7 @@ class MACDStrategy(TradingStrategy):
             confidence = 0.3
         
         # Strengthen signal if histogram is diverging
-        if histogram[-1] and histogram[-2]:
+        if not is_missing(histogram[-1]) and not is_missing(histogram[-2]):
             if histogram[-1] > histogram[-2] > 0:
                 if signal == Signal.BUY:
                     signal = Signal.STRONG_BUY
@@ -488,10 +690,12 @@ class MACDStrategy(TradingStrategy):
                     signal = Signal.STRONG_SELL
                     confidence = 0.85
         
-        entry_price = closes[-1]
-        atr = ti.atr(highs or closes, lows or closes, closes)
-        atr_val = atr[-1] if atr[-1] else None
-        stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
+        entry_price = float(closes[-1])
+        stop_loss = take_profit = None
+        if signal is not Signal.NEUTRAL:
+            # Stops only matter for an actionable signal
+            atr_val = self._latest_atr(closes, highs, lows)
+            stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val)
         
         return StrategySignal(
             symbol=symbol,
@@ -502,9 +706,9 @@ class MACDStrategy(TradingStrategy):
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "macd": round(macd_line[-1], 4),
-                "signal": round(signal_line[-1], 4),
-                "histogram": round(histogram[-1], 4) if histogram[-1] else None
+                "macd": float(macd_line[-1]),
+                "signal": float(signal_line[-1]),
+                "histogram": None if is_missing(histogram[-1]) else float(histogram[-1])
             }
         )
 
@@ -533,7 +737,7 @@ class TrendFollowing(TradingStrategy):
         lows: Optional[List[float]] = None,
         volumes: Optional[List[float]] = None
     ) -> StrategySignal:
-        ti = TechnicalIndicators
+        ti = self.indicators
         
         if highs is None:
             highs = closes
@@ -543,7 +747,7 @@ class TrendFollowing(TradingStrategy):
         adx, plus_di, minus_di = ti.adx(highs, lows, closes, self.parameters["adx_period"])
         ma = ti.sma(closes, self.parameters["ma_period"])
         
-        if adx[-1] is None or ma[-1] is None:
+        if is_missing(adx[-1]) or is_missing(ma[-1]):
             return StrategySignal(
                 symbol=symbol,
                 signal=Signal.NEUTRAL,
@@ -553,8 +757,8 @@ class TrendFollowing(TradingStrategy):
         
         current_price = closes[-1]
         adx_val = adx[-1]
-        plus_di_val = plus_di[-1] if plus_di[-1] else 0
-        minus_di_val = minus_di[-1] if minus_di[-1] else 0
+        plus_di_val = 0 if is_missing(plus_di[-1]) else plus_di[-1]
+        minus_di_val = 0 if is_missing(minus_di[-1]) else minus_di[-1]
         
         # Strong trend present
         if adx_val >= self.parameters["adx_threshold"]:
@@ -571,10 +775,11 @@ class TrendFollowing(TradingStrategy):
             signal = Signal.NEUTRAL
             confidence = 0.2
         
-        entry_price = closes[-1]
-        atr = ti.atr(highs, lows, closes)
-        atr_val = atr[-1] if atr[-1] else None
-        stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val, risk_reward_ratio=2.5)
+        entry_price = float(closes[-1])
+        stop_loss = take_profit = None
+        if signal is not Signal.NEUTRAL:
+            atr_val = self._latest_atr(closes, highs, lows)
+            stop_loss, take_profit = self.calculate_stops(entry_price, signal, atr_val, risk_reward_ratio=2.5)
         
         return StrategySignal(
             symbol=symbol,
@@ -585,21 +790,51 @@ class TrendFollowing(TradingStrategy):
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "adx": round(adx_val, 2),
-                "plus_di": round(plus_di_val, 2),
-                "minus_di": round(minus_di_val, 2),
-                "ma": round(ma[-1], 2),
+                "adx": adx_val,
+                "plus_di": plus_di_val,
+                "minus_di": minus_di_val,
+                "ma": float(ma[-1]),
                 "trend_strength": "strong" if adx_val >= 40 else "moderate" if adx_val >= 25 else "weak"
             }
         )
 
 
+def _generate_signals_for(
+    engine: "StrategyEngine",
+    symbol: str,
+    closes: List[float],
+    highs: Optional[List[float]],
+    lows: Optional[List[float]],
+    volumes: Optional[List[float]]
+) -> List[StrategySignal]:
+    """Worker-process entry point for StrategyEngine.generate_signals_batch"""
+    return engine.generate_signals(symbol, closes, highs, lows, volumes)
+
+
 class StrategyEngine:
     """Engine for running multiple strategies and combining signals"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.strategies: List[TradingStrategy] = []
         self.strategy_weights: Dict[str, float] = {}
+        self.indicator_memo = IndicatorMemo()
+        # Strategies run on a thread pool of this size when it is above 1.
+        # Sequential is the default: for short histories the per-task
+        # overhead outweighs the GIL-free indicator kernels.
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def __getstate__(self) -> Dict:
+        # The thread pool can't be pickled (e.g. into a worker process)
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+    
+    def close(self):
+        """Shut down the strategy thread pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
     
     def add_strategy(self, strategy: TradingStrategy, weight: float = 1.0):
         """Add a strategy to the engine"""
@@ -608,8 +843,12 @@ class StrategyEngine:
     
     def remove_strategy(self, strategy_name: str):
         """Remove a strategy"""
+        removed = [s for s in self.strategies if s.name == strategy_name]
         self.strategies = [s for s in self.strategies if s.name != strategy_name]
         self.strategy_weights.pop(strategy_name, None)
+        for strategy in removed:
+            if strategy.indicators is self.indicator_memo:
+                strategy.indicators = TechnicalIndicators
     
     def generate_signals(
         self,
@@ -622,12 +861,114 @@ class StrategyEngine:
         """Generate signals from all strategies"""
         signals = []
         
-        for strategy in self.strategies:
-            signal = strategy.generate_signal(symbol, closes, highs, lows, volumes)
-            signals.append(signal)
+        # Convert once so every strategy and indicator shares the same arrays
+        closes, highs, lows, volumes = (
+            _ensure_np(closes), _ensure_np(highs), _ensure_np(lows), _ensure_np(volumes)
+        )
+        
+        # Indicators are shared between strategies only within this call: the
+        # memo is installed for its duration, so direct generate_signal calls
+        # never see its identity-keyed entries
+        memo = self.indicator_memo
+        memo.clear()
+        strategies = list(self.strategies)
+        providers = [strategy.indicators for strategy in strategies]
+        for strategy in strategies:
+            strategy.indicators = memo
+        try:
+            if self.max_workers and self.max_workers > 1 and len(self.strategies) > 1:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                futures = [
+                    self._pool.submit(strategy.generate_signal, symbol, closes, highs, lows, volumes)
+                    for strategy in strategies
+                ]
+                signals = [future.result() for future in futures]
+            else:
+                for strategy in strategies:
+                    signal = strategy.generate_signal(symbol, closes, highs, lows, volumes)
+                    signals.append(signal)
+        finally:
+            for strategy, provider in zip(strategies, providers):
+                strategy.indicators = provider
+            memo.clear()
         
         return signals
     
+    def backfill_signals(
+        self,
+        symbol: str,
+        closes: List[float],
+        highs: Optional[List[float]] = None,
+        lows: Optional[List[float]] = None,
+        volumes: Optional[List[float]] = None
+    ) -> List[StrategySignal]:
+        """Start streaming `symbol` in every strategy (see TradingStrategy.backfill)"""
+        closes, highs, lows, volumes = (
+            _ensure_np(closes), _ensure_np(highs), _ensure_np(lows), _ensure_np(volumes)
+        )
+        return [
+            strategy.backfill(symbol, closes, highs, lows, volumes)
+            for strategy in self.strategies
+        ]
+    
+    def update_signals(
+        self,
+        symbol: str,
+        close: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        volume: Optional[float] = None
+    ) -> List[StrategySignal]:
+        """Add one bar for `symbol` to every strategy (see TradingStrategy.update)"""
+        return [
+            strategy.update(symbol, close, high, low, volume)
+            for strategy in self.strategies
+        ]
+    
+    def generate_signals_batch(
+        self,
+        closes_by_symbol: Dict[str, List[float]],
+        highs_by_symbol: Optional[Dict[str, List[float]]] = None,
+        lows_by_symbol: Optional[Dict[str, List[float]]] = None,
+        volumes_by_symbol: Optional[Dict[str, List[float]]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, List[StrategySignal]]:
+        """
+        Generate signals for many symbols across worker processes
+        
+        Each worker gets a pickled copy of the engine, so custom strategies
+        must be defined at module level to be importable there.
+        
+        Args:
+            closes_by_symbol: Closing prices keyed by symbol
+            highs_by_symbol: Optional high prices keyed by symbol
+            lows_by_symbol: Optional low prices keyed by symbol
+            volumes_by_symbol: Optional volumes keyed by symbol
+            max_workers: Number of worker processes (default: CPU count)
+        
+        Returns:
+            Signals from all strategies, keyed by symbol
+        """
+        symbols = list(closes_by_symbol)
+        
+        def column(by_symbol: Optional[Dict[str, List[float]]]) -> List[Optional[List[float]]]:
+            return [None if by_symbol is None else by_symbol.get(s) for s in symbols]
+        
+        # Spawn rather than fork: forking after Numba/BLAS threads have
+        # started can deadlock the workers
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as pool:
+            results = pool.map(
+                _generate_signals_for,
+                repeat(self, len(symbols)),
+                symbols,
+                column(closes_by_symbol),
+                column(highs_by_symbol),
+                column(lows_by_symbol),
+                column(volumes_by_symbol)
+            )
+            return dict(zip(symbols, results))
+    
     def get_consensus_signal(
         self,
         symbol: str,
@@ -659,29 +1000,22 @@ class StrategyEngine:
                 "signals": []
             }
         
-        # Convert to numeric for weighted voting
-        signal_values = {
-            Signal.STRONG_BUY: 2,
-            Signal.BUY: 1,
-            Signal.NEUTRAL: 0,
-            Signal.SELL: -1,
-            Signal.STRONG_SELL: -2
-        }
-        
         weighted_sum = 0
         total_weight = 0
+        confidence_sum = 0
         buy_count = 0
         sell_count = 0
         neutral_count = 0
         
         for sig in signals:
             weight = self.strategy_weights.get(sig.strategy_name, 1.0)
-            weighted_sum += signal_values[sig.signal] * weight * sig.confidence
+            weighted_sum += sig.signal.score * weight * sig.confidence
             total_weight += weight
+            confidence_sum += sig.confidence
             
-            if sig.signal in [Signal.BUY, Signal.STRONG_BUY]:
+            if sig.signal in _BUY_SET:
                 buy_count += 1
-            elif sig.signal in [Signal.SELL, Signal.STRONG_SELL]:
+            elif sig.signal in _SELL_SET:
                 sell_count += 1
             else:
                 neutral_count += 1
@@ -701,35 +1035,46 @@ class StrategyEngine:
             consensus = Signal.NEUTRAL
         
         # Calculate agreement ratio
-        if consensus in [Signal.BUY, Signal.STRONG_BUY]:
+        if consensus in _BUY_SET:
             agreement = buy_count / len(signals)
-        elif consensus in [Signal.SELL, Signal.STRONG_SELL]:
+        elif consensus in _SELL_SET:
             agreement = sell_count / len(signals)
         else:
             agreement = neutral_count / len(signals)
         
         # Average confidence
-        avg_confidence = sum(s.confidence for s in signals) / len(signals)
+        avg_confidence = confidence_sum / len(signals)
         
-        # Get stop loss and take profit from agreeing strategies
-        stop_losses = [s.stop_loss for s in signals if s.stop_loss and s.signal == consensus]
-        take_profits = [s.take_profit for s in signals if s.take_profit and s.signal == consensus]
+        # Second (and last) pass: stop loss and take profit from agreeing
+        # strategies, plus the per-strategy breakdown
+        stop_sum = take_sum = 0
+        stop_count = take_count = 0
+        individual_signals = []
+        for sig in signals:
+            if sig.signal == consensus:
+                if sig.stop_loss:
+                    stop_sum += sig.stop_loss
+                    stop_count += 1
+                if sig.take_profit:
+                    take_sum += sig.take_profit
+                    take_count += 1
+            individual_signals.append(sig.to_dict())
         
         return {
             "symbol": symbol,
             "consensus": consensus.value,
-            "confidence": round(avg_confidence * agreement, 2),
-            "score": round(avg_score, 2),
-            "agreement_ratio": round(agreement, 2),
+            "confidence": avg_confidence * agreement,
+            "score": avg_score,
+            "agreement_ratio": agreement,
             "meets_consensus_threshold": agreement >= min_consensus,
             "signal_breakdown": {
                 "buy": buy_count,
                 "sell": sell_count,
                 "neutral": neutral_count
             },
-            "recommended_stop_loss": round(sum(stop_losses) / len(stop_losses), 2) if stop_losses else None,
-            "recommended_take_profit": round(sum(take_profits) / len(take_profits), 2) if take_profits else None,
-            "individual_signals": [s.to_dict() for s in signals]
+            "recommended_stop_loss": stop_sum / stop_count if stop_count else None,
+            "recommended_take_profit": take_sum / take_count if take_count else None,
+            "individual_signals": individual_signals
         }
 
 
@@ -738,9 +1083,13 @@ class OrderManager:
     
     def __init__(self):
         self.orders: Dict[str, Order] = {}
-        self.trades: List[Trade] = []
-        self.next_order_id = 1
-        self.next_trade_id = 1
+        self.trades: Dict[str, Trade] = {}
+        # Index of trades not yet closed, in fill order
+        self._open_trades: Dict[str, Trade] = {}
+        # Sequential ids ("ORD000001", ...) formatted by a pre-bound
+        # str.format as they are drawn
+        self._order_ids = map("ORD{:06d}".format, count(1))
+        self._trade_ids = map("TRD{:06d}".format, count(1))
     
     def create_order(
         self,
@@ -750,11 +1099,16 @@ class OrderManager:
         order_type: OrderType = OrderType.MARKET,
         price: Optional[float] = None,
         stop_loss: Optional[float] = None,
-        take_profit: Optional[float] = None
+        take_profit: Optional[float] = None,
+        timestamp: Optional[datetime] = None
     ) -> Order:
-        """Create a new order"""
-        order_id = f"ORD{self.next_order_id:06d}"
-        self.next_order_id += 1
+        """
+        Create a new order
+        
+        `timestamp` sets created_at, e.g. to the bar time when replaying
+        history; it defaults to the current time.
+        """
+        order_id = next(self._order_ids)
         
         order = Order(
             id=order_id,
@@ -764,7 +1118,8 @@ class OrderManager:
             quantity=quantity,
             price=price,
             stop_loss=stop_loss,
-            take_profit=take_profit
+            take_profit=take_profit,
+            created_at=timestamp or datetime.now()
         )
         
         self.orders[order_id] = order
@@ -774,32 +1129,39 @@ class OrderManager:
         self,
         order_id: str,
         fill_price: float,
-        fill_quantity: Optional[float] = None
+        fill_quantity: Optional[float] = None,
+        timestamp: Optional[datetime] = None
     ) -> Order:
-        """Fill an order"""
-        if order_id not in self.orders:
+        """
+        Fill an order
+        
+        `timestamp` is used as the fill time and the resulting trade's entry
+        time; it defaults to the current time.
+        """
+        order = self.orders.get(order_id)
+        if order is None:
             raise ValueError(f"Order {order_id} not found")
         
-        order = self.orders[order_id]
         fill_qty = fill_quantity or order.quantity
+        filled_at = timestamp or datetime.now()
         
         order.filled_quantity = fill_qty
         order.filled_price = fill_price
-        order.filled_at = datetime.now()
+        order.filled_at = filled_at
         order.status = OrderStatus.FILLED if fill_qty >= order.quantity else OrderStatus.PARTIALLY_FILLED
         
         # Create trade record
         trade = Trade(
-            id=f"TRD{self.next_trade_id:06d}",
+            id=next(self._trade_ids),
             symbol=order.symbol,
             side=order.side,
             entry_price=fill_price,
             exit_price=None,
             quantity=fill_qty,
-            entry_time=datetime.now()
+            entry_time=filled_at
         )
-        self.next_trade_id += 1
-        self.trades.append(trade)
+        self.trades[trade.id] = trade
+        self._open_trades[trade.id] = trade
         
         return order
     
@@ -818,20 +1180,27 @@ class OrderManager:
     
     def get_open_trades(self) -> List[Trade]:
         """Get all open trades"""
-        return [t for t in self.trades if not t.is_closed]
+        # Re-check is_closed in case a trade was closed directly via Trade.close
+        return [t for t in self._open_trades.values() if not t.is_closed]
     
-    def close_trade(self, trade_id: str, exit_price: float) -> Trade:
-        """Close a trade"""
-        trade = next((t for t in self.trades if t.id == trade_id), None)
+    def close_trade(
+        self,
+        trade_id: str,
+        exit_price: float,
+        timestamp: Optional[datetime] = None
+    ) -> Trade:
+        """Close a trade (at `timestamp`, default now)"""
+        trade = self.trades.get(trade_id)
         if not trade:
             raise ValueError(f"Trade {trade_id} not found")
         
-        trade.close(exit_price)
+        trade.close(exit_price, timestamp)
+        self._open_trades.pop(trade_id, None)
         return trade
     
     def get_trade_statistics(self) -> Dict:
         """Calculate trading statistics"""
-        closed_trades = [t for t in self.trades if t.is_closed]
+        closed_trades = [t for t in self.trades.values() if t.is_closed]
         
         if not closed_trades:
             return {
@@ -846,37 +1215,52 @@ class OrderManager:
                 "average_holding_days": 0
             }
         
-        winning = [t for t in closed_trades if t.pnl > 0]
-        losing = [t for t in closed_trades if t.pnl < 0]
+        # One pass to gather the columns, then masked reductions
+        n = len(closed_trades)
+        pnls = np.fromiter((t.pnl for t in closed_trades), dtype=np.float64, count=n)
+        days = np.fromiter((t.holding_period_days for t in closed_trades), dtype=np.int64, count=n)
+        win_pnls = pnls[pnls > 0]
+        loss_pnls = pnls[pnls < 0]
         
-        total_pnl = sum(t.pnl for t in closed_trades)
+        total_pnl = float(pnls.sum())
+        gross_loss = float(loss_pnls.sum())
         
         return {
-            "total_trades": len(closed_trades),
-            "winning_trades": len(winning),
-            "losing_trades": len(losing),
-            "win_rate": round(len(winning) / len(closed_trades) * 100, 2),
-            "total_pnl": round(total_pnl, 2),
-            "average_pnl": round(total_pnl / len(closed_trades), 2),
-            "largest_win": round(max(t.pnl for t in winning), 2) if winning else 0,
-            "largest_loss": round(min(t.pnl for t in losing), 2) if losing else 0,
-            "average_holding_days": round(
-                sum(t.holding_period_days for t in closed_trades) / len(closed_trades), 1
-            ),
-            "profit_factor": round(
-                sum(t.pnl for t in winning) / abs(sum(t.pnl for t in losing)), 2
-            ) if losing and sum(t.pnl for t in losing) != 0 else 0
+            "total_trades": n,
+            "winning_trades": int(win_pnls.size),
+            "losing_trades": int(loss_pnls.size),
+            "win_rate": win_pnls.size / n * 100,
+            "total_pnl": total_pnl,
+            "average_pnl": total_pnl / n,
+            "largest_win": float(win_pnls.max()) if win_pnls.size else 0,
+            "largest_loss": float(loss_pnls.min()) if loss_pnls.size else 0,
+            "average_holding_days": float(days.sum()) / n,
+            "profit_factor": float(win_pnls.sum()) / abs(gross_loss) if gross_loss != 0 else 0
         }
 
 
-def create_default_strategy_engine() -> StrategyEngine:
-    """Create engine with default strategies"""
-    engine = StrategyEngine()
+# (strategy class, constructor kwargs, weight) for the default engine
+DEFAULT_STRATEGIES: Tuple[Tuple[type, Dict, float], ...] = (
+    (MovingAverageCrossover, {"fast_period": 10, "slow_period": 20}, 1.0),
+    (RSIMeanReversion, {"rsi_period": 14, "oversold": 30, "overbought": 70}, 1.2),
+    (MACDStrategy, {}, 1.0),
+    (BollingerBandBreakout, {}, 0.8),
+    (TrendFollowing, {"adx_threshold": 25}, 1.1),
+)
+
+
+def create_default_strategy_engine(max_workers: Optional[int] = None) -> StrategyEngine:
+    """
+    Create engine with default strategies
+    
+    generate_signals holds no per-symbol state between calls, so a scanner
+    should create one engine and reuse it for every symbol (or use generate_signals_batch)
+    rather than calling this per symbol. Engines are not shared or cached
+    here: each one binds its strategies to its own indicator memo.
+    """
+    engine = StrategyEngine(max_workers=max_workers)
     
-    engine.add_strategy(MovingAverageCrossover(fast_period=10, slow_period=20), weight=1.0)
-    engine.add_strategy(RSIMeanReversion(rsi_period=14, oversold=30, overbought=70), weight=1.2)
-    engine.add_strategy(MACDStrategy(), weight=1.0)
-    engine.add_strategy(BollingerBandBreakout(), weight=0.8)
-    engine.add_strategy(TrendFollowing(adx_threshold=25), weight=1.1)
+    for strategy_cls, kwargs, weight in DEFAULT_STRATEGIES:
+        engine.add_strategy(strategy_cls(**kwargs), weight=weight)
     
     return engine
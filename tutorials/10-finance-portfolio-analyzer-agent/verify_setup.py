@@ -5,64 +5,90 @@ Setup Verification Script
 Run this script to verify your Finance Portfolio Analyzer installation.
 """
 
+import argparse
+import json
 import os
 import sys
-
-
-def main():
-    print("🔍 Verifying Finance Portfolio Analyzer Setup...\n")
+from importlib.util import find_spec
+
+
+def _make_exists():
+    """
+    os.path.exists stand-in that lists each directory once
+
+    Every check path is answered from one os.scandir() of its parent
+    instead of a stat() per path; listings are cached for the run.
+    """
+    listings = {}
+
+    def entries(directory):
+        if directory not in listings:
+            name = os.path.basename(directory)
+            if name not in ("", os.curdir, os.pardir) and not exists(directory):
+                # Missing from its parent's listing, so don't scan it
+                listings[directory] = set()
+            else:
+                try:
+                    with os.scandir(directory or os.curdir) as it:
+                        listings[directory] = {entry.name for entry in it}
+                except (FileNotFoundError, NotADirectoryError):
+                    listings[directory] = set()
+        return listings[directory]
+
+    def exists(path):
+        parent, name = os.path.split(os.path.normpath(path))
+        return name in entries(parent)
+
+    return exists
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify the Finance Portfolio Analyzer setup.")
+    parser.add_argument("--json", action="store_true",
+                        help="print the checks as a JSON object instead of a report")
+    parser.add_argument("--deps", action=argparse.BooleanOptionalAction, default=True,
+                        help="check installed packages and the API key (default: on)")
+    args = parser.parse_args(argv)
+
+    if not args.json:
+        print("🔍 Verifying Finance Portfolio Analyzer Setup...\n")
 
     # Check for .env in repository root (two levels up)
     repo_env = os.path.join("..", "..", ".env")
+    exists = _make_exists()
 
     checks = {
         "Python version >= 3.10": sys.version_info >= (3, 10),
-        "Repository .env file exists": os.path.exists(repo_env),
-        "agent.py exists": os.path.exists("src/agent.py"),
-        "agent_memory.py exists": os.path.exists("src/agent_memory.py"),
-        "main.py exists": os.path.exists("main.py"),
-        "portfolio skill exists": os.path.exists(".claude/skills/portfolio-analysis/SKILL.md"),
-        "excel skill exists": os.path.exists(".claude/skills/excel-reporting/SKILL.md"),
-        "benchmarks context exists": os.path.exists(".claude/skills/portfolio-analysis/context/benchmarks.md"),
-        "sample data exists": os.path.exists("data/sample_portfolio.csv"),
-        "MCP config exists": os.path.exists("mcp_config.json"),
-        "MCP server exists": os.path.exists("mcp-servers/stock-data/server.py"),
-        "tests exist": os.path.exists("tests/test_agent.py"),
+        "Repository .env file exists": exists(repo_env),
+        "agent.py exists": exists("src/agent.py"),
+        "agent_memory.py exists": exists("src/agent_memory.py"),
+        "main.py exists": exists("main.py"),
+        "portfolio skill exists": exists(".claude/skills/portfolio-analysis/SKILL.md"),
+        "excel skill exists": exists(".claude/skills/excel-reporting/SKILL.md"),
+        "benchmarks context exists": exists(".claude/skills/portfolio-analysis/context/benchmarks.md"),
+        "sample data exists": exists("data/sample_portfolio.csv"),
+        "MCP config exists": exists("mcp_config.json"),
+        "MCP server exists": exists("mcp-servers/stock-data/server.py"),
+        "tests exist": exists("tests/test_agent.py"),
     }
 
-    # Test dependencies
-    try:
-        from dotenv import load_dotenv
-        checks["python-dotenv installed"] = True
-        load_dotenv()
-        checks["API key set"] = bool(os.getenv("ANTHROPIC_API_KEY"))
-    except ImportError:
-        checks["python-dotenv installed"] = False
-        checks["API key set"] = False
-
-    try:
-        import anthropic
-        checks["anthropic installed"] = True
-    except ImportError:
-        checks["anthropic installed"] = False
-
-    try:
-        import pandas
-        checks["pandas installed"] = True
-    except ImportError:
-        checks["pandas installed"] = False
-
-    try:
-        import openpyxl
-        checks["openpyxl installed"] = True
-    except ImportError:
-        checks["openpyxl installed"] = False
-
-    try:
-        import pytest
-        checks["pytest installed"] = True
-    except ImportError:
-        checks["pytest installed"] = False
+    if args.deps:
+        # Test dependencies. find_spec only locates a package; it doesn't run
+        # its (often slow) import.
+        checks["python-dotenv installed"] = find_spec("dotenv") is not None
+        if checks["python-dotenv installed"]:
+            from dotenv import load_dotenv
+            load_dotenv()
+            checks["API key set"] = bool(os.getenv("ANTHROPIC_API_KEY"))
+        else:
+            checks["API key set"] = False
+
+        for package in ("anthropic", "pandas", "openpyxl", "pytest"):
+            checks[f"{package} installed"] = find_spec(package) is not None
+
+    if args.json:
+        print(json.dumps(checks, indent=2))
+        return 0 if all(checks.values()) else 1
 
     # Print results
     passed = 0
@@ -87,9 +113,9 @@ def main():
     else:
         print("\n⚠️  Some checks failed. Please fix the issues above.")
         print("\nCommon fixes:")
-        if not checks.get("python-dotenv installed"):
+        if checks.get("python-dotenv installed") is False:
             print("- Install dependencies: pip install -r requirements.txt")
-        if not checks.get("API key set"):
+        if checks.get("API key set") is False:
             print("- Add ANTHROPIC_API_KEY to repository root .env file (../../.env)")
         if not checks.get("Repository .env file exists"):
             print("- Create .env file in repository root with: ANTHROPIC_API_KEY=your_key_here")
@@ -21,34 +21,99 @@ Requirements:
     - pip install openai python-dotenv
 """
 
-import json
+from __future__ import annotations
+
+import functools
 import os
 import re
 import sys
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add project root to path for imports (once, even if this module is reloaded)
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from dotenv import load_dotenv
-from openai import OpenAI
 
-from src.agent import BaseAgent
-from src.tools import BaseTool, SubagentTool, ToolResult
+from src.tools import SubagentTool
+from src.utils import lazy_import
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Executed on first use, so paths that never build an agent (like --help)
+# don't load the OpenAI SDK
+openai = lazy_import("openai")
+src_agent = lazy_import("src.agent")
+
+
+@functools.cache
+def _client() -> OpenAI:
+    """OpenAI client for the demos, created on first use."""
+    # .env is loaded here rather than at import, so importing this module
+    # doesn't search the filesystem for it
+    load_dotenv()
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found. Set it in your environment or .env file.")
+    return openai.OpenAI()
+
+
+@functools.cache
+def _fixer_tool() -> SubagentTool:
+    """Code fixer agent for the chaining demo, built once and shared."""
+    fixer = src_agent.BaseAgent(
+        system_prompt="""You are a Code Fixer. Given code and review feedback,
+you produce corrected code that addresses all issues.""",
+        client=_client(),
+    )
+    return SubagentTool(
+        agent=fixer,
+        name="code_fixer",
+        description="Fix code based on review feedback",
+    )
+
+
+# Header of an orchestrator delegation: DELEGATE[tool_name]: <task>
+_DELEGATE_RE = re.compile(r'DELEGATE\[(\w+)\]:')
+
+# Longest specialist result passed back into the synthesis prompt
+MAX_RESULT_CHARS = 4000
 
-load_dotenv()
+# Last create_specialist_agents result and its client. Only one is kept:
+# the agents hold their client, so a per-client cache would never let go.
+_cached_specialists: Optional[Tuple[OpenAI, Dict[str, SubagentTool]]] = None
 
 
-def create_specialist_agents(client: OpenAI) -> Dict[str, SubagentTool]:
+def create_specialist_agents(client: OpenAI, cache: bool = False) -> Dict[str, SubagentTool]:
     """
     Create a set of specialist agents wrapped as tools.
     
+    With cache=True, repeated calls with the same client reuse the
+    specialists built by the last cached call, with their memory reset so
+    each caller starts fresh. The SubagentTools themselves are shared, so
+    that reset also wipes the conversation of any OrchestratorAgent an
+    earlier caller is still using; only cache when earlier callers are done
+    with their tools. The returned dict is a copy, so adding tools to it
+    doesn't touch the cache.
+    
     Returns:
         Dictionary mapping tool names to SubagentTools
     """
+    global _cached_specialists
+    if cache:
+        if _cached_specialists is not None and _cached_specialists[0] is client:
+            tools = _cached_specialists[1]
+            for tool in tools.values():
+                tool.reset()
+        else:
+            tools = create_specialist_agents(client, cache=False)
+            _cached_specialists = (client, tools)
+        return dict(tools)
     
     # Code Review Specialist
-    code_reviewer = BaseAgent(
+    code_reviewer = src_agent.BaseAgent(
         system_prompt="""You are a Code Review Specialist.
 
 Your expertise:
@@ -68,7 +133,7 @@ When reviewing code:
     )
     
     # Documentation Specialist
-    doc_writer = BaseAgent(
+    doc_writer = src_agent.BaseAgent(
         system_prompt="""You are a Documentation Specialist.
 
 Your expertise:
@@ -88,7 +153,7 @@ When documenting:
     )
     
     # Testing Specialist
-    test_writer = BaseAgent(
+    test_writer = src_agent.BaseAgent(
         system_prompt="""You are a Testing Specialist.
 
 Your expertise:
@@ -129,26 +194,17 @@ When creating tests:
     return tools
 
 
-class OrchestratorAgent:
+@functools.lru_cache(maxsize=32)
+def _orchestrator_prompt(tool_descriptions: Tuple[Tuple[str, str], ...]) -> str:
     """
-    An orchestrator that uses specialist subagents as tools.
+    Orchestrator system prompt for a set of (name, description) tools.
     
-    This demonstrates the "agent as tool" pattern where the orchestrator
-    can choose which specialist to invoke based on the task.
+    Cached so orchestrators over the same tools share one prompt string
+    rather than re-rendering it, and the prompt stays byte-identical across
+    instances for provider-side prompt caching.
     """
-    
-    def __init__(self, client: OpenAI, tools: Dict[str, SubagentTool]):
-        self.client = client
-        self.tools = tools
-        
-        # Build tool descriptions for the orchestrator
-        tool_list = "\n".join([
-            f"- {name}: {tool.description}"
-            for name, tool in tools.items()
-        ])
-        
-        self.agent = BaseAgent(
-            system_prompt=f"""You are a Development Team Orchestrator.
+    tool_list = "\n".join(f"- {name}: {description}" for name, description in tool_descriptions)
+    return f"""You are a Development Team Orchestrator.
 
 You have access to specialist agents that you can delegate tasks to:
 
@@ -165,17 +221,53 @@ Example delegation:
 DELEGATE[code_review]: Review this Python function for bugs
 DELEGATE[documentation]: Write a docstring for this function
 
-If no specialist is needed, respond directly.""",
+If no specialist is needed, respond directly."""
+
+
+class OrchestratorAgent:
+    """
+    An orchestrator that uses specialist subagents as tools.
+    
+    This demonstrates the "agent as tool" pattern where the orchestrator
+    can choose which specialist to invoke based on the task.
+    """
+    
+    def __init__(self, client: OpenAI, tools: Dict[str, SubagentTool]):
+        self.client = client
+        self.tools = tools
+        
+        self.agent = src_agent.BaseAgent(
+            system_prompt=_orchestrator_prompt(
+                tuple((name, tool.description) for name, tool in tools.items())
+            ),
             model="gpt-4o-mini",
             temperature=0.3,
             client=client,
         )
     
-    def _extract_delegations(self, response: str) -> List[tuple]:
-        """Extract delegation requests from response."""
-        pattern = r'DELEGATE\[(\w+)\]:\s*(.+?)(?=DELEGATE\[|$)'
-        matches = re.findall(pattern, response, re.DOTALL)
-        return [(tool.strip(), task.strip()) for tool, task in matches]
+    def _extract_delegations(self, response: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (tool_name, task) delegation requests from response.
+        
+        Each task runs from the end of its DELEGATE header to the start of
+        the next one (or the end of the response), found in one linear scan.
+        """
+        previous = None
+        for header in _DELEGATE_RE.finditer(response):
+            if previous is not None:
+                task = response[previous.end():header.start()].strip()
+                if task:
+                    yield previous.group(1), task
+            previous = header
+        if previous is not None:
+            task = response[previous.end():].strip()
+            if task:
+                yield previous.group(1), task
+    
+    def _run_tool(self, tool_name: str, tasks: List[str]) -> List[str]:
+        """Run `tasks` on one tool in order, returning each truncated result."""
+        tool = self.tools[tool_name]
+        return [tool.run(task).content[:MAX_RESULT_CHARS] for task in tasks]
     
     def process(self, user_request: str, verbose: bool = True) -> str:
         """
@@ -195,18 +287,12 @@ If no specialist is needed, respond directly.""",
         # Get orchestrator's initial analysis
         response = self.agent.complete(user_request)
         
-        # Check for delegations
-        delegations = self._extract_delegations(response)
-        
-        if not delegations:
-            # No delegation needed
-            if verbose:
-                print("✓ Handled directly (no delegation)")
-            return response
-        
-        # Execute delegations
-        results = {}
-        for tool_name, task in delegations:
+        # Execute delegations. Each is an independent, I/O-bound model call,
+        # so they run concurrently and take as long as the slowest one.
+        delegated = False
+        valid = []
+        for tool_name, task in self._extract_delegations(response):
+            delegated = True
             if tool_name not in self.tools:
                 if verbose:
                     print(f"⚠️  Unknown tool: {tool_name}")
@@ -215,23 +301,53 @@ If no specialist is needed, respond directly.""",
             if verbose:
                 print(f"\n🔧 Delegating to {tool_name}...")
                 print(f"   Task: {task[:60]}...")
-            
-            tool = self.tools[tool_name]
-            result = tool.run(task)
-            results[tool_name] = result.content
-            
+            valid.append((tool_name, task))
+        
+        if not delegated:
+            # No delegation needed
             if verbose:
-                print(f"   ✓ {tool_name} completed")
+                print("✓ Handled directly (no delegation)")
+            return response
+        
+        # One result per delegation, in delegation order, so two delegations
+        # to the same tool both reach the synthesis prompt
+        results = [""] * len(valid)
+        if valid:
+            # Delegations to the same tool share its agent and memory, so
+            # they run one after another on one worker; tools run concurrently
+            by_tool: Dict[str, List[int]] = {}
+            for index, (tool_name, _) in enumerate(valid):
+                by_tool.setdefault(tool_name, []).append(index)
+            with ThreadPoolExecutor(max_workers=len(by_tool)) as executor:
+                futures = {
+                    executor.submit(
+                        self._run_tool, tool_name, [valid[i][1] for i in indices]
+                    ): (tool_name, indices)
+                    for tool_name, indices in by_tool.items()
+                }
+                for future in as_completed(futures):
+                    tool_name, indices = futures[future]
+                    for index, content in zip(indices, future.result()):
+                        results[index] = content
+                    if verbose:
+                        print(f"   ✓ {tool_name} completed")
         
         # Synthesize results
         if verbose:
             print("\n🔄 Synthesizing results...")
         
+        # Plain markdown sections: code in the results stays readable instead
+        # of being JSON-escaped onto one line
+        specialist_results = "\n\n".join(
+            f"### {tool_name}\n{content}"
+            for (tool_name, _), content in zip(valid, results)
+        )
         synthesis_prompt = f"""
 Original request: {user_request}
 
 Specialist results:
-{json.dumps(results, indent=2)}
+
+{specialist_results}
 
 Please synthesize these results into a cohesive final response."""
         
@@ -250,7 +366,7 @@ def run_agent_as_tool_demo():
     print("This demo shows an orchestrator using specialist agents as tools.")
     print()
     
-    client = OpenAI()
+    client = _client()
     
     # Create specialist tools
     print("📦 Creating specialist agents...")
@@ -323,7 +439,7 @@ def run_interactive_demo():
     print("Type 'quit' to exit.")
     print()
     
-    client = OpenAI()
+    client = _client()
     tools = create_specialist_agents(client)
     orchestrator = OrchestratorAgent(client=client, tools=tools)
     
@@ -360,20 +476,12 @@ def demonstrate_tool_chaining():
     print("This shows chaining: Code Review → Fix → Test")
     print()
     
-    client = OpenAI()
+    client = _client()
     tools = create_specialist_agents(client)
     
     # Add a fixer agent
-    fixer = BaseAgent(
-        system_prompt="""You are a Code Fixer. Given code and review feedback,
-you produce corrected code that addresses all issues.""",
-        client=client,
-    )
-    fixer_tool = SubagentTool(
-        agent=fixer,
-        name="code_fixer",
-        description="Fix code based on review feedback",
-    )
+    fixer_tool = _fixer_tool()
+    fixer_tool.reset()  # shared agent: start from a clean conversation
     tools["code_fixer"] = fixer_tool
     
     # Buggy code
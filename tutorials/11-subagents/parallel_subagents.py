@@ -20,22 +20,69 @@ Requirements:
     - pip install openai python-dotenv
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import functools
 import os
 import sys
 import time
-from typing import List, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Coroutine, Dict, List, Optional, Tuple
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add project root to path for imports (once, even if this module is reloaded)
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from dotenv import load_dotenv
-from openai import OpenAI
 
-from src.agent import BaseAgent
 from src.tools import SubagentManager
+from src.utils import lazy_import
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+    from src.agent import BaseAgent
+
+# Executed on first use, so paths that never build an agent (like --help)
+# don't load the OpenAI SDK
+openai = lazy_import("openai")
+src_agent = lazy_import("src.agent")
 
-load_dotenv()
+
+@functools.cache
+def _client() -> OpenAI:
+    """OpenAI client for the demos, created on first use."""
+    # .env is loaded here rather than at import, so importing this module
+    # doesn't search the filesystem for it
+    load_dotenv()
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found. Set it in your environment or .env file.")
+    return openai.OpenAI()
+
+
+@contextlib.asynccontextmanager
+async def _async_client() -> AsyncIterator[AsyncOpenAI]:
+    """
+    AsyncOpenAI client for one event loop, closed when the block exits.
+    
+    Its pooled connections belong to the loop that opened them, and every
+    asyncio.run() starts a new loop, so it isn't cached per process.
+    """
+    _client()  # same API key check
+    async with openai.AsyncOpenAI() as client:
+        yield client
+
+
+@functools.cache
+def _synthesizer() -> BaseAgent:
+    """Research synthesizer agent, built once and shared by demo runs."""
+    return src_agent.BaseAgent(
+        system_prompt="""You are a Research Synthesizer. 
+Combine multiple research findings into a cohesive executive summary.
+Be concise and highlight key insights.""",
+        client=_client(),
+    )
 
 
 class ParallelSubagentExecutor:
@@ -48,65 +95,170 @@ class ParallelSubagentExecutor:
     3. Aggregate their results
     """
     
-    def __init__(self, client: OpenAI = None):
-        self.client = client or OpenAI()
-        self.manager = SubagentManager(client=self.client)
+    def __init__(
+        self,
+        client: OpenAI = None,
+        async_client: AsyncOpenAI = None,
+        max_concurrency: int = 8
+    ):
+        self.client = client or _client()
+        # Cap on in-flight requests in run_parallel; unbounded fan-out on
+        # large task lists just trades latency for rate-limit retries
+        self.max_concurrency = max_concurrency
+        # With an AsyncOpenAI client, parallel runs share its connection pool
+        # instead of blocking one worker thread per in-flight request. The
+        # client is tied to one event loop, so run them all on that loop.
+        self.manager = SubagentManager(client=self.client, async_client=async_client)
+        # Idle spawned subagents, reused across runs. Keyed by role and task
+        # since the task is baked into the subagent's system prompt; a list
+        # per key because each in-flight task needs a subagent (and memory)
+        # of its own, so duplicate tasks running at once get one each.
+        self._idle_subagents: Dict[Tuple[str, str], List[BaseAgent]] = {}
+        # Every subagent spawned, idle or in flight, for close()
+        self._spawned: List[BaseAgent] = []
+    
+    def _checkout(self, role: str, task: str) -> BaseAgent:
+        """Take an idle subagent for (role, task), spawning one if all are busy."""
+        idle = self._idle_subagents.setdefault((role, task), [])
+        if idle:
+            return idle.pop()
+        subagent = self.manager.spawn(role=role, task=task)
+        self._spawned.append(subagent)
+        return subagent
+    
+    def _checkin(self, role: str, task: str, subagent: BaseAgent) -> None:
+        """Return a subagent to the pool with a fresh context, as a new one would have."""
+        if subagent.memory:
+            subagent.memory.reset()
+        self._idle_subagents.setdefault((role, task), []).append(subagent)
+    
+    def _complete(self, role: str, task: str, prompt: str) -> str:
+        """Answer one prompt on a subagent checked out for the call."""
+        subagent = self._checkout(role, task)
+        try:
+            return subagent.complete(prompt)
+        finally:
+            self._checkin(role, task, subagent)
+    
+    async def _acomplete(self, role: str, task: str, prompt: str) -> str:
+        """Async _complete (falls back to a worker thread without AsyncOpenAI)."""
+        subagent = self._checkout(role, task)
+        try:
+            return await subagent.acomplete(prompt)
+        finally:
+            self._checkin(role, task, subagent)
+    
+    def close(self) -> None:
+        """Terminate every subagent spawned by this executor."""
+        # The manager only tracks the latest subagent per role, so walk the
+        # executor's own list rather than the manager
+        for subagent in self._spawned:
+            if subagent.memory:
+                subagent.memory.reset()
+        self._spawned.clear()
+        self._idle_subagents.clear()
+        self.manager.terminate_all()
     
     async def run_subagent_async(
         self,
         role: str,
         task: str,
-        prompt: str
+        prompt: str,
+        semaphore: Optional[asyncio.Semaphore] = None
     ) -> Tuple[str, str, float]:
         """
         Run a single subagent asynchronously.
         
+        Args:
+            semaphore: Optional limit on concurrent runs; the execution time
+                excludes the wait for it
+        
         Returns:
             Tuple of (role, result, execution_time)
         """
-        start = time.time()
-        
-        # Spawn the subagent
-        subagent = self.manager.spawn(
-            role=role,
-            task=task,
-        )
-        
-        # Run in thread pool to not block the event loop
-        # (OpenAI client is synchronous)
-        result = await asyncio.to_thread(subagent.complete, prompt)
-        
-        elapsed = time.time() - start
-        
-        # Cleanup this specific subagent
-        self.manager.terminate(role)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            start = time.perf_counter()
+            
+            # An idle subagent is reused; one is spawned if all are busy
+            result = await self._acomplete(role, task, prompt)
+            
+            elapsed = time.perf_counter() - start
+        finally:
+            if semaphore is not None:
+                semaphore.release()
         
         return (role, result, elapsed)
     
     async def run_parallel(
         self,
-        tasks: List[dict]
+        tasks: List[dict],
+        max_concurrency: Optional[int] = None
     ) -> List[Tuple[str, str, float]]:
         """
         Run multiple subagent tasks in parallel.
         
         Args:
             tasks: List of dicts with keys: role, task, prompt
+            max_concurrency: Cap on tasks in flight at once (defaults to the
+                executor's max_concurrency)
             
         Returns:
             List of (role, result, time) tuples
         """
-        coroutines = [
-            self.run_subagent_async(
+        results = await asyncio.gather(*self._task_coroutines(tasks, max_concurrency))
+        return results
+    
+    async def run_parallel_streaming(
+        self,
+        tasks: List[dict],
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[Tuple[str, str, float]]:
+        """
+        Run subagent tasks in parallel, yielding each result as it finishes.
+        
+        Lets a caller start on early results (e.g. begin aggregating) while
+        slower subagents are still running. Tasks still running when the
+        caller stops iterating are cancelled.
+        
+        Args:
+            tasks: List of dicts with keys: role, task, prompt
+            max_concurrency: Cap on tasks in flight at once (defaults to the
+                executor's max_concurrency)
+        
+        Yields:
+            (role, result, time) tuples in completion order
+        """
+        running = [
+            asyncio.ensure_future(coroutine)
+            for coroutine in self._task_coroutines(tasks, max_concurrency)
+        ]
+        try:
+            for next_done in asyncio.as_completed(running):
+                yield await next_done
+        finally:
+            for task in running:
+                task.cancel()
+    
+    def _task_coroutines(
+        self,
+        tasks: List[dict],
+        max_concurrency: Optional[int]
+    ) -> List[Coroutine]:
+        """run_subagent_async coroutines for `tasks` sharing one semaphore."""
+        # Created per run: a semaphore belongs to the event loop it's used on
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        run_subagent_async = self.run_subagent_async
+        return [
+            run_subagent_async(
                 role=t["role"],
                 task=t["task"],
-                prompt=t["prompt"]
+                prompt=t["prompt"],
+                semaphore=semaphore
             )
             for t in tasks
         ]
-        
-        results = await asyncio.gather(*coroutines)
-        return results
     
     def run_sequential(
         self,
@@ -122,24 +274,31 @@ class ParallelSubagentExecutor:
             List of (role, result, time) tuples
         """
         results = []
+        # Bound once rather than looked up on every iteration
+        complete = self._complete
+        perf_counter = time.perf_counter
         
         for t in tasks:
-            start = time.time()
+            start = perf_counter()
             
-            subagent = self.manager.spawn(
-                role=t["role"],
-                task=t["task"],
-            )
-            
-            result = subagent.complete(t["prompt"])
-            elapsed = time.time() - start
+            result = complete(t["role"], t["task"], t["prompt"])
+            elapsed = perf_counter() - start
             
-            self.manager.terminate(t["role"])
             results.append((t["role"], result, elapsed))
         
         return results
 
 
+async def _run_parallel(client: OpenAI, tasks: List[dict]) -> List[Tuple[str, str, float]]:
+    """Run `tasks` on an executor whose AsyncOpenAI client lives in this loop."""
+    async with _async_client() as async_client:
+        executor = ParallelSubagentExecutor(client=client, async_client=async_client)
+        try:
+            return await executor.run_parallel(tasks)
+        finally:
+            executor.close()
+
+
 def create_research_tasks() -> List[dict]:
     """Create sample research tasks for parallel execution."""
     return [
@@ -171,15 +330,13 @@ def run_parallel_demo():
     print("Running 3 research subagents in parallel...")
     print()
     
-    client = OpenAI()
-    executor = ParallelSubagentExecutor(client=client)
-    
+    client = _client()
     tasks = create_research_tasks()
     
     # Run in parallel
-    total_start = time.time()
-    results = asyncio.run(executor.run_parallel(tasks))
-    total_time = time.time() - total_start
+    total_start = time.perf_counter()
+    results = asyncio.run(_run_parallel(client, tasks))
+    total_time = time.perf_counter() - total_start
     
     # Display results
     print("-" * 60)
@@ -196,12 +353,8 @@ def run_parallel_demo():
     # Aggregate results with a synthesizer agent
     print("\n🔄 Synthesizing results...")
     
-    synthesizer = BaseAgent(
-        system_prompt="""You are a Research Synthesizer. 
-Combine multiple research findings into a cohesive executive summary.
-Be concise and highlight key insights.""",
-        client=client,
-    )
+    synthesizer = _synthesizer()
+    synthesizer.memory.reset()  # shared agent: start from a clean conversation
     
     combined_research = "\n\n".join([
         f"## {role.replace('_', ' ').title()}\n{result}"
@@ -229,25 +382,25 @@ def run_comparison_demo():
     print("=" * 60)
     print()
     
-    client = OpenAI()
-    executor = ParallelSubagentExecutor(client=client)
-    
+    client = _client()
     tasks = create_research_tasks()
     
     # Sequential execution
     print("🔄 Running SEQUENTIAL execution...")
-    seq_start = time.time()
+    executor = ParallelSubagentExecutor(client=client)
+    seq_start = time.perf_counter()
     seq_results = executor.run_sequential(tasks)
-    seq_total = time.time() - seq_start
+    seq_total = time.perf_counter() - seq_start
+    executor.close()
     
     print(f"   Sequential total: {seq_total:.2f}s")
     print()
     
     # Parallel execution
     print("⚡ Running PARALLEL execution...")
-    par_start = time.time()
-    par_results = asyncio.run(executor.run_parallel(tasks))
-    par_total = time.time() - par_start
+    par_start = time.perf_counter()
+    par_results = asyncio.run(_run_parallel(client, tasks))
+    par_total = time.perf_counter() - par_start
     
     print(f"   Parallel total: {par_total:.2f}s")
     print()
@@ -282,57 +435,56 @@ async def run_with_progress():
     print("=" * 60)
     print()
     
-    client = OpenAI()
-    manager = SubagentManager(client=client)
-    
-    tasks = create_research_tasks()
-    completed = []
-    
-    async def run_with_callback(task: dict) -> Tuple[str, str]:
-        """Run a task and report when done."""
-        subagent = manager.spawn(
-            role=task["role"],
-            task=task["task"],
-        )
+    client = _client()
+    # Created inside this loop, which the client is tied to
+    async with _async_client() as async_client:
+        manager = SubagentManager(client=client, async_client=async_client)
         
-        result = await asyncio.to_thread(
-            subagent.complete, 
-            task["prompt"]
-        )
+        tasks = create_research_tasks()
+        completed = []
         
-        # Report completion
-        print(f"   ✓ {task['role']} completed")
-        completed.append(task["role"])
+        async def run_with_callback(task: dict) -> Tuple[str, str]:
+            """Run a task and report when done."""
+            subagent = manager.spawn(
+                role=task["role"],
+                task=task["task"],
+            )
+            
+            result = await subagent.acomplete(task["prompt"])
+            
+            # Report completion
+            print(f"   ✓ {task['role']} completed")
+            completed.append(task["role"])
+            
+            manager.terminate(task["role"])
+            return (task["role"], result)
         
-        manager.terminate(task["role"])
-        return (task["role"], result)
-    
-    print(f"Starting {len(tasks)} parallel tasks...")
-    print("-" * 40)
-    
-    start = time.time()
-    
-    # Create all tasks
-    coros = [run_with_callback(t) for t in tasks]
-    
-    # Run with as_completed for progress tracking
-    results = []
-    for coro in asyncio.as_completed(coros):
-        result = await coro
-        results.append(result)
-    
-    elapsed = time.time() - start
-    
-    print("-" * 40)
-    print(f"All {len(results)} tasks completed in {elapsed:.2f}s")
-    print()
-    
-    # Show results
-    for role, result in results:
-        print(f"\n📊 {role.replace('_', ' ').title()}:")
-        print(result[:200] + "..." if len(result) > 200 else result)
-    
-    manager.terminate_all()
+        print(f"Starting {len(tasks)} parallel tasks...")
+        print("-" * 40)
+        
+        start = time.perf_counter()
+        
+        # Create all tasks
+        coros = [run_with_callback(t) for t in tasks]
+        
+        # Run with as_completed for progress tracking
+        results = []
+        for coro in asyncio.as_completed(coros):
+            result = await coro
+            results.append(result)
+        
+        elapsed = time.perf_counter() - start
+        
+        print("-" * 40)
+        print(f"All {len(results)} tasks completed in {elapsed:.2f}s")
+        print()
+        
+        # Show results
+        for role, result in results:
+            print(f"\n📊 {role.replace('_', ' ').title()}:")
+            print(result[:200] + "..." if len(result) > 200 else result)
+        
+        manager.terminate_all()
 
 
 if __name__ == "__main__":
@@ -19,24 +19,63 @@ Usage:
 Requirements:
     - OPENAI_API_KEY environment variable set
     - pip install openai python-dotenv
+    - Optional: pip install h2 (HTTP/2 for concurrent subagent requests)
 """
 
+import asyncio
+import contextlib
+import functools
+import importlib.util
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add project root to path for imports (once, even if this module is reloaded)
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.agent import BaseAgent
 
 load_dotenv()
 
 
+@functools.cache
+def _client() -> OpenAI:
+    """OpenAI client for the demos, created on first use."""
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found. Set it in your environment or .env file.")
+    return OpenAI()
+
+
+@contextlib.asynccontextmanager
+async def _async_client() -> AsyncIterator[AsyncOpenAI]:
+    """
+    AsyncOpenAI client for one recursive demo run, closed when it ends.
+    
+    Every node of a decomposition tree shares it. Its connection pool is
+    sized for a whole level of sibling requests in flight at once, and it
+    speaks HTTP/2 when the optional h2 package is installed, so concurrent
+    requests are multiplexed over one TLS connection rather than each
+    opening its own.
+    
+    Pooled connections belong to the event loop that opened them, and every
+    asyncio.run() starts a new loop, so the client is created inside the
+    running loop and closed with it instead of being cached per process.
+    """
+    _client()  # same API key check
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    ) as http_client:
+        yield AsyncOpenAI(http_client=http_client)
+
+
 @dataclass
 class TaskNode:
     """Represents a task in the decomposition tree."""
@@ -65,6 +104,10 @@ class RecursiveAgent:
     2. If yes, subtasks are created and assigned to child agents
     3. Each child can further decompose if needed (up to max_depth)
     4. Results are aggregated back up the tree
+    
+    Sibling subtasks are independent, so their child agents run
+    concurrently; pass an AsyncOpenAI client to run them as native async
+    requests rather than on worker threads.
     """
     
     def __init__(
@@ -73,8 +116,10 @@ class RecursiveAgent:
         max_depth: int = 2,
         current_depth: int = 0,
         parent_context: str = "",
+        async_client: AsyncOpenAI = None,
     ):
         self.client = client or OpenAI()
+        self.async_client = async_client
         self.max_depth = max_depth
         self.current_depth = current_depth
         self.parent_context = parent_context
@@ -85,6 +130,7 @@ class RecursiveAgent:
             model="gpt-4o-mini",
             temperature=0.3,
             client=self.client,
+            async_client=async_client,
         )
     
     def _build_system_prompt(self) -> str:
@@ -134,6 +180,25 @@ Guidelines:
         """
         Recursively solve a task, spawning subagents as needed.
         
+        Synchronous entry point for asolve(); call asolve() directly from
+        code that is already running an event loop. Each call runs in a new
+        event loop, and an AsyncOpenAI client can't outlive the loop it
+        first ran on, so reuse an async_client across calls only via asolve()
+        on one loop.
+        
+        Args:
+            task: The task to solve
+            verbose: Whether to print progress
+            
+        Returns:
+            TaskNode representing the solution tree
+        """
+        return asyncio.run(self.asolve(task, verbose=verbose))
+    
+    async def asolve(self, task: str, verbose: bool = True) -> TaskNode:
+        """
+        Recursively solve a task, running sibling subagents concurrently.
+        
         Args:
             task: The task to solve
             verbose: Whether to print progress
@@ -165,7 +230,7 @@ Task: {task}
 You are at maximum depth and cannot delegate. 
 Complete this task directly with your best effort."""
         
-        analysis = self.agent.complete(analysis_prompt)
+        analysis = await self.agent.acomplete(analysis_prompt)
         
         # Check if we should decompose
         if self._should_decompose(task, analysis) and self.current_depth < self.max_depth:
@@ -174,17 +239,23 @@ Complete this task directly with your best effort."""
             if verbose:
                 print(f"{indent}   📦 Decomposing into {len(subtasks)} subtasks...")
             
-            # Spawn child agents for each subtask
-            for subtask_desc in subtasks:
-                child_agent = RecursiveAgent(
+            # Spawn a child agent per subtask. Siblings don't depend on each
+            # other, so they are solved concurrently; gather keeps their order.
+            children = [
+                RecursiveAgent(
                     client=self.client,
                     max_depth=self.max_depth,
                     current_depth=self.current_depth + 1,
                     parent_context=f"Parent task: {task}",
+                    async_client=self.async_client,
                 )
-                
-                child_node = child_agent.solve(subtask_desc, verbose=verbose)
-                node.subtasks.append(child_node)
+                for _ in subtasks
+            ]
+            child_nodes = await asyncio.gather(*[
+                child_agent.asolve(subtask_desc, verbose=verbose)
+                for child_agent, subtask_desc in zip(children, subtasks)
+            ])
+            node.subtasks.extend(child_nodes)
             
             # Aggregate results from children
             if verbose:
@@ -195,7 +266,7 @@ Complete this task directly with your best effort."""
                 for child in node.subtasks
             ])
             
-            synthesis = self.agent.complete(f"""
+            synthesis = await self.agent.acomplete(f"""
 Original task: {task}
 
 Child agent results:
@@ -215,12 +286,23 @@ Please synthesize these results into a cohesive response for the original task."
                 node.result = analysis
             else:
                 # If analysis had subtasks but we can't decompose, complete directly
-                direct = self.agent.complete(f"Complete this task directly: {task}")
+                direct = await self.agent.acomplete(f"Complete this task directly: {task}")
                 node.result = direct
         
         return node
 
 
+async def _solve_tree(task: str, max_depth: int) -> TaskNode:
+    """Solve `task` with a RecursiveAgent tree sharing one AsyncOpenAI client."""
+    async with _async_client() as async_client:
+        root_agent = RecursiveAgent(
+            client=_client(),
+            max_depth=max_depth,
+            async_client=async_client,
+        )
+        return await root_agent.asolve(task)
+
+
 def run_recursive_demo(max_depth: int = 2):
     """Demonstrate recursive subagent decomposition."""
     
@@ -230,14 +312,6 @@ def run_recursive_demo(max_depth: int = 2):
     print(f"Max recursion depth: {max_depth}")
     print()
     
-    client = OpenAI()
-    
-    # Create root agent
-    root_agent = RecursiveAgent(
-        client=client,
-        max_depth=max_depth,
-    )
-    
     # Complex task that benefits from decomposition
     complex_task = """
     Create a comprehensive guide for someone starting to learn programming:
@@ -254,7 +328,7 @@ def run_recursive_demo(max_depth: int = 2):
     print("-" * 60 + "\n")
     
     # Solve the task
-    result_tree = root_agent.solve(complex_task.strip())
+    result_tree = asyncio.run(_solve_tree(complex_task.strip(), max_depth))
     
     # Display the tree structure
     print("\n" + "=" * 60)
@@ -277,20 +351,13 @@ def run_simple_decomposition_demo():
     print("=" * 60)
     print()
     
-    client = OpenAI()
-    
-    # Depth 1 only - just one level of decomposition
-    agent = RecursiveAgent(
-        client=client,
-        max_depth=1,
-    )
-    
     task = "Research the pros and cons of Python vs JavaScript for web development"
     
     print(f"📝 Task: {task}")
     print("-" * 60 + "\n")
     
-    result = agent.solve(task)
+    # Depth 1 only - just one level of decomposition
+    result = asyncio.run(_solve_tree(task, max_depth=1))
     
     print("\n" + "=" * 60)
     print("Result Tree:")
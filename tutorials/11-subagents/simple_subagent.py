@@ -18,11 +18,14 @@ Requirements:
     - pip install openai python-dotenv
 """
 
+import functools
 import os
 import sys
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add project root to path for imports (once, even if this module is reloaded)
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -33,6 +36,14 @@ from src.tools import SubagentManager
 load_dotenv()
 
 
+@functools.cache
+def _client() -> OpenAI:
+    """OpenAI client for the demos, created on first use."""
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found. Set it in your environment or .env file.")
+    return OpenAI()
+
+
 def create_manager_agent(client: OpenAI) -> BaseAgent:
     """Create the orchestrator/manager agent."""
     return BaseAgent(
@@ -65,7 +76,7 @@ def run_simple_subagent_demo():
     print()
     
     # Initialize shared client (more efficient than separate clients)
-    client = OpenAI()
+    client = _client()
     
     # Create the subagent manager
     manager = SubagentManager(client=client)
@@ -195,7 +206,7 @@ def run_interactive_demo():
     print("Type 'quit' to exit.")
     print()
     
-    client = OpenAI()
+    client = _client()
     manager = SubagentManager(client=client)
     
     # Spawn subagents